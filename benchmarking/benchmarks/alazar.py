@@ -0,0 +1,85 @@
+"""
+This module contains code used for benchmarking the processing of the
+buffers of an Alazar acquisition using the simulated ATS API, i.e. without
+the time spent waiting for the card.
+"""
+import time
+from typing import Any, ClassVar
+
+from qcodes.instrument.mockers.simulated_ats_api import SimulatedATS9360API
+from qcodes.instrument_drivers.AlazarTech.ATS9360 import AlazarTech_ATS9360
+from qcodes.instrument_drivers.AlazarTech.ATS_acquisition_controllers import (
+    DemodulatingAveragingController,
+)
+
+
+def _noop_generator(buffer):
+    pass
+
+
+class Demodulation:
+    """
+    This benchmark measures how many samples per second can be demodulated
+    at two frequencies. An ATS9360 acquires 1.8e9 samples per second on a
+    single channel, 1 GS/s on each of two.
+    """
+
+    number = 1
+    repeat = 5
+    params: ClassVar[list[dict[str, Any]]] = [
+        {"average_records": True, "processing_workers": None},
+        {"average_records": False, "processing_workers": None},
+        {"average_records": False, "processing_workers": 4},
+    ]
+    timer = time.perf_counter
+
+    samples_per_record = 4096
+    records_per_buffer = 128
+    buffers_per_acquisition = 64
+
+    def setup(self, bench_param):
+        self.alazar = AlazarTech_ATS9360(
+            "alazar_benchmark",
+            api=SimulatedATS9360API(
+                dll_path="simulated", buffer_generator=_noop_generator
+            ),
+        )
+        with self.alazar.syncing():
+            self.alazar.sample_rate(1_000_000_000)
+        self.controller = DemodulatingAveragingController(
+            self.alazar,
+            [20e6, 50e6],
+            average_records=bench_param["average_records"],
+        )
+
+    def teardown(self, bench_param):
+        self.alazar.close()
+
+    def _acquire(self, processing_workers):
+        self.alazar.acquire(
+            mode="NPT",
+            samples_per_record=self.samples_per_record,
+            records_per_buffer=self.records_per_buffer,
+            buffers_per_acquisition=self.buffers_per_acquisition,
+            channel_selection="AB",
+            allocated_buffers=8,
+            acquisition_controller=self.controller,
+            processing_workers=processing_workers,
+        )
+
+    def time_acquire(self, bench_param):
+        self._acquire(bench_param["processing_workers"])
+
+    def track_samples_per_second(self, bench_param):
+        t_start = time.perf_counter()
+        self._acquire(bench_param["processing_workers"])
+        duration = time.perf_counter() - t_start
+        n_samples = (
+            2
+            * self.samples_per_record
+            * self.records_per_buffer
+            * self.buffers_per_acquisition
+        )
+        return n_samples / duration
+
+    track_samples_per_second.unit = "samples/s"
@@ -0,0 +1,82 @@
+"""
+This module contains code used for benchmarking the packing of waveforms
+into the binary files uploaded to Tektronix AWGs and the parsing of
+such files.
+"""
+
+from typing import ClassVar
+
+import numpy as np
+
+from qcodes.instrument_drivers.tektronix.AWG5014 import TektronixAWG5014
+from qcodes.instrument_drivers.tektronix.AWG70000A import AWG70000A
+from qcodes.instrument_drivers.tektronix.AWGFileParser import _unpacker
+
+
+class WFMXFile:
+    """
+    This benchmark measures the time taken to make a WFMX file of a
+    waveform with two markers.
+    """
+
+    params: ClassVar[list[int]] = [10_000, 10_000_000]
+    param_names: ClassVar[list[str]] = ["samples"]
+
+    def setup(self, samples):
+        rng = np.random.default_rng(0)
+        self.data = np.array(
+            [
+                rng.uniform(-0.25, 0.25, samples),
+                rng.integers(0, 2, samples),
+                rng.integers(0, 2, samples),
+            ]
+        )
+
+    def time_make_wfmx_file(self, samples):
+        AWG70000A.makeWFMXFile(self.data, 0.5)
+
+
+class AWG5014File:
+    """
+    This benchmark measures the time taken to pack a waveform and its
+    markers for an AWG5014, to make an .awg file of it and to unpack it
+    again.
+    """
+
+    params: ClassVar[list[int]] = [10_000, 10_000_000]
+    param_names: ClassVar[list[str]] = ["samples"]
+
+    def setup(self, samples):
+        self.awg = TektronixAWG5014(
+            "awg_benchmark",
+            address="GPIB0::1::INSTR",
+            terminator="\n",
+            pyvisa_sim_file="Tektronix_AWG5014C.yaml",
+        )
+        rng = np.random.default_rng(0)
+        self.wfm = rng.uniform(-1, 1, samples)
+        self.m1 = rng.integers(0, 2, samples)
+        self.m2 = rng.integers(0, 2, samples)
+        self.packed = self.awg._pack_waveform(self.wfm, self.m1, self.m2)
+
+    def teardown(self, samples):
+        self.awg.close()
+
+    def time_pack_waveform(self, samples):
+        self.awg._pack_waveform(self.wfm, self.m1, self.m2)
+
+    def time_make_awg_file(self, samples):
+        self.awg.make_awg_file(
+            [self.wfm],
+            [self.m1],
+            [self.m2],
+            [1],
+            [0],
+            [0],
+            [0],
+            channels=[1],
+            preservechannelsettings=False,
+        )
+
+    def time_unpack_waveform(self, samples):
+        _unpacker(self.packed)
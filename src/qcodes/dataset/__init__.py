@@ -22,7 +22,14 @@ from .dond.do_1d import do1d
 from .dond.do_2d import do2d
 from .dond.do_nd import dond
 from .dond.do_nd_utils import BreakConditionInterrupt
-from .dond.sweeps import AbstractSweep, ArraySweep, LinSweep, LogSweep, TogetherSweep
+from .dond.sweeps import (
+    AbstractSweep,
+    ArraySweep,
+    BufferedSweep,
+    LinSweep,
+    LogSweep,
+    TogetherSweep,
+)
 from .experiment_container import (
     experiments,
     load_experiment,
@@ -52,18 +59,24 @@ from .sqlite.database import (
 )
 from .sqlite.settings import SQLiteSettings
 from .threading import (
+    AsyncParamsCaller,
+    InstrumentIOExecutor,
     SequentialParamsCaller,
     ThreadPoolParamsCaller,
     call_params_threaded,
+    get_instrument_io_executor,
 )
 
 __all__ = [
     "AbstractSweep",
     "ArraySweep",
+    "AsyncParamsCaller",
     "BreakConditionInterrupt",
+    "BufferedSweep",
     "ConnectionPlus",
     "DataSetProtocol",
     "DataSetType",
+    "InstrumentIOExecutor",
     "InterDependencies_",
     "LinSweep",
     "LogSweep",
@@ -89,6 +102,7 @@ __all__ = [
     "get_data_export_path",
     "get_default_experiment_id",
     "get_guids_by_run_spec",
+    "get_instrument_io_executor",
     "guids_from_dbs",
     "guids_from_dir",
     "guids_from_list_str",
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import concurrent.futures
 import itertools
 import logging
+import threading
 import time
+from collections import deque
 from collections.abc import Mapping, Sequence
 from contextlib import ExitStack
 from dataclasses import dataclass
@@ -25,17 +28,20 @@ from qcodes.dataset.dond.do_nd_utils import (
 )
 from qcodes.dataset.measurements import Measurement
 from qcodes.dataset.threading import (
+    AsyncParamsCaller,
     SequentialParamsCaller,
     ThreadPoolParamsCaller,
     process_params_meas,
 )
 from qcodes.parameters import ParameterBase
 
-from .sweeps import AbstractSweep, TogetherSweep
+from .sweeps import AbstractSweep, BufferedSweep, TogetherSweep
 
 LOG = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
     from qcodes.dataset.descriptions.versioning.rundescribertypes import Shapes
     from qcodes.dataset.dond.do_nd_utils import (
         ActionsT,
@@ -45,6 +51,7 @@ if TYPE_CHECKING:
         ParamMeasT,
     )
     from qcodes.dataset.experiment_container import Experiment
+    from qcodes.dataset.measurements import DataSaver
 
 SweepVarType = Any
 
@@ -74,19 +81,49 @@ class _Sweeper:
     ):
         self._additional_setpoints = additional_setpoints
         self._sweeps = sweeps
+        self._buffered_sweep = self._get_buffered_sweep(sweeps)
+        # the sweeps that are stepped point by point. A buffered sweep
+        # is performed in one go by the instrument for each of these points.
+        self._stepped_sweeps = (
+            tuple(sweeps[:-1]) if self._buffered_sweep is not None else tuple(sweeps)
+        )
         self._setpoints = self._make_setpoints_tuples()
         self._setpoints_dict = self._make_setpoints_dict()
         self._shape = self._make_shape(sweeps, additional_setpoints)
+        self._planned_delay = self._make_planned_delay()
         self._iter_index = 0
 
     @property
     def setpoints_dict(self) -> dict[str, list[Any]]:
         return self._setpoints_dict
 
+    @staticmethod
+    def _get_buffered_sweep(
+        sweeps: Sequence[AbstractSweep | TogetherSweep],
+    ) -> BufferedSweep | None:
+        for sweep in sweeps[:-1]:
+            if isinstance(sweep, BufferedSweep):
+                raise ValueError(
+                    f"A BufferedSweep must be the last (fastest) sweep. "
+                    f"Got a BufferedSweep of {sweep.param} followed by "
+                    f"other sweeps."
+                )
+        if len(sweeps) > 0 and isinstance(sweeps[-1], BufferedSweep):
+            return sweeps[-1]
+        return None
+
+    @property
+    def buffered_sweep(self) -> BufferedSweep | None:
+        """
+        The last sweep if that is a :class:`BufferedSweep`. This sweep is
+        not part of the set events produced when iterating the sweeper.
+        """
+        return self._buffered_sweep
+
     def _make_setpoints_tuples(
         self,
     ) -> tuple[tuple[tuple[SweepVarType, ...] | SweepVarType, ...], ...]:
-        sweeps = tuple(sweep.get_setpoints() for sweep in self._sweeps)
+        sweeps = tuple(sweep.get_setpoints() for sweep in self._stepped_sweeps)
         return cast(
             tuple[tuple[Union[tuple[SweepVarType, ...], SweepVarType], ...], ...],
             tuple(itertools.product(*sweeps)),
@@ -95,7 +132,7 @@ class _Sweeper:
     def _make_single_point_setpoints_dict(self, index: int) -> dict[str, SweepVarType]:
         setpoint_dict = {}
         values = self._setpoints[index]
-        for sweep, subvalues in zip(self._sweeps, values):
+        for sweep, subvalues in zip(self._stepped_sweeps, values):
             if isinstance(sweep, TogetherSweep):
                 for individual_sweep, value in zip(sweep.sweeps, subvalues):
                     setpoint_dict[individual_sweep.param.full_name] = value
@@ -113,7 +150,9 @@ class _Sweeper:
             else:
                 setpoint_dict[sweep.param.full_name] = []
 
-        for setpoint_tuples in self._setpoints:
+        for setpoint_tuples in itertools.product(
+            *(sweep.get_setpoints() for sweep in self._sweeps)
+        ):
             for sweep, values in zip(self._sweeps, setpoint_tuples):
                 if isinstance(sweep, TogetherSweep):
                     for individual_sweep, individual_value in zip(sweep.sweeps, values):
@@ -216,26 +255,108 @@ class _Sweeper:
 
         parameter_set_events = []
 
-        for sweep in self.all_sweeps:
-            new_value = setpoints[sweep.param.full_name]
-            old_value = previous_setpoints[sweep.param.full_name]
-            if old_value is None or old_value != new_value:
-                should_set = True
-            else:
-                should_set = False
-            event = ParameterSetEvent(
-                new_value=new_value,
-                parameter=sweep.param,
-                should_set=should_set,
-                delay=sweep.delay,
-                actions=sweep.post_actions,
-                get_after_set=sweep.get_after_set,
-            )
-            parameter_set_events.append(event)
+        for sweep in self._stepped_sweeps:
+            sub_sweeps = sweep.sweeps if isinstance(sweep, TogetherSweep) else (sweep,)
+            group_events = []
+            for sub_sweep in sub_sweeps:
+                new_value = setpoints[sub_sweep.param.full_name]
+                old_value = previous_setpoints[sub_sweep.param.full_name]
+                if old_value is None or old_value != new_value:
+                    should_set = True
+                else:
+                    should_set = False
+                event = ParameterSetEvent(
+                    new_value=new_value,
+                    parameter=sub_sweep.param,
+                    should_set=should_set,
+                    delay=sub_sweep.delay,
+                    actions=sub_sweep.post_actions,
+                    get_after_set=sub_sweep.get_after_set,
+                )
+                group_events.append(event)
+            self._merge_group_delays(group_events)
+            parameter_set_events.extend(group_events)
         return tuple(parameter_set_events)
 
+    @staticmethod
+    def _merge_group_delays(group_events: Sequence[ParameterSetEvent]) -> None:
+        """
+        Parameters in a TogetherSweep are all set before anything is read,
+        so rather than sleeping after each of them we sleep once, for the
+        longest delay of the parameters that actually changed, after the
+        last one has been set.
+
+        If a changed parameter is read back after it has been set, the
+        delays are not merged, as the read back must happen after the
+        parameter has settled.
+        """
+        changed_events = [event for event in group_events if event.should_set]
+        if len(changed_events) < 2 or any(
+            event.get_after_set for event in changed_events
+        ):
+            return
+        merged_delay = max(event.delay for event in changed_events)
+        for event in changed_events:
+            event.delay = 0
+        changed_events[-1].delay = merged_delay
+
+    def _make_planned_delay(self) -> float:
+        total_delay = 0.0
+        n_outer_points = 1
+        for sweep in self._stepped_sweeps:
+            if sweep.num_points == 0:
+                continue
+            sub_sweeps = sweep.sweeps if isinstance(sweep, TogetherSweep) else (sweep,)
+            setpoints = [
+                np.asarray(sub_sweep.get_setpoints()) for sub_sweep in sub_sweeps
+            ]
+            delays = np.array(
+                [sub_sweep.delay for sub_sweep in sub_sweeps], dtype=float
+            )
+            # the delays of the changed parameters are merged into one,
+            # unless one of them is read back after it is set
+            merge_delays = not any(sub_sweep.get_after_set for sub_sweep in sub_sweeps)
+            combine = np.max if merge_delays else np.sum
+            # delay incurred when stepping from point i to point i + 1
+            changed = np.array([values[1:] != values[:-1] for values in setpoints])
+            step_delays = combine(
+                np.where(changed, delays[:, np.newaxis], 0.0), axis=0, initial=0.0
+            )
+            # delay incurred when an outer axis steps and this one starts over
+            wrap_delay = combine(
+                [
+                    delay
+                    for values, delay in zip(setpoints, delays)
+                    if values[0] != values[-1]
+                ],
+                initial=0.0,
+            )
+            total_delay += (
+                combine(delays)
+                + n_outer_points * step_delays.sum()
+                + (n_outer_points - 1) * wrap_delay
+            )
+            n_outer_points *= sweep.num_points
+        if self._buffered_sweep is not None:
+            # the delay of a buffered sweep is spent by the instrument
+            total_delay += (
+                n_outer_points
+                * self._buffered_sweep.num_points
+                * self._buffered_sweep.delay
+            )
+        return float(total_delay)
+
+    @property
+    def planned_delay(self) -> float:
+        """
+        Total time in seconds that will be spent sleeping after setting
+        sweep parameters over the full sweep. This is a lower bound on
+        the wall clock time of the measurement.
+        """
+        return self._planned_delay
+
     def __len__(self) -> int:
-        return int(np.prod(self.shape))
+        return int(np.prod([sweep.num_points for sweep in self._stepped_sweeps]))
 
     def __iter__(self) -> _Sweeper:
         return self
@@ -567,6 +688,92 @@ class _SweepMeasGroup:
         return self._parameters
 
 
+class _PipelinedResultAdder:
+    """
+    Context manager that adds the results of a dond to its datasavers on a
+    single background thread, such that unpacking, validating and enqueueing
+    the results of one point overlaps with setting and reading the next one.
+
+    Results are added in the order in which they are submitted, and at most
+    ``max_pending`` points are kept in flight before :meth:`submit` blocks.
+    Errors raised while adding a result are reraised from a later call to
+    :meth:`submit` or when exiting the context manager. Data is always
+    flushed to the database from the calling thread since a sqlite
+    connection can only be used from the thread that created it.
+    """
+
+    def __init__(
+        self,
+        datasavers: Sequence[DataSaver],
+        groups: Sequence[_SweepMeasGroup],
+        max_pending: int = 16,
+    ):
+        self._datasavers = tuple(datasavers)
+        self._groups = tuple(groups)
+        self._max_pending = max_pending
+        self._pending: deque[concurrent.futures.Future[None]] = deque()
+        self._lock = threading.Lock()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=self.__class__.__name__
+        )
+
+    def submit(
+        self,
+        results: dict[ParameterBase, Any],
+        additional_setpoints_data: Sequence[tuple[ParameterBase, Any]],
+    ) -> None:
+        while self._pending and (
+            self._pending[0].done() or len(self._pending) >= self._max_pending
+        ):
+            self._pending.popleft().result()
+
+        self._pending.append(
+            self._executor.submit(self._add_results, results, additional_setpoints_data)
+        )
+
+        with self._lock:
+            for datasaver in self._datasavers:
+                datasaver._flush_if_write_period_elapsed()
+
+    def _add_results(
+        self,
+        results: dict[ParameterBase, Any],
+        additional_setpoints_data: Sequence[tuple[ParameterBase, Any]],
+    ) -> None:
+        with self._lock:
+            for datasaver, group in zip(self._datasavers, self._groups):
+                filtered_results_list = [
+                    (param, value)
+                    for param, value in results.items()
+                    if param in group.parameters
+                ]
+                datasaver._enqueue_result(
+                    *filtered_results_list,
+                    *additional_setpoints_data,
+                )
+
+    def __enter__(self) -> _PipelinedResultAdder:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        try:
+            while self._pending:
+                future = self._pending.popleft()
+                if exc_type is None:
+                    future.result()
+                elif future.exception() is not None:
+                    LOG.warning(
+                        "Could not add result to dataset", exc_info=future.exception()
+                    )
+        finally:
+            self._executor.shutdown(wait=True)
+
+
 @TRACER.start_as_current_span("qcodes.dataset.dond")
 def dond(
     *params: AbstractSweep | TogetherSweep | ParamMeasT | Sequence[ParamMeasT],
@@ -583,6 +790,8 @@ def dond(
     break_condition: BreakConditionT | None = None,
     dataset_dependencies: Mapping[str, Sequence[ParamMeasT]] | None = None,
     in_memory_cache: bool | None = None,
+    pipeline_results: bool = False,
+    use_async: bool = False,
 ) -> AxesTupleListWithDataSet | MultiAxesTupleListWithDataSet:
     """
     Perform n-dimentional scan from slowest (first) to the fastest (last), to
@@ -616,6 +825,11 @@ def dond(
                               LinSweep(param_set_2, start_2, stop_2, num_points, delay_2))
                 param_meas_1, param_meas_2, ..., param_meas_m
 
+            The last sweep may be a :class:`.BufferedSweep` that is performed
+            by the instrument in hardware. In that case the measurement
+            parameters are read once per point of the other sweeps and must
+            return an array with a value for each point of the buffered sweep.
+
 
         write_period: The time after which the data is actually written to the
             database.
@@ -653,6 +867,16 @@ def dond(
             plotting and exporting. Useful to disable if the data is very large
             in order to save on memory consumption.
             If ``None``, the value for this will be read from ``qcodesrc.json`` config file.
+        pipeline_results: If True, the results of each point are validated and
+            added to the dataset(s) on a background thread while the sweep
+            parameters of the next point are being set. This hides the time
+            spent on bookkeeping for each point. Note that errors in a result,
+            e.g. data of the wrong shape, will then only be raised a few points
+            after they occurred.
+        use_async: If True, the measured parameters are gotten concurrently
+            with ``get_async`` on an event loop, using the long lived I/O
+            worker of each instrument rather than a new thread pool. This
+            takes precedence over ``use_threads``.
 
     Returns:
         A tuple of QCoDeS DataSet, Matplotlib axis, Matplotlib colorbar. If
@@ -692,6 +916,11 @@ def dond(
         "dond has been grouped into the following datasets:\n%s",
         measurements.groups,
     )
+    LOG.info(
+        "dond will perform %d points and spend %.3f s in sweep delays",
+        len(sweeper),
+        sweeper.planned_delay,
+    )
 
     datasets = []
     plots_axes = []
@@ -699,11 +928,15 @@ def dond(
     if use_threads is None:
         use_threads = config.dataset.use_threads
 
-    params_meas_caller = (
-        ThreadPoolParamsCaller(*measurements.measured_all)
-        if use_threads
-        else SequentialParamsCaller(*measurements.measured_all)
+    params_meas_caller: (
+        AsyncParamsCaller | ThreadPoolParamsCaller | SequentialParamsCaller
     )
+    if use_async:
+        params_meas_caller = AsyncParamsCaller(*measurements.measured_all)
+    elif use_threads:
+        params_meas_caller = ThreadPoolParamsCaller(*measurements.measured_all)
+    else:
+        params_meas_caller = SequentialParamsCaller(*measurements.measured_all)
 
     datasavers = []
     interrupted: Callable[  # noqa E731
@@ -717,7 +950,17 @@ def dond(
                 )
                 for group in measurements.groups
             ]
+            result_adder = (
+                stack.enter_context(
+                    _PipelinedResultAdder(datasavers, measurements.groups)
+                )
+                if pipeline_results
+                else None
+            )
             additional_setpoints_data = process_params_meas(additional_setpoints)
+            buffered_sweep = sweeper.buffered_sweep
+            if buffered_sweep is not None:
+                buffered_setpoints = buffered_sweep.get_setpoints()
             for set_events in tqdm(sweeper, disable=not show_progress):
                 LOG.debug("Processing set events: %s", set_events)
                 results: dict[ParameterBase, Any] = {}
@@ -733,20 +976,27 @@ def dond(
                     else:
                         results[set_event.parameter] = set_event.new_value
 
+                if buffered_sweep is not None:
+                    _run_buffered_sweep(buffered_sweep)
+                    results[buffered_sweep.param] = buffered_setpoints
+
                 meas_value_pair = call_params_meas()
                 for meas_param, value in meas_value_pair:
                     results[meas_param] = value
 
-                for datasaver, group in zip(datasavers, measurements.groups):
-                    filtered_results_list = [
-                        (param, value)
-                        for param, value in results.items()
-                        if param in group.parameters
-                    ]
-                    datasaver.add_result(
-                        *filtered_results_list,
-                        *additional_setpoints_data,
-                    )
+                if result_adder is not None:
+                    result_adder.submit(results, additional_setpoints_data)
+                else:
+                    for datasaver, group in zip(datasavers, measurements.groups):
+                        filtered_results_list = [
+                            (param, value)
+                            for param, value in results.items()
+                            if param in group.parameters
+                        ]
+                        datasaver.add_result(
+                            *filtered_results_list,
+                            *additional_setpoints_data,
+                        )
 
                 if callable(break_condition):
                     if break_condition():
@@ -766,6 +1016,13 @@ def dond(
         return tuple(datasets), tuple(plots_axes), tuple(plots_colorbar)
 
 
+def _run_buffered_sweep(sweep: BufferedSweep) -> None:
+    sweep.arm()
+    sweep.trigger()
+    for act in sweep.post_actions:
+        act()
+
+
 def _validate_dataset_dependencies_and_names(
     dataset_dependencies: Mapping[str, Sequence[ParamMeasT]] | None,
     measurement_name: str | Sequence[str],
@@ -244,6 +244,44 @@ class ArraySweep(AbstractSweep, Generic[T]):
         return self._get_after_set
 
 
+class BufferedSweep(AbstractSweep[T]):
+    """
+    Abstract class for sweeps that are performed by an instrument in
+    hardware, e.g. by stepping through a list of setpoints on a trigger
+    and storing the measured values in an internal buffer.
+
+    When a ``BufferedSweep`` is used as the last (fastest) sweep of a
+    :func:`dond` the sweep parameter is not set point by point. Instead,
+    for each point of the outer sweeps, the sweep is armed and triggered
+    once after which each measured parameter is read once. The measured
+    parameters are expected to return a 1D array with one value for each
+    setpoint of the sweep, and these are written to the dataset as a block.
+
+    Subclasses must implement :meth:`arm` and :meth:`trigger` in addition
+    to the methods of :class:`AbstractSweep`. The ``delay`` of a buffered
+    sweep is the time the instrument spends on each point of the sweep and
+    ``post_actions`` are performed after the sweep has been triggered.
+    """
+
+    @abstractmethod
+    def arm(self) -> None:
+        """
+        Prepare the instrument to perform the sweep over the setpoints
+        returned by :meth:`get_setpoints`, e.g. by clearing its buffer
+        and uploading the list of setpoints. This is called before
+        each run of the sweep.
+        """
+        pass
+
+    @abstractmethod
+    def trigger(self) -> None:
+        """
+        Start the sweep. This is expected to return once the sweep has
+        completed such that the measured parameters can be read.
+        """
+        pass
+
+
 class TogetherSweep:
     """
     A combination of Multiple sweeps that are to be performed in parallel
@@ -260,6 +298,11 @@ class TogetherSweep:
         len_0 = sweeps[0].num_points
 
         for sweep in sweeps:
+            if isinstance(sweep, BufferedSweep):
+                raise ValueError(
+                    f"A BufferedSweep cannot be part of a TogetherSweep. "
+                    f"Got a BufferedSweep of {sweep.param}."
+                )
             if sweep.num_points != len_0:
                 raise ValueError(
                     f"All Sweeps in a TogetherSweep must have the same length."
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any
 
 from opentelemetry import trace
 
-from qcodes.dataset.dond.do_nd import _Sweeper
+from qcodes.dataset.dond.do_nd import _run_buffered_sweep, _Sweeper
 from qcodes.dataset.dond.do_nd_utils import ParamMeasT, catch_interrupts
 from qcodes.dataset.dond.sweeps import AbstractSweep, LinSweep, TogetherSweep
 from qcodes.dataset.measurements import DataSaver, Measurement
@@ -174,6 +174,7 @@ def dond_into(
     with TRACER.start_as_current_span("qcodes.dataset.dond_into", context=context):
         sweep_instances, params_meas = parse_dond_into_args(*params)
         sweeper = _Sweeper(sweep_instances, additional_setpoints)
+        buffered_sweep = sweeper.buffered_sweep
         for set_events in sweeper:
             results: dict[ParameterBase, Any] = {}
             additional_setpoints_data = process_params_meas(additional_setpoints)
@@ -189,6 +190,10 @@ def dond_into(
                 else:
                     results[set_event.parameter] = set_event.new_value
 
+            if buffered_sweep is not None:
+                _run_buffered_sweep(buffered_sweep)
+                results[buffered_sweep.param] = buffered_sweep.get_setpoints()
+
             meas_value_pair = process_params_meas(params_meas)
             for meas_param, value in meas_value_pair:
                 results[meas_param] = value
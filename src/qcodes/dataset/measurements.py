@@ -156,6 +156,14 @@ class DataSaver:
                 its type.
         """
 
+        self._enqueue_result(*res_tuple)
+        self._flush_if_write_period_elapsed()
+
+    def _enqueue_result(self, *res_tuple: res_type) -> None:
+        """
+        Unpack, validate and enqueue a result without writing it to the
+        database. See :meth:`add_result` for the arguments.
+        """
         # we iterate through the input twice. First we find any array and
         # multiparameters that need to be unbundled and collect the names
         # of all parameters. This also allows users to call
@@ -221,6 +229,7 @@ class DataSaver:
 
         self.dataset._enqueue_results(results_dict)
 
+    def _flush_if_write_period_elapsed(self) -> None:
         if perf_counter() - self._last_save_time > self.write_period:
             self.flush_data_to_database()
             self._last_save_time = perf_counter()
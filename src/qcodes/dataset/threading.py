@@ -4,15 +4,19 @@ from __future__ import annotations
 # we want to happen simultaneously within one process (namely getting
 # several parameters in parallel), we can parallelize them with threads.
 # That way the things we call need not be rewritten explicitly async.
+import asyncio
 import concurrent
 import concurrent.futures
 import itertools
 import logging
+import queue
+import threading
 from collections import defaultdict
 from functools import partial
-from typing import TYPE_CHECKING, Callable, Protocol, TypeVar, Union
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Protocol, TypeVar, Union
 
-from qcodes.utils import RespondingThread
+from qcodes.utils import LatencyHistogram
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -21,6 +25,13 @@ if TYPE_CHECKING:
     from qcodes.dataset.data_set_protocol import values_type
     from qcodes.parameters import ParamDataType, ParameterBase
 
+    _WorkItem = tuple[
+        concurrent.futures.Future[Any],
+        Callable[..., Any],
+        tuple[Any, ...],
+        dict[str, Any],
+    ]
+
 ParamMeasT = Union["ParameterBase", Callable[[], None]]
 OutType = list[tuple["ParameterBase", "values_type"]]
 
@@ -62,34 +73,226 @@ def _instrument_to_param(
     return output
 
 
-def call_params_threaded(param_meas: Sequence[ParamMeasT]) -> OutType:
+class _InstrumentIOWorker:
+    """
+    A single daemon thread executing calls for one instrument from a queue
+    in the order in which they were submitted.
     """
-    Function to create threads per instrument for the given set of
-    measurement parameters.
+
+    def __init__(self, instrument_name: str | None, thread_name_prefix: str):
+        self.instrument_name = instrument_name
+        self.latency_histogram = LatencyHistogram()
+        self._queue: queue.SimpleQueue[_WorkItem | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"{thread_name_prefix}:{instrument_name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def submit(
+        self, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future[T]:
+        future: concurrent.futures.Future[T] = concurrent.futures.Future()
+        if threading.current_thread() is self._thread:
+            # a call made from within a call on this worker e.g. a parameter
+            # that gets another parameter of the same instrument. Queueing it
+            # would deadlock so it is executed right away.
+            self._execute((future, fn, args, kwargs))
+        else:
+            self._queue.put((future, fn, args, kwargs))
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._queue.put(None)
+        if wait and threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            work_item = self._queue.get()
+            if work_item is None:
+                break
+            self._execute(work_item)
+
+    def _execute(self, work_item: _WorkItem) -> None:
+        future, fn, args, kwargs = work_item
+        if not future.set_running_or_notify_cancel():
+            return
+        t_start = perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        finally:
+            self.latency_histogram.record(perf_counter() - t_start)
+
+
+class InstrumentIOExecutor:
+    """
+    Long lived executor that performs instrument I/O on one dedicated worker
+    thread per instrument. Calls for the same instrument are executed one at
+    a time in the order in which they were submitted, while calls for
+    different instruments run in parallel. Worker threads are created the
+    first time an instrument is used and are kept alive until the
+    instrument is closed or the executor is shut down, so no threads are
+    created per call.
+
+    Parameters are mapped to instruments using their
+    ``underlying_instrument``. Parameters without an instrument share a
+    single worker. The time spent executing each call is recorded in a
+    :class:`.LatencyHistogram` per instrument.
+
+    A process wide instance is returned by
+    :func:`get_instrument_io_executor`.
 
     Args:
-        param_meas: a Sequence of measurement parameters
+        thread_name_prefix: Prefix for the names of the worker threads.
+    """
+
+    def __init__(self, thread_name_prefix: str = "InstrumentIOExecutor"):
+        self._thread_name_prefix = thread_name_prefix
+        self._workers: dict[str | None, _InstrumentIOWorker] = {}
+        # reentrant since instruments may be garbage collected and closed,
+        # releasing their worker, while the lock is held
+        self._lock = threading.RLock()
+        self._is_shutdown = False
+
+    def _get_worker(self, instrument_name: str | None) -> _InstrumentIOWorker:
+        worker = self._workers.get(instrument_name)
+        if worker is not None:
+            return worker
+        with self._lock:
+            if self._is_shutdown:
+                raise RuntimeError("Cannot submit calls after shutdown.")
+            worker = self._workers.get(instrument_name)
+            if worker is None:
+                worker = _InstrumentIOWorker(instrument_name, self._thread_name_prefix)
+                self._workers[instrument_name] = worker
+        return worker
+
+    @staticmethod
+    def _instrument_name(parameter: ParameterBase) -> str | None:
+        instrument = parameter.underlying_instrument
+        return instrument.full_name if instrument is not None else None
+
+    def submit(
+        self,
+        instrument_name: str | None,
+        fn: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> concurrent.futures.Future[T]:
+        """
+        Schedule ``fn(*args, **kwargs)`` on the worker of the instrument
+        with the given full name and return a future for the result.
+        """
+        return self._get_worker(instrument_name).submit(fn, *args, **kwargs)
+
+    def submit_get(
+        self, parameter: ParameterBase
+    ) -> concurrent.futures.Future[ParamDataType]:
+        """
+        Schedule a get of the parameter on the worker of its instrument.
+        """
+        return self.submit(self._instrument_name(parameter), parameter.get)
+
+    def submit_set(
+        self, parameter: ParameterBase, value: ParamDataType
+    ) -> concurrent.futures.Future[None]:
+        """
+        Schedule a set of the parameter on the worker of its instrument.
+        """
+        return self.submit(self._instrument_name(parameter), parameter.set, value)
 
+    def call_params(self, param_meas: Sequence[ParamMeasT]) -> OutType:
+        """
+        Get the given parameters, in parallel across instruments, and return
+        `(param, value)` tuples. Callables that are not parameters are
+        ignored.
+        """
+        futures = [
+            self.submit(instrument_name, _ParamCaller(*param_list))
+            for instrument_name, param_list in _instrument_to_param(param_meas).items()
+        ]
+        return list(
+            itertools.chain.from_iterable(future.result() for future in futures)
+        )
+
+    def latency_histograms(self) -> dict[str | None, LatencyHistogram]:
+        """
+        Return the histograms of call latencies by instrument full name.
+        """
+        return {
+            name: worker.latency_histogram for name, worker in self._workers.items()
+        }
+
+    def release(self, instrument_name: str | None) -> None:
+        """
+        Stop the worker thread of the instrument with the given full name
+        after it has executed the calls already submitted, and drop the
+        worker and its latency histogram. A new worker is created if calls
+        for the instrument are submitted again. This is called when an
+        instrument is closed.
+        """
+        with self._lock:
+            worker = self._workers.pop(instrument_name, None)
+        if worker is not None:
+            worker.shutdown()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop all worker threads after they have executed the calls already
+        submitted. No new calls can be submitted after this.
+        """
+        with self._lock:
+            self._is_shutdown = True
+            workers = tuple(self._workers.values())
+        for worker in workers:
+            worker.shutdown(wait=wait)
+
+
+_instrument_io_executor: InstrumentIOExecutor | None = None
+_instrument_io_executor_lock = threading.RLock()
+
+
+def get_instrument_io_executor() -> InstrumentIOExecutor:
+    """
+    Return the process wide :class:`InstrumentIOExecutor`, creating it on
+    first use.
     """
+    global _instrument_io_executor
+    with _instrument_io_executor_lock:
+        if _instrument_io_executor is None:
+            _instrument_io_executor = InstrumentIOExecutor()
+        return _instrument_io_executor
 
-    inst_param_mapping = _instrument_to_param(param_meas)
-    executors = tuple(
-        _ParamCaller(*param_list) for param_list in inst_param_mapping.values()
-    )
 
-    output: OutType = []
-    threads = [RespondingThread(target=executor) for executor in executors]
+async def run_instrument_io(
+    instrument_name: str | None, fn: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """
+    Execute ``fn(*args, **kwargs)`` on the worker of the instrument with the
+    given full name in the process wide :class:`InstrumentIOExecutor` and
+    await the result without blocking the event loop.
+    """
+    future = get_instrument_io_executor().submit(instrument_name, fn, *args, **kwargs)
+    return await asyncio.wrap_future(future)
 
-    for t in threads:
-        t.start()
 
-    for t in threads:
-        thread_output = t.output()
-        assert thread_output is not None
-        for result in thread_output:
-            output.append(result)
+def call_params_threaded(param_meas: Sequence[ParamMeasT]) -> OutType:
+    """
+    Function to get the given set of measurement parameters in parallel
+    with one thread per instrument. The parameters are called on the
+    worker threads of the process wide :class:`InstrumentIOExecutor`.
+
+    Args:
+        param_meas: a Sequence of measurement parameters
 
-    return output
+    """
+    return get_instrument_io_executor().call_params(param_meas)
 
 
 def _call_params(param_meas: Sequence[ParamMeasT]) -> OutType:
@@ -222,3 +425,84 @@ class ThreadPoolParamsCaller(_ParamsCallerProtocol):
         exc_tb: TracebackType | None,
     ) -> None:
         self._thread_pool.__exit__(exc_type, exc_val, exc_tb)
+
+
+class AsyncParamsCaller(_ParamsCallerProtocol):
+    """
+    Context manager for getting the given parameters concurrently with
+    :meth:`.ParameterBase.get_async` on an event loop. The event loop runs
+    on a background thread for the lifetime of the context, so this can be
+    used from code that is itself running in an event loop such as a
+    Jupyter notebook. Parameters of the same instrument are gotten one at a
+    time, in order, while parameters of different instruments are gotten
+    concurrently. Callables that are not parameters are ignored.
+
+    Usage:
+
+        .. code-block:: python
+
+           ...
+           with AsyncParamsCaller(p1, p2, ...) as async_caller:
+               ...
+               output = async_caller()
+               ...
+               # Output can be passed directly into DataSaver.add_result:
+               # datasaver.add_result(*output)
+               ...
+           ...
+
+    Args:
+        param_meas: parameter or a callable without arguments
+    """
+
+    def __init__(self, *param_meas: ParamMeasT):
+        from qcodes.parameters import ParameterBase
+
+        self._parameters = tuple(
+            param for param in param_meas if isinstance(param, ParameterBase)
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+
+    async def _get_parameters(self) -> OutType:
+        values = await asyncio.gather(
+            *(param.get_async() for param in self._parameters)
+        )
+        return list(zip(self._parameters, values))
+
+    def __call__(self) -> OutType:
+        """
+        Get the parameters concurrently and return `(param, value)` tuples.
+        """
+        if self._loop is None:
+            raise RuntimeError(
+                "AsyncParamsCaller must be entered as a context manager "
+                "before it can be called."
+            )
+        return asyncio.run_coroutine_threadsafe(
+            self._get_parameters(), self._loop
+        ).result()
+
+    def __enter__(self) -> AsyncParamsCaller:
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            name=self.__class__.__name__,
+            daemon=True,
+        )
+        self._loop_thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._loop is None or self._loop_thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+        self._loop = None
+        self._loop_thread = None
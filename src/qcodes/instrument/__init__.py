@@ -15,19 +15,23 @@ from qcodes.parameters import (  # noqa: F401
     combine,
 )
 
+from .buffered_readout import BufferedReadout
 from .channel import ChannelList, ChannelTuple, InstrumentChannel, InstrumentModule
 from .instrument import Instrument, find_or_create_instrument
 from .instrument_base import InstrumentBase
+from .io_stats import InstrumentIOStats
 from .ip import IPInstrument
 from .visa import VisaInstrument
 
 __all__ = [
+    "BufferedReadout",
     "ChannelList",
     "ChannelTuple",
     "IPInstrument",
     "Instrument",
     "InstrumentBase",
     "InstrumentChannel",
+    "InstrumentIOStats",
     "InstrumentModule",
     "VisaInstrument",
     "find_or_create_instrument",
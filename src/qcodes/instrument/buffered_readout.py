@@ -0,0 +1,151 @@
+"""
+Readout of the data buffer of an instrument in chunks while the buffer is
+being filled, such that acquisition and readout overlap.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from contextlib import AbstractContextManager
+
+    import numpy.typing as npt
+
+
+class BufferedReadout:
+    """
+    Reads a fixed number of points from the data buffer of an instrument
+    into a preallocated array, fetching the points that are in the buffer in
+    chunks of at most ``chunk_size`` points. The fill level of the buffer is
+    polled while waiting for more points, so the points are read while the
+    instrument is still acquiring instead of in one large transfer once it
+    is done.
+
+    The readout is resumable: the points read so far are kept in
+    :attr:`data` and :attr:`n_read`, so if a fetch fails or :meth:`read`
+    times out, calling :meth:`read` again continues from the first point
+    that has not been read.
+
+    Args:
+        n_points: Number of points to read.
+        n_available: Function returning the number of points that are
+            currently in the buffer.
+        fetch: Function returning the points with indices from ``start``
+            (inclusive) to ``stop`` (exclusive), counted from 0, as an array
+            of ``stop - start`` points.
+        chunk_size: Maximal number of points fetched at once.
+        dtype: The dtype of :attr:`data`.
+        point_shape: The shape of a single point, e.g. ``(2,)`` if each point
+            consists of two values.
+        on_chunk: Optional function called with each chunk of points that
+            has been read and the index of its first point, e.g. to add the
+            points to a :class:`.DataSaver`.
+        transfer_context: Optional function returning a context manager
+            that is entered once around the fetches of :meth:`read` and
+            :meth:`read_available`, e.g. to switch the instrument to a
+            binary data format and restore the previous format afterwards.
+        poll_interval: Time in seconds between polls of the fill level of
+            the buffer while waiting for new points.
+        timeout: Time in seconds :meth:`read` waits for new points before
+            raising a :class:`TimeoutError`. None to wait forever.
+    """
+
+    def __init__(
+        self,
+        n_points: int,
+        n_available: Callable[[], int],
+        fetch: Callable[[int, int], npt.ArrayLike],
+        chunk_size: int,
+        *,
+        dtype: npt.DTypeLike = np.float64,
+        point_shape: tuple[int, ...] = (),
+        on_chunk: Callable[[np.ndarray, int], Any] | None = None,
+        transfer_context: Callable[[], AbstractContextManager[Any]] | None = None,
+        poll_interval: float = 0.05,
+        timeout: float | None = 10.0,
+    ):
+        if n_points < 0:
+            raise ValueError(f"Cannot read a negative number of points: {n_points}")
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be at least 1, got {chunk_size}")
+        self.n_points = n_points
+        self.chunk_size = chunk_size
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self._n_available = n_available
+        self._fetch = fetch
+        self._on_chunk = on_chunk
+        self._transfer_context = transfer_context or nullcontext
+        self.data: np.ndarray = np.empty((n_points, *point_shape), dtype=dtype)
+        """The points, of which the first :attr:`n_read` have been read."""
+        self.n_read = 0
+        """Number of points that have been read."""
+
+    @property
+    def done(self) -> bool:
+        """Whether all points have been read."""
+        return self.n_read >= self.n_points
+
+    def read_available(self) -> int:
+        """
+        Read the points that are currently in the buffer and have not been
+        read yet, without waiting for more points.
+
+        Returns:
+            The number of points read.
+        """
+        with self._transfer_context():
+            return self._read_available()
+
+    def _read_available(self) -> int:
+        stop = min(self._n_available(), self.n_points)
+        n_read_before = self.n_read
+        while self.n_read < stop:
+            start = self.n_read
+            chunk_stop = min(start + self.chunk_size, stop)
+            chunk = np.asarray(self._fetch(start, chunk_stop))
+            if len(chunk) != chunk_stop - start:
+                raise RuntimeError(
+                    f"Expected {chunk_stop - start} points from index {start} "
+                    f"of the buffer, got {len(chunk)}"
+                )
+            self.data[start:chunk_stop] = chunk
+            self.n_read = chunk_stop
+            if self._on_chunk is not None:
+                self._on_chunk(self.data[start:chunk_stop], start)
+        return self.n_read - n_read_before
+
+    def read(self) -> np.ndarray:
+        """
+        Read points as they arrive in the buffer until all points have been
+        read.
+
+        Returns:
+            :attr:`data`
+
+        Raises:
+            TimeoutError: If no new point arrives in the buffer within
+                :attr:`timeout` seconds.
+        """
+        last_progress = time.perf_counter()
+        with self._transfer_context():
+            while not self.done:
+                if self._read_available() > 0:
+                    last_progress = time.perf_counter()
+                    continue
+                if (
+                    self.timeout is not None
+                    and time.perf_counter() - last_progress > self.timeout
+                ):
+                    raise TimeoutError(
+                        f"Read {self.n_read} of {self.n_points} points, no new "
+                        f"points arrived in the buffer within {self.timeout} s"
+                    )
+                time.sleep(self.poll_interval)
+        return self.data
@@ -5,6 +5,8 @@ import sys
 from collections.abc import Callable, Iterable, Iterator, MutableSequence, Sequence
 from typing import TYPE_CHECKING, Any, TypeVar, Union, cast, overload
 
+import numpy as np
+
 from qcodes.metadatable import MetadatableWithName
 from qcodes.parameters import (
     ArrayParameter,
@@ -19,6 +21,8 @@ from qcodes.validators import Validator
 from .instrument_base import InstrumentBase
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
     from .instrument import Instrument
 
 
@@ -70,6 +74,79 @@ class InstrumentModule(InstrumentBase):
     def ask_raw(self, cmd: str) -> str:
         return self._parent.ask_raw(cmd)
 
+    async def write_async(self, cmd: str) -> None:
+        return await self._parent.write_async(cmd)
+
+    async def ask_async(self, cmd: str) -> str:
+        return await self._parent.ask_async(cmd)
+
+    def ask_binary(
+        self,
+        cmd: str,
+        dtype: npt.DTypeLike = np.float32,
+        is_big_endian: bool = False,
+    ) -> np.ndarray:
+        return self._parent.ask_binary(cmd, dtype, is_big_endian)
+
+    def ask_binary_raw(
+        self,
+        cmd: str,
+        dtype: npt.DTypeLike = np.float32,
+        is_big_endian: bool = False,
+    ) -> np.ndarray:
+        return self._parent.ask_binary_raw(cmd, dtype, is_big_endian)
+
+    @classmethod
+    def _bulk_get(
+        cls, channels: Sequence[InstrumentModule], param_name: str
+    ) -> Sequence[Any] | None:
+        """
+        Hook for drivers to get a parameter of many channels of this type
+        at once, e.g. with a single query to the instrument, when it is
+        gotten through a :class:`ChannelTuple`. Because the hook is looked
+        up on the channel type it applies to any slice or combination of
+        :class:`ChannelTuple` s of the channels.
+
+        Args:
+            channels: The channels to get the parameter of. All channels
+                have the same parent.
+            param_name: The name of the parameter to get.
+
+        Returns:
+            The value of the parameter of each channel, as it would be
+            returned by its ``get``, in the order of ``channels``. The
+            default implementation returns None, in which case the
+            parameter of each channel is gotten separately.
+        """
+        return None
+
+    @classmethod
+    def _bulk_set(
+        cls,
+        channels: Sequence[InstrumentModule],
+        param_name: str,
+        raw_values: Sequence[Any],
+    ) -> bool:
+        """
+        Hook for drivers to set a parameter of many channels of this type
+        to the same value at once when it is set through a
+        :class:`ChannelTuple`. See :meth:`_bulk_get`. The hook is not used
+        for parameters that are set in steps or with a delay.
+
+        Args:
+            channels: The channels to set the parameter of.
+            param_name: The name of the parameter to set.
+            raw_values: The validated value converted to the raw value of
+                the parameter of each channel, as it would be passed to its
+                ``set_raw``, in the order of ``channels``.
+
+        Returns:
+            True if the parameter of all channels was set. The default
+            implementation returns False, in which case the parameter of
+            each channel is set separately.
+        """
+        return False
+
     @property
     def parent(self) -> InstrumentBase:
         return self._parent
@@ -0,0 +1,137 @@
+"""
+Helpers for parsing IEEE 488.2 arbitrary binary blocks.
+
+An IEEE 488.2 definite length block is of the form ``#<n><length><data>``
+where ``n`` is a single digit giving the number of digits in ``length``,
+and ``length`` is the number of bytes in ``data``. An indefinite length
+block is of the form ``#0<data>`` and is ended by the message terminator.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+
+_STRUCT_FORMATS = {
+    "f": {2: "e", 4: "f", 8: "d"},
+    "i": {1: "b", 2: "h", 4: "i", 8: "q"},
+    "u": {1: "B", 2: "H", 4: "I", 8: "Q"},
+}
+
+
+def block_dtype(dtype: npt.DTypeLike, is_big_endian: bool = False) -> np.dtype:
+    """
+    Return the numpy dtype with the given byte order.
+
+    Args:
+        dtype: The dtype of the values in the block.
+        is_big_endian: Whether the values are sent most significant byte first.
+    """
+    return np.dtype(dtype).newbyteorder(">" if is_big_endian else "<")
+
+
+def struct_format(dtype: npt.DTypeLike) -> str:
+    """
+    Return the :mod:`struct` format character of a numpy dtype as used by
+    e.g. ``pyvisa`` to describe the values of a binary block.
+
+    Args:
+        dtype: A numpy integer or floating point dtype.
+
+    Raises:
+        ValueError: If the dtype cannot be represented by a struct format
+            character.
+    """
+    np_dtype = np.dtype(dtype)
+    try:
+        return _STRUCT_FORMATS[np_dtype.kind][np_dtype.itemsize]
+    except KeyError:
+        raise ValueError(
+            f"Cannot transfer values of dtype {np_dtype} as a binary block."
+        ) from None
+
+
+def parse_block_header(data: bytes | bytearray) -> tuple[int, int | None]:
+    """
+    Parse the header of an IEEE 488.2 binary block.
+
+    Any bytes before the ``#`` starting the header are ignored.
+
+    Args:
+        data: Bytes starting with (at least) the complete header of a block.
+
+    Returns:
+        The offset of the first data byte in ``data`` and the number of data
+        bytes in the block. The number of data bytes is None for an
+        indefinite length block.
+
+    Raises:
+        ValueError: If ``data`` does not contain a valid header.
+    """
+    start = data.find(b"#")
+    if start == -1 or start + 1 >= len(data):
+        raise ValueError(f"Could not find an IEEE 488.2 block header in {data[:20]!r}.")
+    n_digits_char = bytes(data[start + 1 : start + 2])
+    if not n_digits_char.isdigit():
+        raise ValueError(
+            f"Invalid IEEE 488.2 block header {data[start : start + 2]!r}."
+        )
+    n_digits = int(n_digits_char)
+    if n_digits == 0:
+        return start + 2, None
+    length_bytes = bytes(data[start + 2 : start + 2 + n_digits])
+    if len(length_bytes) != n_digits or not length_bytes.isdigit():
+        raise ValueError(
+            f"Invalid IEEE 488.2 block header {data[start : start + 2 + n_digits]!r}."
+        )
+    return start + 2 + n_digits, int(length_bytes)
+
+
+def parse_ieee_block(
+    data: bytes | bytearray,
+    dtype: npt.DTypeLike = np.float32,
+    is_big_endian: bool = False,
+) -> np.ndarray:
+    """
+    Parse an IEEE 488.2 definite or indefinite length binary block into a
+    numpy array.
+
+    For a definite length block any bytes after the block (such as a
+    message terminator) are ignored. For an indefinite length block all
+    bytes after the header are data, so the message terminator must have
+    been removed already.
+
+    Args:
+        data: The raw bytes of the response containing the block.
+        dtype: The dtype of the values in the block.
+        is_big_endian: Whether the values are sent most significant byte first.
+
+    Returns:
+        A one dimensional array of the values in the block. The array
+        shares memory with ``data`` when possible.
+
+    Raises:
+        ValueError: If ``data`` does not contain a valid block.
+    """
+    offset, length = parse_block_header(data)
+    if length is None:
+        length = len(data) - offset
+    elif offset + length > len(data):
+        raise ValueError(
+            f"IEEE 488.2 block is truncated. Expected {length} bytes "
+            f"of data but got {len(data) - offset}."
+        )
+    np_dtype = block_dtype(dtype, is_big_endian)
+    if length % np_dtype.itemsize:
+        raise ValueError(
+            f"IEEE 488.2 block of {length} bytes does not contain a whole "
+            f"number of values of dtype {np_dtype}."
+        )
+    return np.frombuffer(
+        data, dtype=np_dtype, count=length // np_dtype.itemsize, offset=offset
+    )
@@ -6,16 +6,23 @@ import time
 import weakref
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar, overload
 
+import numpy as np
+
+from qcodes.logger.io_trace import IOTrace
 from qcodes.utils import strip_attrs
 from qcodes.validators import Anything
 
 from .instrument_base import InstrumentBase
 from .instrument_meta import InstrumentMeta
+from .io_stats import InstrumentIOStats, command_header
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
+
+    import numpy.typing as npt
 
     from qcodes.logger.instrument_logger import InstrumentLoggerAdapter
+    from qcodes.parameters import ParameterBase
 
 
 log = logging.getLogger(__name__)
@@ -34,6 +41,7 @@ class InstrumentProtocol(Protocol):
 
 
 T = TypeVar("T", bound="Instrument")
+_R = TypeVar("_R")
 
 
 class Instrument(InstrumentBase, metaclass=InstrumentMeta):
@@ -64,6 +72,9 @@ class Instrument(InstrumentBase, metaclass=InstrumentMeta):
     ) -> None:
 
         self._t0 = time.time()
+        self._io_trace: IOTrace | None = None
+        self._io_stats: InstrumentIOStats | None = None
+        self._dump_io_trace_on_error = True
 
         super().__init__(name=name, metadata=metadata, label=label)
 
@@ -156,6 +167,15 @@ class Instrument(InstrumentBase, metaclass=InstrumentMeta):
         Subclasses should override this if they have other specific
         resources to close.
         """
+        from qcodes.dataset.threading import get_instrument_io_executor
+
+        # stop the I/O worker thread of this instrument, if it has one. The
+        # workers are looked up by name, so an instance that has already
+        # been closed, e.g. once more when it is garbage collected, must not
+        # stop the worker of a new instrument with the same name.
+        if Instrument._all_instruments.get(self.name) is self:
+            get_instrument_io_executor().release(self.full_name)
+
         if hasattr(self, "connection") and hasattr(self.connection, "close"):
             self.connection.close()
 
@@ -354,6 +374,135 @@ class Instrument(InstrumentBase, metaclass=InstrumentMeta):
             return True
         return False
 
+    @property
+    def io_trace(self) -> IOTrace | None:
+        """
+        The trace of the most recent I/O operations of this instrument, None
+        if tracing is not enabled. See :meth:`enable_io_trace`.
+        """
+        return self._io_trace
+
+    def enable_io_trace(
+        self, maxlen: int = 1000, dump_on_error: bool = True
+    ) -> IOTrace:
+        """
+        Start recording the command, response, timing and any error of each
+        :meth:`write`, :meth:`ask` and :meth:`ask_binary` of this instrument
+        in a ring buffer. Recording is cheap enough to leave enabled in fast
+        loops as nothing is formatted until the trace is dumped.
+
+        Args:
+            maxlen: Number of operations to keep in the trace.
+            dump_on_error: If True, the trace is logged at warning level to
+                the instrument logger when an operation raises.
+
+        Returns:
+            The trace that operations are recorded in.
+        """
+        self._io_trace = IOTrace(maxlen=maxlen)
+        self._dump_io_trace_on_error = dump_on_error
+        return self._io_trace
+
+    def disable_io_trace(self) -> None:
+        """
+        Stop recording I/O operations and discard the trace.
+        """
+        self._io_trace = None
+
+    def enable_io_stats(self, trace_spans: bool = False) -> InstrumentIOStats:
+        """
+        Start recording latency histograms of each command sent with
+        :meth:`write`, :meth:`ask` and :meth:`ask_binary` and of each get and
+        set of the parameters of this instrument and its submodules.
+        Commands are grouped by their header, i.e. the part before any
+        arguments. See :meth:`io_stats` and :meth:`.Station.io_stats_report`.
+
+        Only the parameters that exist when this is called are timed, call
+        it again to include parameters added later. Parameters are not
+        timed while statistics are disabled.
+
+        Args:
+            trace_spans: If True, an opentelemetry span is also emitted for
+                each command and each parameter get and set.
+
+        Returns:
+            The statistics that operations are recorded in.
+        """
+        self._io_stats = InstrumentIOStats(self.full_name, trace_spans=trace_spans)
+        for parameter in self._all_parameters():
+            parameter._enable_io_stats(self._io_stats)
+        return self._io_stats
+
+    def disable_io_stats(self) -> None:
+        """
+        Stop recording latency statistics and discard them.
+        """
+        self._io_stats = None
+        for parameter in self._all_parameters():
+            parameter._disable_io_stats()
+
+    def _all_parameters(self) -> list[ParameterBase]:
+        """
+        The parameters of this instrument and all of its submodules and
+        channels, each parameter once.
+        """
+        parameters: dict[int, ParameterBase] = {}
+        modules: list[Any] = [self]
+        while modules:
+            module = modules.pop()
+            if isinstance(module, InstrumentBase):
+                for parameter in module.parameters.values():
+                    parameters[id(parameter)] = parameter
+                modules.extend(module.submodules.values())
+            else:
+                # a ChannelTuple of channels
+                modules.extend(module)
+        return list(parameters.values())
+
+    def io_stats(self) -> dict[str, dict[str, float]]:
+        """
+        Return the count, total, mean, min, max and 50th, 90th and 99th
+        percentile latency in seconds of each command and parameter get and
+        set recorded since :meth:`enable_io_stats` was called. Empty if
+        statistics are not enabled.
+        """
+        if self._io_stats is None:
+            return {}
+        return self._io_stats.summary()
+
+    def _instrumented_call(
+        self, operation: str, raw_method: Callable[..., _R], cmd: str, *args: Any
+    ) -> _R:
+        io_stats = self._io_stats
+        if io_stats is None:
+            return self._traced_call(operation, raw_method, cmd, *args)
+        with io_stats.timed(operation, command_header(cmd)):
+            return self._traced_call(operation, raw_method, cmd, *args)
+
+    def _traced_call(
+        self, operation: str, raw_method: Callable[..., _R], cmd: str, *args: Any
+    ) -> _R:
+        io_trace = self._io_trace
+        t_start = time.perf_counter()
+        try:
+            response = raw_method(cmd, *args)
+        except Exception as e:
+            if io_trace is not None:
+                io_trace.record(operation, cmd, None, t_start, time.perf_counter(), e)
+            if io_trace is not None and self._dump_io_trace_on_error:
+                self.log.warning(
+                    "I/O trace up to error in %s of %r:\n%s",
+                    operation,
+                    cmd,
+                    io_trace.format(),
+                )
+            verb = "writing " if operation == "write" else "asking "
+            e.args = e.args + (verb + repr(cmd) + " to " + repr(self),)
+            raise e
+        if io_trace is not None:
+            io_trace.record(operation, cmd, response, t_start, time.perf_counter())
+        return response
+
     # `write_raw` and `ask_raw` are the interface to hardware                #
     # `write` and `ask` are standard wrappers to help with error reporting   #
     #
@@ -373,6 +522,9 @@ class Instrument(InstrumentBase, metaclass=InstrumentMeta):
             Exception: Wraps any underlying exception with extra context,
                 including the command and the instrument.
         """
+        if self._io_trace is not None or self._io_stats is not None:
+            self._instrumented_call("write", self.write_raw, cmd)
+            return
         try:
             self.write_raw(cmd)
         except Exception as e:
@@ -413,6 +565,8 @@ class Instrument(InstrumentBase, metaclass=InstrumentMeta):
             Exception: Wraps any underlying exception with extra context,
                 including the command and the instrument.
         """
+        if self._io_trace is not None or self._io_stats is not None:
+            return self._instrumented_call("ask", self.ask_raw, cmd)
         try:
             answer = self.ask_raw(cmd)
 
@@ -438,6 +592,101 @@ class Instrument(InstrumentBase, metaclass=InstrumentMeta):
             f"Instrument {type(self).__name__} has not defined an ask method"
         )
 
+    async def write_async(self, cmd: str) -> None:
+        """
+        Write a command string with NO response to the hardware without
+        blocking the event loop.
+
+        The write is executed on the I/O worker thread of this instrument
+        in the process wide :class:`qcodes.dataset.InstrumentIOExecutor`,
+        such that it is ordered with respect to other calls made through
+        the executor e.g. :meth:`.ParameterBase.get_async`.
+
+        Args:
+            cmd: The string to send to the instrument.
+        """
+        from qcodes.dataset.threading import run_instrument_io
+
+        await run_instrument_io(self.full_name, self.write, cmd)
+
+    async def ask_async(self, cmd: str) -> str:
+        """
+        Write a command string to the hardware and return a response without
+        blocking the event loop. See :meth:`write_async` for details.
+
+        Args:
+            cmd: The string to send to the instrument.
+
+        Returns:
+            response
+        """
+        from qcodes.dataset.threading import run_instrument_io
+
+        return await run_instrument_io(self.full_name, self.ask, cmd)
+
+    def ask_binary(
+        self,
+        cmd: str,
+        dtype: npt.DTypeLike = np.float32,
+        is_big_endian: bool = False,
+    ) -> np.ndarray:
+        """
+        Write a command string to the hardware and return the IEEE 488.2
+        binary block in the response as a numpy array.
+
+        Subclasses that transform ``cmd`` should override this method, and in
+        it call ``super().ask_binary(new_cmd, ...)``. Subclasses that define a
+        new hardware communication should instead override
+        ``ask_binary_raw``.
+
+        Args:
+            cmd: The string to send to the instrument.
+            dtype: The dtype of the values in the block.
+            is_big_endian: Whether the values are sent most significant
+                byte first.
+
+        Returns:
+            A one dimensional array of the values in the block.
+
+        Raises:
+            Exception: Wraps any underlying exception with extra context,
+                including the command and the instrument.
+        """
+        if self._io_trace is not None or self._io_stats is not None:
+            return self._instrumented_call(
+                "ask_binary", self.ask_binary_raw, cmd, dtype, is_big_endian
+            )
+        try:
+            return self.ask_binary_raw(cmd, dtype, is_big_endian)
+        except Exception as e:
+            inst = repr(self)
+            e.args = e.args + ("asking " + repr(cmd) + " to " + inst,)
+            raise e
+
+    def ask_binary_raw(
+        self,
+        cmd: str,
+        dtype: npt.DTypeLike = np.float32,
+        is_big_endian: bool = False,
+    ) -> np.ndarray:
+        """
+        Low level method to write to the hardware and read an IEEE 488.2
+        binary block from the response.
+
+        Subclasses that define a new hardware communication should override
+        this method. Subclasses that transform ``cmd`` should instead
+        override ``ask_binary``.
+
+        Args:
+            cmd: The string to send to the instrument.
+            dtype: The dtype of the values in the block.
+            is_big_endian: Whether the values are sent most significant
+                byte first.
+        """
+        raise NotImplementedError(
+            f"Instrument {type(self).__name__} has not defined an ask_binary method"
+        )
+
 
 def find_or_create_instrument(
     instrument_class: type[T],
@@ -0,0 +1,162 @@
+"""
+Opt-in latency statistics of the I/O of an instrument.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from opentelemetry import trace
+
+from qcodes.utils import LatencyHistogram
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+TRACER = trace.get_tracer(__name__)
+
+_REPORT_COLUMNS = ("count", "total", "mean", "p50", "p90", "p99", "max")
+
+
+def command_header(cmd: str) -> str:
+    """
+    Return the part of a command before any arguments, i.e. the SCPI header
+    of the command, such that e.g. ``VOLT 1.0`` and ``VOLT 2.0`` are counted
+    as the same command.
+    """
+    return cmd.split(maxsplit=1)[0] if cmd.strip() else cmd
+
+
+class InstrumentIOStats:
+    """
+    Latency histograms of the commands sent to an instrument and of the
+    parameter gets and sets of the instrument and its submodules, keyed by
+    e.g. ``ask *IDN?`` or ``get dac_ch1``. See
+    :meth:`.Instrument.enable_io_stats`.
+
+    Args:
+        instrument_name: Full name of the instrument that the statistics
+            are recorded for.
+        trace_spans: If True, an opentelemetry span is emitted for each
+            timed operation.
+    """
+
+    def __init__(self, instrument_name: str, trace_spans: bool = False):
+        self.instrument_name = instrument_name
+        self.trace_spans = trace_spans
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def _histogram(self, key: str) -> LatencyHistogram:
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, LatencyHistogram())
+        return histogram
+
+    def record(self, operation: str, target: str, duration: float) -> None:
+        """
+        Record the latency of a single operation.
+
+        Args:
+            operation: The kind of operation, e.g. ``ask`` or ``get``.
+            target: The command header or parameter name the operation
+                acted on.
+            duration: Time taken by the operation in seconds.
+        """
+        self._histogram(f"{operation} {target}").record(duration)
+
+    @contextmanager
+    def timed(self, operation: str, target: str) -> Iterator[None]:
+        """
+        Context manager recording the time spent in its body. The time is
+        recorded whether or not the body raises.
+
+        Args:
+            operation: The kind of operation, e.g. ``ask`` or ``get``.
+            target: The command header or parameter name the operation
+                acted on.
+        """
+        span = None
+        if self.trace_spans:
+            span = TRACER.start_span(
+                f"qcodes.instrument.{operation}",
+                attributes={
+                    "qcodes.instrument": self.instrument_name,
+                    "qcodes.instrument.target": target,
+                },
+            )
+        t_start = perf_counter()
+        try:
+            if span is not None:
+                with trace.use_span(span, end_on_exit=True):
+                    yield
+            else:
+                yield
+        finally:
+            self.record(operation, target, perf_counter() - t_start)
+
+    def histograms(self) -> dict[str, LatencyHistogram]:
+        """Return the latency histograms by operation."""
+        with self._lock:
+            return dict(self._histograms)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Return the :meth:`.LatencyHistogram.summary` of each operation.
+        """
+        return {key: hist.summary() for key, hist in self.histograms().items()}
+
+    def reset(self) -> None:
+        """Remove all recorded statistics."""
+        with self._lock:
+            self._histograms.clear()
+
+    def report(self, limit: int | None = None) -> str:
+        """
+        Format the statistics as a table with one row per operation, the
+        operations taking the most time in total first.
+
+        Args:
+            limit: Maximal number of rows in the table.
+        """
+        return format_io_stats_report([self], limit=limit)
+
+
+def format_io_stats_report(
+    io_stats: Iterable[InstrumentIOStats], limit: int | None = None
+) -> str:
+    """
+    Format the statistics of one or more instruments as a table with one
+    row per instrument and operation, the operations taking the most time
+    in total first. Times are in milliseconds.
+
+    Args:
+        io_stats: The statistics to include in the table.
+        limit: Maximal number of rows in the table.
+    """
+    rows = [
+        (stats.instrument_name, key, summary)
+        for stats in io_stats
+        for key, summary in stats.summary().items()
+    ]
+    rows.sort(key=lambda row: row[2]["total"], reverse=True)
+    if limit is not None:
+        rows = rows[:limit]
+
+    name_width = max([len("instrument"), *(len(row[0]) for row in rows)])
+    key_width = max([len("operation"), *(len(row[1]) for row in rows)])
+    header = f"{'instrument':<{name_width}}  {'operation':<{key_width}}" + "".join(
+        f"{column:>11}" for column in _REPORT_COLUMNS
+    )
+    lines = [header]
+    for name, key, summary in rows:
+        line = f"{name:<{name_width}}  {key:<{key_width}}{summary['count']:>11}"
+        line += "".join(
+            f"{summary[column] * 1e3:>11.3f}" for column in _REPORT_COLUMNS[1:]
+        )
+        lines.append(line)
+    return "\n".join(lines)
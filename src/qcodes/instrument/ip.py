@@ -5,12 +5,17 @@ import logging
 import socket
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from .base import Instrument
+from .ieee_block import block_dtype, parse_block_header, parse_ieee_block
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from types import TracebackType
 
+    import numpy.typing as npt
+
 log = logging.getLogger(__name__)
 
 
@@ -38,6 +43,19 @@ class IPInstrument(Instrument):
         write_confirmation: Whether the instrument acknowledges writes
             with some response we should read. Default True.
 
+        read_terminator: Character(s) terminating each response. If given,
+            each response is read until this terminator (which is stripped
+            from the response) however many reads from the socket that
+            takes. If None, a response is whatever a single read from the
+            socket returns. Default None.
+
+        tcp_nodelay: Whether to disable Nagle's algorithm on the socket
+            such that short commands are sent immediately. Default False.
+
+        keep_alive: Whether to enable TCP keep-alive on the socket such that
+            a broken connection is detected on idle persistent
+            connections. Default False.
+
         kwargs: additional static metadata to add to this
             instrument's JSON snapshot.
 
@@ -54,6 +72,9 @@ class IPInstrument(Instrument):
         terminator: str = "\n",
         persistent: bool = True,
         write_confirmation: bool = True,
+        read_terminator: str | None = None,
+        tcp_nodelay: bool = False,
+        keep_alive: bool = False,
         **kwargs: Any,
     ):
         super().__init__(name, **kwargs)
@@ -62,10 +83,18 @@ class IPInstrument(Instrument):
         self._port = port
         self._timeout = timeout
         self._terminator = terminator
+        self._read_terminator = read_terminator
         self._confirmation = write_confirmation
+        self._tcp_nodelay = tcp_nodelay
+        self._keep_alive = keep_alive
 
         self._ensure_connection = EnsureConnection(self)
-        self._buffer_size = 1400
+        self._buffer_size = 65536
+        # reusable buffer that the socket is read into and the bytes
+        # that have been received but not yet consumed by a read
+        self._recv_buffer = bytearray(self._buffer_size)
+        self._recv_buffer_view = memoryview(self._recv_buffer)
+        self._rx_buffer = bytearray()
 
         self._socket: socket.socket | None = None
 
@@ -119,6 +148,7 @@ class IPInstrument(Instrument):
             log.info(f"Connecting socket to {self._address}:{self._port}")
             self._socket.connect((self._address, self._port))
             self.set_timeout(self._timeout)
+            self._set_socket_options()
         except ConnectionRefusedError:
             log.warning("Socket connection failed")
             if self._socket is not None:
@@ -126,7 +156,18 @@ class IPInstrument(Instrument):
             self._socket = None
             raise
 
+    def _set_socket_options(self) -> None:
+        if self._socket is None:
+            return
+        self._socket.setsockopt(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, int(self._tcp_nodelay)
+        )
+        self._socket.setsockopt(
+            socket.SOL_SOCKET, socket.SO_KEEPALIVE, int(self._keep_alive)
+        )
+
     def _disconnect(self) -> None:
+        self._rx_buffer.clear()
         if self._socket is None:
             return
         log.info("Socket shutdown")
@@ -158,23 +199,171 @@ class IPInstrument(Instrument):
         """
         self._terminator = terminator
 
+    def set_read_terminator(self, read_terminator: str | None) -> None:
+        """
+        Change the terminator that responses are read until.
+
+        Args:
+            read_terminator: Character(s) terminating each response. If
+                None, a response is whatever a single read from the socket
+                returns.
+        """
+        self._read_terminator = read_terminator
+
+    def set_socket_options(
+        self, tcp_nodelay: bool | None = None, keep_alive: bool | None = None
+    ) -> None:
+        """
+        Change the options of the socket. Options that are not given are
+        left unchanged.
+
+        Args:
+            tcp_nodelay: Whether to disable Nagle's algorithm on the socket.
+            keep_alive: Whether to enable TCP keep-alive on the socket.
+        """
+        if tcp_nodelay is not None:
+            self._tcp_nodelay = tcp_nodelay
+        if keep_alive is not None:
+            self._keep_alive = keep_alive
+        self._set_socket_options()
+
+    @property
+    def _response_terminator(self) -> str:
+        if self._read_terminator is not None:
+            return self._read_terminator
+        return self._terminator
+
     def _send(self, cmd: str) -> None:
         if self._socket is None:
             raise RuntimeError(f'IPInstrument {self.name} is not connected')
         data = cmd + self._terminator
-        log.debug(f"Writing {data} to instrument {self.name}")
+        log.debug("Writing %s to instrument %s", data, self.name)
         self._socket.sendall(data.encode())
 
     def _recv(self) -> str:
-        if self._socket is None:
-            raise RuntimeError(f'IPInstrument {self.name} is not connected')
-        result = self._socket.recv(self._buffer_size)
-        log.debug(f"Got {result!r} from instrument {self.name}")
-        if result == b'':
+        if self._read_terminator is not None:
+            result = self._recv_until(self._read_terminator.encode())
+            log.debug("Got %r from instrument %s", result, self.name)
+            return result.decode()
+        if not self._rx_buffer and self._recv_chunk() == 0:
             log.warning("Got empty response from Socket recv() "
                         "Connection broken.")
+        result = bytes(self._rx_buffer)
+        self._rx_buffer.clear()
+        log.debug("Got %r from instrument %s", result, self.name)
         return result.decode()
 
+    def _recv_chunk(self) -> int:
+        """
+        Receive the bytes available on the socket (up to the buffer size)
+        into the reusable receive buffer and append them to the buffer of
+        received but not yet consumed bytes.
+
+        Returns:
+            The number of bytes received, 0 if the connection was closed.
+        """
+        if self._socket is None:
+            raise RuntimeError(f'IPInstrument {self.name} is not connected')
+        n_bytes = self._socket.recv_into(self._recv_buffer)
+        self._rx_buffer += self._recv_buffer_view[:n_bytes]
+        return n_bytes
+
+    def _recv_until(self, terminator: bytes) -> bytes:
+        """
+        Read from the socket until ``terminator`` is received and return
+        everything before it. Bytes received after the terminator are kept
+        for the next read.
+        """
+        search_start = 0
+        while (index := self._rx_buffer.find(terminator, search_start)) == -1:
+            # only the tail of the buffer can contain the start of a
+            # terminator split over two chunks
+            search_start = max(len(self._rx_buffer) - len(terminator) + 1, 0)
+            if self._recv_chunk() == 0:
+                raise ConnectionError(
+                    f"Connection to {self.name} was closed before the "
+                    f"terminator {terminator!r} was received."
+                )
+        result = bytes(self._rx_buffer[:index])
+        del self._rx_buffer[: index + len(terminator)]
+        return result
+
+    def _recv_exact_into(self, buffer: memoryview) -> None:
+        """
+        Fill ``buffer`` with the next bytes received from the socket,
+        starting with any bytes already received but not yet consumed.
+        Large reads go directly from the socket into ``buffer``.
+        """
+        if self._socket is None:
+            raise RuntimeError(f'IPInstrument {self.name} is not connected')
+        n_read = min(len(self._rx_buffer), len(buffer))
+        buffer[:n_read] = self._rx_buffer[:n_read]
+        del self._rx_buffer[:n_read]
+        while n_read < len(buffer):
+            n = self._socket.recv_into(buffer[n_read:])
+            if n == 0:
+                raise ConnectionError(
+                    f"Connection to {self.name} was closed while reading "
+                    f"{len(buffer)} bytes, got {n_read}."
+                )
+            n_read += n
+
+    def _recv_exact(self, n_bytes: int) -> bytes:
+        """
+        Read exactly ``n_bytes`` bytes from the socket.
+        """
+        while len(self._rx_buffer) < n_bytes:
+            if self._recv_chunk() == 0:
+                raise ConnectionError(
+                    f"Connection to {self.name} was closed while reading "
+                    f"{n_bytes} bytes, got {len(self._rx_buffer)}."
+                )
+        result = bytes(self._rx_buffer[:n_bytes])
+        del self._rx_buffer[:n_bytes]
+        return result
+
+    def _recv_binary_block(
+        self, dtype: npt.DTypeLike, is_big_endian: bool
+    ) -> np.ndarray:
+        # skip anything (e.g. a response header) before the start of the block
+        while self._recv_exact(1) != b"#":
+            pass
+        n_digits_char = self._recv_exact(1)
+        if not n_digits_char.isdigit():
+            raise ValueError(
+                f"Invalid IEEE 488.2 block header {b'#' + n_digits_char!r}."
+            )
+        n_digits = int(n_digits_char)
+        terminator = self._response_terminator.encode()
+        if n_digits == 0:
+            # an indefinite length block is ended by the terminator
+            if not terminator:
+                raise ValueError(
+                    "Cannot read an indefinite length block without a terminator."
+                )
+            data = b"#0" + self._recv_until(terminator)
+            return parse_ieee_block(data, dtype, is_big_endian)
+        length_bytes = self._recv_exact(n_digits)
+        header = b"#" + n_digits_char + length_bytes
+        _, length = parse_block_header(header)
+        assert length is not None
+        np_dtype = block_dtype(dtype, is_big_endian)
+        if length % np_dtype.itemsize:
+            raise ValueError(
+                f"IEEE 488.2 block of {length} bytes does not contain a whole "
+                f"number of values of dtype {np_dtype}."
+            )
+        # read straight into the memory of the returned array
+        values = np.empty(length // np_dtype.itemsize, dtype=np_dtype)
+        self._recv_exact_into(memoryview(values).cast("B"))
+        # consume the terminator following the block
+        if terminator:
+            self._recv_exact(len(terminator))
+        log.debug(
+            "Got binary block of %d values from instrument %s", len(values), self.name
+        )
+        return values
+
     def close(self) -> None:
         """Disconnect and irreversibly tear down the instrument."""
         self._disconnect()
@@ -207,6 +396,33 @@ class IPInstrument(Instrument):
             self._send(cmd)
             return self._recv()
 
+    def ask_binary_raw(
+        self,
+        cmd: str,
+        dtype: npt.DTypeLike = np.float32,
+        is_big_endian: bool = False,
+    ) -> np.ndarray:
+        """
+        Low-level interface to send a command and read an IEEE 488.2 binary
+        block from the response.
+
+        The data of a definite length block is read directly into the
+        returned array. The block is expected to be followed by the read
+        terminator, or by the write terminator if no read terminator is set.
+
+        Args:
+            cmd: The command to send to the instrument.
+            dtype: The dtype of the values in the block.
+            is_big_endian: Whether the values are sent most significant
+                byte first.
+
+        Returns:
+            The values in the binary block of the instrument's response.
+        """
+        with self._ensure_connection:
+            self._send(cmd)
+            return self._recv_binary_block(dtype, is_big_endian)
+
     def snapshot_base(
         self,
         update: bool | None = False,
@@ -242,6 +458,9 @@ class IPInstrument(Instrument):
         snap['confirmation'] = self._confirmation
         snap['address'] = self._address
         snap['terminator'] = self._terminator
+        snap['read_terminator'] = self._read_terminator
+        snap['tcp_nodelay'] = self._tcp_nodelay
+        snap['keep_alive'] = self._keep_alive
         snap['timeout'] = self._timeout
         snap['persistent'] = self._persistent
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from importlib.resources import as_file, files
 from typing import Any
 
@@ -59,7 +60,12 @@ class IPToVisa(VisaInstrument, IPInstrument):  # type: ignore[misc]
     ):
 
         # remove IPInstrument-specific kwargs
-        ipkwargs = ['write_confirmation']
+        ipkwargs = [
+            'write_confirmation',
+            'read_terminator',
+            'tcp_nodelay',
+            'keep_alive',
+        ]
         newkwargs = {kw: val for (kw, val) in kwargs.items()
                      if kw not in ipkwargs}
 
@@ -80,6 +86,7 @@ class IPToVisa(VisaInstrument, IPInstrument):  # type: ignore[misc]
         with as_file(traversable_handle) as sim_visalib_path:
             self.visalib = f"{sim_visalib_path!s}@sim"
             self.set_address(address=address)
+        self._batch_state = threading.local()
 
         if device_clear:
             self.device_clear()
@@ -94,22 +101,7 @@ class IPToVisa(VisaInstrument, IPInstrument):  # type: ignore[misc]
         if getattr(self, 'visa_handle', None):
             self.visa_handle.close()
 
-        if getattr(self, "visabackend", None) == "sim" and getattr(
-            self, "resource_manager", None
-        ):
-            # The pyvisa-sim visalib has a session attribute but the resource manager is not generic in the
-            # visalib type so we cannot get it in a type safe way
-            known_sessions = getattr(self.resource_manager.visalib, "sessions", ())
-            session_found = self.resource_manager.session in known_sessions
-
-            n_sessions = len(known_sessions)
-            # if this instrument is the last one or there are no connected instruments its safe to reset the device
-            if (session_found and n_sessions == 1) or n_sessions == 0:
-                # work around for https://github.com/pyvisa/pyvisa-sim/issues/83
-                # see other issues for more context
-                # https://github.com/QCoDeS/Qcodes/issues/5356 and
-                # https://github.com/pyvisa/pyvisa-sim/issues/82
-                self.resource_manager.visalib._init()
+        self._release_resource_manager_and_reset_sim()
 
         # Instrument close
         if hasattr(self, 'connection') and hasattr(self.connection, 'close'):
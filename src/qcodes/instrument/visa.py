@@ -2,11 +2,16 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 import warnings
+from collections import Counter
+from contextlib import contextmanager
 from importlib.resources import as_file, files
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 from weakref import finalize
 
+import numpy as np
 import pyvisa
 import pyvisa.constants as vi_const
 import pyvisa.resources
@@ -14,18 +19,28 @@ from pyvisa.errors import InvalidSession
 
 import qcodes.validators as vals
 from qcodes.logger import get_instrument_logger
+from qcodes.parameters import GroupParameter
+from qcodes.parameters.command import Command
 from qcodes.utils import DelayedKeyboardInterrupt
 
+from .channel import InstrumentModule
+from .ieee_block import struct_format
 from .instrument import Instrument
 from .instrument_base import InstrumentBase
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    import numpy.typing as npt
+
+    from qcodes.parameters import ParameterBase
 
 VISA_LOGGER = '.'.join((InstrumentBase.__module__, 'com', 'visa'))
 
 log = logging.getLogger(__name__)
 
+_R = TypeVar("_R")
+
 
 def _close_visa_handle(
     handle: pyvisa.resources.MessageBasedResource, name: str
@@ -45,6 +60,316 @@ def _close_visa_handle(
         # the resource is already closed
         pass
 
+
+class _ResourceManagerPool:
+    """
+    Process wide pool of the PyVISA resource managers used by
+    :class:`VisaInstrument` s, keyed by visalib, which counts the
+    instruments using each resource manager.
+
+    PyVISA shares a single resource manager session per VISA library, but
+    resolving the library from the visalib string can be slow (e.g. the
+    default backend searches for the VISA library). The pool resolves each
+    visalib only once while it is in use, can be used from several threads
+    at once and knows when the last instrument using a visalib is closed.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resource_managers: dict[str | None, pyvisa.ResourceManager] = {}
+        self._ref_counts: Counter[str | None] = Counter()
+
+    def acquire(self, visalib: str | None) -> pyvisa.ResourceManager:
+        """
+        Return the resource manager of a visalib, opening it if needed,
+        and increase its reference count.
+        """
+        with self._lock:
+            resource_manager = self._resource_managers.get(visalib)
+            if resource_manager is not None:
+                try:
+                    resource_manager.session
+                except InvalidSession:
+                    # the resource manager has been closed elsewhere
+                    resource_manager = None
+            if resource_manager is None:
+                if visalib is not None:
+                    log.info(
+                        "Opening PyVISA Resource Manager with visalib: %s", visalib
+                    )
+                    resource_manager = pyvisa.ResourceManager(visalib)
+                else:
+                    log.info("Opening PyVISA Resource Manager with default backend.")
+                    resource_manager = pyvisa.ResourceManager()
+                self._resource_managers[visalib] = resource_manager
+            self._ref_counts[visalib] += 1
+            return resource_manager
+
+    def release(self, visalib: str | None) -> int:
+        """
+        Decrease the reference count of the resource manager of a visalib
+        and remove it from the pool when it is no longer used. The resource
+        manager is not closed since PyVISA shares its session with any
+        other user of the same VISA library.
+
+        Returns:
+            The number of instruments still using the resource manager.
+        """
+        with self._lock:
+            self._ref_counts[visalib] -= 1
+            remaining = self._ref_counts[visalib]
+            if remaining <= 0:
+                del self._ref_counts[visalib]
+                self._resource_managers.pop(visalib, None)
+            return max(remaining, 0)
+
+    def ref_count(self, visalib: str | None) -> int:
+        """Return the number of instruments using the visalib."""
+        with self._lock:
+            return self._ref_counts[visalib]
+
+
+_RESOURCE_MANAGER_POOL = _ResourceManagerPool()
+
+
+def _batch_query(parameter: ParameterBase) -> str | None:
+    """
+    Return the query used to get the parameter if it is a fixed string
+    that can be sent as part of a batch, otherwise None.
+    """
+    if isinstance(parameter, GroupParameter):
+        group = parameter.group
+        if group is None or group.instrument is None:
+            return None
+        instrument = group.instrument
+        query = group._get_cmd
+    else:
+        get_raw = getattr(parameter, "get_raw", None)
+        if not isinstance(get_raw, Command) or parameter.instrument is None:
+            return None
+        instrument = parameter.instrument
+        query = getattr(get_raw, "cmd_str", None)
+    if query is None or not _sends_commands_unchanged(instrument):
+        return None
+    return query
+
+
+def _sends_commands_unchanged(instrument: InstrumentBase) -> bool:
+    """
+    Whether commands asked and written through the instrument reach its
+    root :class:`VisaInstrument` unchanged. Modules or drivers that override
+    ``ask`` or ``write``, e.g. to add a prefix or to select a channel first,
+    would be answered for the wrong target if their queries were prefetched.
+    """
+    while isinstance(instrument, InstrumentModule):
+        module_class = type(instrument)
+        if (
+            module_class.ask is not InstrumentModule.ask
+            or module_class.write is not InstrumentModule.write
+        ):
+            return False
+        instrument = instrument.parent
+    instrument_class = type(instrument)
+    return (
+        instrument_class.ask is Instrument.ask
+        and instrument_class.write is Instrument.write
+        and instrument_class.ask_raw is VisaInstrument.ask_raw
+        and instrument_class.write_raw is VisaInstrument.write_raw
+    )
+
+
+class VisaCommandBatch:
+    """
+    Queue of commands sent to a :class:`VisaInstrument` within
+    :meth:`VisaInstrument.batch`.
+
+    Commands written to the instrument are queued and sent together,
+    joined into SCPI program messages, when a query is made, when the
+    message would exceed ``batch_max_message_length`` of the instrument
+    or when the batch ends. A query is sent in the same message as the
+    commands queued before it, so that a sequence of sets followed by a
+    get takes a single round trip.
+
+    Queries of parameters can be sent ahead in a single message with
+    :meth:`prefetch`. The response of each query is then returned the
+    next time the same query is asked, without communicating with the
+    instrument, unless a command has been written in between or the
+    responses have been discarded with :meth:`discard_prefetched`.
+
+    Args:
+        instrument: The instrument that commands are sent to.
+    """
+
+    def __init__(self, instrument: VisaInstrument):
+        self._instrument = instrument
+        self._pending_writes: list[str] = []
+        # responses fetched ahead and the number of times each of them
+        # answers its query
+        self._responses: dict[str, tuple[str, int]] = {}
+
+    @staticmethod
+    def _join(commands: Sequence[str]) -> str:
+        # prefix each command with a colon so that its header is not
+        # interpreted relative to the header of the previous command
+        return ";".join(
+            cmd if i == 0 or cmd.startswith(("*", ":")) else ":" + cmd
+            for i, cmd in enumerate(commands)
+        )
+
+    def _fits(self, commands: Sequence[str]) -> bool:
+        return (
+            len(commands) <= 1
+            or len(self._join(commands)) <= self._instrument.batch_max_message_length
+        )
+
+    def write(self, cmd: str) -> None:
+        """
+        Queue a command to be written to the instrument.
+
+        Args:
+            cmd: The command to write.
+        """
+        # responses fetched ahead may no longer be valid after a write
+        self._responses.clear()
+        if not self._fits([*self._pending_writes, cmd]):
+            self.flush()
+        self._pending_writes.append(cmd)
+
+    def ask(self, cmd: str) -> str:
+        """
+        Return the response to a query, either from the responses fetched
+        ahead or by sending the query together with any queued commands.
+
+        Args:
+            cmd: The query to send.
+        """
+        kept = self._responses.pop(cmd, None)
+        if kept is not None:
+            response, uses = kept
+            if uses > 1:
+                self._responses[cmd] = (response, uses - 1)
+            return response
+        if not self._fits([*self._pending_writes, cmd]):
+            self.flush()
+        message = self._join([*self._pending_writes, cmd])
+        self._pending_writes.clear()
+        return self._send("batch ask", self._instrument._ask_unbatched, message)
+
+    def _send(
+        self, operation: str, send: Callable[[str], _R], message: str
+    ) -> _R:
+        # the messages that are actually sent are recorded in the I/O trace
+        # of the instrument in addition to the commands they contain
+        io_trace = self._instrument.io_trace
+        if io_trace is None:
+            return send(message)
+        t_start = time.perf_counter()
+        try:
+            response = send(message)
+        except Exception as e:
+            io_trace.record(operation, message, None, t_start, time.perf_counter(), e)
+            raise
+        io_trace.record(operation, message, response, t_start, time.perf_counter())
+        return response
+
+    def flush(self) -> None:
+        """
+        Send all queued commands to the instrument.
+        """
+        while self._pending_writes:
+            n_commands = 1
+            while n_commands < len(self._pending_writes) and self._fits(
+                self._pending_writes[: n_commands + 1]
+            ):
+                n_commands += 1
+            message = self._join(self._pending_writes[:n_commands])
+            del self._pending_writes[:n_commands]
+            self._send("batch write", self._instrument._write_unbatched, message)
+
+    def prefetch(self, parameters: Iterable[ParameterBase]) -> None:
+        """
+        Send the queries of the given parameters to the instrument in as few
+        messages as possible and keep the responses. A subsequent ``get`` of
+        each of the parameters is then answered from the kept response and
+        passed through the parameter's parsers as usual.
+
+        Only parameters that are gotten with a fixed command string (either
+        from a ``get_cmd`` or from the ``get_cmd`` of the group of a
+        :class:`.GroupParameter`) through modules and an instrument that do
+        not override ``ask`` or ``write`` are fetched ahead. Each query is
+        sent once, even if several parameters share it. If the instrument
+        fails to answer a batch of queries, or the number of responses does
+        not match the number of queries, the batch is discarded and the
+        parameters are gotten one by one as usual.
+
+        Args:
+            parameters: The parameters to fetch ahead.
+        """
+        queries = [
+            query
+            for query in dict.fromkeys(map(_batch_query, parameters))
+            if query is not None and query not in self._responses
+        ]
+        batch: list[str] = []
+        for query in queries:
+            if batch and not self._fits([*self._pending_writes, *batch, query]):
+                self._prefetch_batch(batch)
+                batch = []
+            batch.append(query)
+        if batch:
+            self._prefetch_batch(batch)
+
+    def _prefetch_batch(self, queries: Sequence[str]) -> None:
+        message = self._join([*self._pending_writes, *queries])
+        self._pending_writes.clear()
+        try:
+            response = self._send(
+                "batch ask", self._instrument._ask_unbatched, message
+            )
+        except Exception:
+            self._instrument.visa_log.warning(
+                "Could not prefetch queries %s, they will be sent one by one.",
+                queries,
+                exc_info=True,
+            )
+            return
+        responses = response.split(self._instrument.batch_response_separator)
+        if len(responses) != len(queries):
+            self._instrument.visa_log.warning(
+                "Got %d responses to %d prefetched queries, they will be "
+                "sent one by one.",
+                len(responses),
+                len(queries),
+            )
+            return
+        for query, query_response in zip(queries, responses):
+            self._responses[query] = (query_response, 1)
+
+    def reuse_response(self, query: str, response: str, uses: int) -> None:
+        """
+        Answer the next ``uses`` asks of ``query`` with ``response`` instead
+        of sending the query to the instrument, unless a command is written
+        in between. Used by a :class:`.Group` to answer the gets of all its
+        parameters with a single query.
+
+        Args:
+            query: The query.
+            response: The response of the instrument to the query.
+            uses: The number of times the response answers the query.
+        """
+        if uses > 0 and _sends_commands_unchanged(self._instrument):
+            self._responses[query] = (response, uses)
+        else:
+            self._responses.pop(query, None)
+
+    def discard_prefetched(self) -> None:
+        """
+        Discard the responses fetched ahead that have not been used, such
+        that the next query of each of them is sent to the instrument.
+        """
+        self._responses.clear()
+
+
 class VisaInstrument(Instrument):
 
     """
@@ -81,6 +406,26 @@ class VisaInstrument(Instrument):
 
     """
 
+    supports_batched_queries: bool = False
+    """
+    Set this to True in a driver for an instrument that accepts SCPI
+    program messages with multiple commands and queries separated by ``;``
+    to fetch the parameters of the instrument in as few round trips as
+    possible when taking a snapshot. See :meth:`batch`.
+    """
+
+    batch_max_message_length: int = 256
+    """
+    Maximum length of a program message sent by :meth:`batch`. Commands
+    are split over multiple messages if they do not fit in one.
+    """
+
+    batch_response_separator: str = ";"
+    """
+    Separator between the responses to the queries of a single program
+    message.
+    """
+
     def __init__(
         self,
         name: str,
@@ -145,6 +490,9 @@ class VisaInstrument(Instrument):
         """
         self.visalib: str | None = visalib
         self._address = address
+        # the batch is local to the thread that opened it such that other
+        # threads communicating with the instrument are not batched
+        self._batch_state = threading.local()
 
         if device_clear:
             self.device_clear()
@@ -174,21 +522,33 @@ class VisaInstrument(Instrument):
             self.visa_handle.close()
 
         if visalib is not None:
-            self.visa_log.info(
-                f"Opening PyVISA Resource Manager with visalib: {visalib}"
-            )
-            resource_manager = pyvisa.ResourceManager(visalib)
             visabackend = visalib.split("@")[1]
         else:
-            self.visa_log.info("Opening PyVISA Resource Manager with default backend.")
-            resource_manager = pyvisa.ResourceManager()
             visabackend = "ivi"
+        resource_manager = _RESOURCE_MANAGER_POOL.acquire(visalib)
 
-        self.visa_log.info(f"Opening PyVISA resource at address: {address}")
-        resource = resource_manager.open_resource(address)
-        if not isinstance(resource, pyvisa.resources.MessageBasedResource):
-            resource.close()
-            raise TypeError("QCoDeS only support MessageBasedResource Visa resources")
+        try:
+            self.visa_log.info(f"Opening PyVISA resource at address: {address}")
+            resource = resource_manager.open_resource(address)
+            if not isinstance(resource, pyvisa.resources.MessageBasedResource):
+                resource.close()
+                raise TypeError(
+                    "QCoDeS only support MessageBasedResource Visa resources"
+                )
+        except Exception:
+            _RESOURCE_MANAGER_POOL.release(visalib)
+            raise
+
+        # release the resource manager when the instrument is closed or
+        # garbage collected. When reopening, the previous resource manager is
+        # released only after acquiring the new one such that the pool does
+        # not consider it unused if they are the same.
+        previous_release = getattr(self, "_release_resource_manager", None)
+        self._release_resource_manager = finalize(
+            self, _RESOURCE_MANAGER_POOL.release, visalib
+        )
+        if previous_release is not None:
+            previous_release()
 
         return resource, visabackend, resource_manager
 
@@ -269,39 +629,80 @@ class VisaInstrument(Instrument):
         if getattr(self, 'visa_handle', None):
             self.visa_handle.close()
 
-        if getattr(self, "visabackend", None) == "sim" and getattr(
-            self, "resource_manager", None
-        ):
-            # The pyvisa-sim visalib has a session attribute but the resource manager is not generic in the
-            # visalib type so we cannot get it in a type safe way
-            known_sessions = getattr(self.resource_manager.visalib, "sessions", ())
+        self._release_resource_manager_and_reset_sim()
+
+        super().close()
 
+    def _release_resource_manager_and_reset_sim(self) -> None:
+        release = getattr(self, "_release_resource_manager", None)
+        # calling the finalizer releases the resource manager and returns the
+        # number of remaining users the first time, None after that
+        remaining = release() if release is not None else None
+
+        if (
+            remaining == 0
+            and getattr(self, "visabackend", None) == "sim"
+            and getattr(self, "resource_manager", None)
+        ):
+            # if this instrument is the last one using the simulated visalib
+            # it's safe to reset the device
+            # work around for https://github.com/pyvisa/pyvisa-sim/issues/83
+            # see other issues for more context
+            # https://github.com/QCoDeS/Qcodes/issues/5356 and
+            # https://github.com/pyvisa/pyvisa-sim/issues/82
             try:
-                this_session = self.resource_manager.session
-            except InvalidSession:
-                # this may be triggered when the resource has already been closed
-                # in that case there is nothing that we can do.
-                this_session = None
-
-            session_found = this_session is not None and this_session in known_sessions
-
-            n_sessions = len(known_sessions)
-            # if this instrument is the last one or there are no connected instruments its safe to reset the device
-            if (session_found and n_sessions == 1) or n_sessions == 0:
-                # work around for https://github.com/pyvisa/pyvisa-sim/issues/83
-                # see other issues for more context
-                # https://github.com/QCoDeS/Qcodes/issues/5356 and
-                # https://github.com/pyvisa/pyvisa-sim/issues/82
-                try:
-                    self.resource_manager.visalib._init()
-                except AttributeError:
-                    warnings.warn(
-                        "The installed version of pyvisa-sim does not have an `_init` method "
-                        "in its visa library implementation. Cannot reset simulated instrument state. "
-                        "On reconnect the instrument may retain settings set in this session."
-                    )
+                self.resource_manager.visalib._init()
+            except AttributeError:
+                warnings.warn(
+                    "The installed version of pyvisa-sim does not have an `_init` method "
+                    "in its visa library implementation. Cannot reset simulated instrument state. "
+                    "On reconnect the instrument may retain settings set in this session."
+                )
+
+    @contextmanager
+    def batch(self) -> Iterator[VisaCommandBatch]:
+        """
+        Context manager within which commands written to the instrument are
+        queued and sent together, joined into SCPI program messages, rather
+        than one at a time. Queued commands are sent together with the next
+        query, and any remaining commands are sent when the context exits.
+        Use :meth:`VisaCommandBatch.prefetch` on the yielded batch to send
+        the queries of many parameters in a single message.
+
+        Note that errors caused by a queued command are only raised once the
+        command is actually sent. Entering the context while a batch is
+        already active reuses that batch. The batch only applies to the
+        thread that opened it, commands from other threads are sent
+        immediately.
+
+        Example:
+            ::
+
+                with instr.batch() as batch:
+                    instr.frequency(1e6)
+                    instr.power(-10)
+                    batch.prefetch([instr.frequency, instr.power])
+                    frequency = instr.frequency()
+                    power = instr.power()
+
+        Yields:
+            The active batch.
+        """
+        active_batch = self.active_batch
+        if active_batch is not None:
+            yield active_batch
+            return
+        batch = self._batch_state.batch = VisaCommandBatch(self)
+        try:
+            yield batch
+        finally:
+            self._batch_state.batch = None
+            batch.flush()
 
-        super().close()
+    @property
+    def active_batch(self) -> VisaCommandBatch | None:
+        """The batch opened by the current thread, if any."""
+        return getattr(self._batch_state, "batch", None)
 
     def write_raw(self, cmd: str) -> None:
         """
@@ -310,8 +711,15 @@ class VisaInstrument(Instrument):
         Args:
             cmd: The command to send to the instrument.
         """
+        batch = self.active_batch
+        if batch is not None:
+            batch.write(cmd)
+        else:
+            self._write_unbatched(cmd)
+
+    def _write_unbatched(self, cmd: str) -> None:
         with DelayedKeyboardInterrupt():
-            self.visa_log.debug(f"Writing: {cmd}")
+            self.visa_log.debug("Writing: %s", cmd)
             self.visa_handle.write(cmd)
 
     def ask_raw(self, cmd: str) -> str:
@@ -324,12 +732,49 @@ class VisaInstrument(Instrument):
         Returns:
             str: The instrument's response.
         """
+        batch = self.active_batch
+        if batch is not None:
+            return batch.ask(cmd)
+        return self._ask_unbatched(cmd)
+
+    def _ask_unbatched(self, cmd: str) -> str:
         with DelayedKeyboardInterrupt():
-            self.visa_log.debug(f"Querying: {cmd}")
+            self.visa_log.debug("Querying: %s", cmd)
             response = self.visa_handle.query(cmd)
-            self.visa_log.debug(f"Response: {response}")
+            self.visa_log.debug("Response: %s", response)
         return response
 
+    def ask_binary_raw(
+        self,
+        cmd: str,
+        dtype: npt.DTypeLike = np.float32,
+        is_big_endian: bool = False,
+    ) -> np.ndarray:
+        """
+        Low-level interface to ``visa_handle.query_binary_values``.
+
+        Args:
+            cmd: The command to send to the instrument.
+            dtype: The dtype of the values in the IEEE 488.2 binary block
+                returned by the instrument.
+            is_big_endian: Whether the values are sent most significant
+                byte first.
+
+        Returns:
+            The values in the binary block of the instrument's response.
+        """
+        datatype = struct_format(dtype)
+        with DelayedKeyboardInterrupt():
+            self.visa_log.debug("Querying binary block: %s", cmd)
+            response = self.visa_handle.query_binary_values(
+                cmd,
+                datatype=datatype,  # type: ignore[arg-type]
+                is_big_endian=is_big_endian,
+                container=np.array,
+            )
+            self.visa_log.debug("Response: binary block of %d values", len(response))
+        return np.asarray(response)
+
     def snapshot_base(
         self,
         update: bool | None = True,
@@ -355,8 +800,22 @@ class VisaInstrument(Instrument):
         Returns:
             dict: base snapshot
         """
-        snap = super().snapshot_base(update=update,
-                                     params_to_skip_update=params_to_skip_update)
+        if self.supports_batched_queries and update is not False:
+            with self.batch() as batch:
+                batch.prefetch(
+                    self._snapshot_parameters_to_update(
+                        self, update, params_to_skip_update or ()
+                    )
+                )
+                snap = super().snapshot_base(
+                    update=update, params_to_skip_update=params_to_skip_update
+                )
+                # responses that were not used must not answer later queries
+                batch.discard_prefetched()
+        else:
+            snap = super().snapshot_base(
+                update=update, params_to_skip_update=params_to_skip_update
+            )
 
         snap["address"] = self._address
         snap["terminator"] = self.visa_handle.read_termination
@@ -365,3 +824,29 @@ class VisaInstrument(Instrument):
         snap["timeout"] = self.timeout.get()
 
         return snap
+
+    @classmethod
+    def _snapshot_parameters_to_update(
+        cls,
+        instrument: InstrumentBase,
+        update: bool | None,
+        params_to_skip_update: Sequence[str],
+    ) -> Iterator[ParameterBase]:
+        """
+        Yield the parameters of an instrument and its submodules that will
+        be gotten when taking a snapshot with the given arguments.
+        """
+        for name, param in instrument.parameters.items():
+            if (
+                param.snapshot_exclude
+                or not param.snapshot_value
+                or not param._snapshot_get
+                or not param.gettable
+                or name in params_to_skip_update
+            ):
+                continue
+            if update or not param.cache.valid:
+                yield param
+        for submodule in instrument.submodules.values():
+            if isinstance(submodule, InstrumentBase):
+                yield from cls._snapshot_parameters_to_update(submodule, update, ())
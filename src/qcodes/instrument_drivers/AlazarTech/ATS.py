@@ -13,6 +13,7 @@ import numpy as np
 from qcodes.instrument import Instrument
 
 from .ats_api import AlazarATSAPI
+from .buffer_pipeline import BufferPipeline, BufferPipelineStats
 from .constants import NUMBER_OF_CHANNELS_FROM_BYTE_REPR, max_buffer_size
 from .helpers import CapabilityHelper
 from .utils import TraceParameter
@@ -144,6 +145,11 @@ class AlazarTech_ATS(Instrument):
         self.capability = CapabilityHelper(self.api, self._handle)
 
         self.buffer_list: list[Buffer] = []
+        self.buffer_pipeline_stats: BufferPipelineStats | None = None
+        """
+        Statistics of the buffer processing of the last acquisition that
+        used ``processing_workers``.
+        """
 
     def get_idn(self) -> dict[str, str | int | None]:  # type: ignore[override]
         # TODO return type is inconsistent with the super class. We should consider
@@ -307,6 +313,7 @@ class AlazarTech_ATS(Instrument):
         allocated_buffers: int | None = None,
         buffer_timeout: int | None = None,
         acquisition_controller: AcquisitionController[OutputType] | None = None,
+        processing_workers: int | None = None,
     ) -> OutputType:
         """
         perform a single acquisition with the Alazar board, and set certain
@@ -330,6 +337,16 @@ class AlazarTech_ATS(Instrument):
             buffer_timeout:
             acquisition_controller: An instance of an acquisition controller
                 that handles the dataflow of an acquisition
+            processing_workers: If given, buffers that are recycled during
+                the acquisition are processed by this many worker threads
+                instead of on the thread waiting for the board, and are
+                posted to the board again once processed. If the
+                acquisition controller implements
+                :meth:`AcquisitionInterface.process_buffer` the buffers are
+                processed in parallel, otherwise
+                :meth:`AcquisitionInterface.handle_buffer` is called on a
+                single worker in buffer order. Statistics of the processing
+                are stored in :attr:`buffer_pipeline_stats`.
 
         Returns:
             Whatever is given by acquisition_controller.post_acquire method
@@ -476,6 +493,12 @@ class AlazarTech_ATS(Instrument):
         allocated_buffers = cast(int, self.allocated_buffers())
         buffer_recycling = buffers_per_acquisition > allocated_buffers
 
+        pipeline: BufferPipeline[Buffer] | None = None
+        if buffer_recycling and processing_workers:
+            pipeline = self._make_buffer_pipeline(
+                acquisition_controller, processing_workers
+            )
+
         # post buffers to Alazar
         try:
             for _ in range(allocated_buffers):
@@ -501,6 +524,11 @@ class AlazarTech_ATS(Instrument):
                 # Wait for the buffer at the head of the list of available
                 # buffers to be filled by the board.
                 buf = self.buffer_list[buffers_completed % allocated_buffers]
+                if pipeline is not None:
+                    # the board can only fill the buffer once it has been
+                    # processed and posted again
+                    while pipeline.pending >= allocated_buffers:
+                        self._post_buffer(pipeline.complete_next())
                 self.api.wait_async_buffer_complete(
                     self._handle,
                     ctypes.cast(buf.addr, ctypes.c_void_p),
@@ -511,16 +539,20 @@ class AlazarTech_ATS(Instrument):
 
                 # if buffers must be recycled, extract data and repost them
                 # otherwise continue to next buffer
-                if buffer_recycling:
+                if pipeline is not None:
+                    pipeline.submit(buf, buf.buffer, buffers_completed)
+                    while (done := pipeline.complete_next(block=False)) is not None:
+                        self._post_buffer(done)
+                elif buffer_recycling:
                     acquisition_controller.handle_buffer(
                         buf.buffer, buffers_completed)
-                    self.api.post_async_buffer(
-                        self._handle,
-                        ctypes.cast(buf.addr, ctypes.c_void_p),
-                        buf.size_bytes
-                    )
+                    self._post_buffer(buf)
                 buffers_completed += 1
                 bytes_transferred += buf.size_bytes
+        except BaseException:
+            if pipeline is not None:
+                pipeline.close()
+            raise
         finally:
             # stop measurement here
             done_capture = time.perf_counter()
@@ -528,6 +560,14 @@ class AlazarTech_ATS(Instrument):
 
         time_done_abort = time.perf_counter()
 
+        if pipeline is not None:
+            try:
+                while pipeline.complete_next() is not None:
+                    pass
+            finally:
+                pipeline.close()
+            self.buffer_pipeline_stats = pipeline.stats
+
         # -----cleanup here-----
         # extract data if not yet done
         if not buffer_recycling:
@@ -586,12 +626,35 @@ class AlazarTech_ATS(Instrument):
             self.log.debug(f"Capture took {capture_time}")
             self.log.debug(f"abort took {abort_time}")
             self.log.debug(f"handling took {handling_time}")
+            if pipeline is not None:
+                self.log.debug("buffer processing: %s", pipeline.stats)
             self.log.debug(f"free mem took {free_mem_time}")
             self.log.debug(f"tot acquire time is {tot_time}")
 
         # return result
         return acquisition_controller.post_acquire()
 
+    def _make_buffer_pipeline(
+        self, acquisition_controller: AcquisitionInterface[Any], workers: int
+    ) -> BufferPipeline[Buffer]:
+        if (
+            type(acquisition_controller).process_buffer
+            is AcquisitionInterface.process_buffer
+        ):
+            # handle_buffer may rely on being called in order
+            return BufferPipeline(acquisition_controller.handle_buffer, workers=1)
+        return BufferPipeline(
+            acquisition_controller.process_buffer,
+            acquisition_controller.handle_processed_buffer,
+            workers=workers,
+        )
+
+    def _post_buffer(self, buf: Buffer | None) -> None:
+        assert buf is not None
+        self.api.post_async_buffer(
+            self._handle, ctypes.cast(buf.addr, ctypes.c_void_p), buf.size_bytes
+        )
+
     def _set_if_present(self, param_name: str, value: str | float | None) -> None:
         if value is not None:
             parameter = self.parameters[param_name]
@@ -759,9 +822,10 @@ class Buffer:
                 0, ctypes.c_long(size_bytes), MEM_COMMIT, PAGE_READWRITE)
         else:
             self._allocated = True
-            ctypes_array = (c_sample_type *
-                            (size_bytes // bytes_per_sample))()
-            self.addr = ctypes.addressof(ctypes_array)
+            # keep a reference to the array owning the memory, the array
+            # created from its address below does not keep it alive
+            self._memory = (c_sample_type * (size_bytes // bytes_per_sample))()
+            self.addr = ctypes.addressof(self._memory)
 
         ctypes_array = (c_sample_type *
                         (size_bytes // bytes_per_sample)).from_address(self.addr)
@@ -806,7 +870,11 @@ class AcquisitionInterface(Generic[OutputType]):
         - Call to :meth:`AcquisitionInterface.pre_acquire`
         - Loop over all buffers that need to be acquired
           dump each buffer to acquisitioncontroller.handle_buffer
-          (only if buffers need to be recycled to finish the acquisiton)
+          (only if buffers need to be recycled to finish the acquisiton).
+          If ``processing_workers`` is passed to
+          :meth:`AlazarTech_ATS.acquire` this happens on worker threads,
+          using :meth:`AcquisitionInterface.process_buffer` and
+          :meth:`AcquisitionInterface.handle_processed_buffer` if implemented.
         - Dump remaining buffers to :meth:`AcquisitionInterface.handle_buffer`
           alazar internals
         - Return return value from :meth:`AcquisitionController.post_acquire`
@@ -841,6 +909,38 @@ class AcquisitionInterface(Generic[OutputType]):
         raise NotImplementedError(
             'This method should be implemented in a subclass')
 
+    def process_buffer(self, buffer: np.ndarray, buffer_number: int) -> Any:
+        """
+        Implement this method together with :meth:`handle_processed_buffer`
+        to process buffers in parallel when passing ``processing_workers``
+        to :meth:`AlazarTech_ATS.acquire`. It is called on a worker thread,
+        possibly concurrently with other buffers, and should only reduce
+        the buffer, e.g. demodulate it, and return the result. The buffer
+        is reused once this method returns so the result must not be a view
+        of it.
+
+        Args:
+            buffer: np.array with the data from the Alazar card
+            buffer_number: counter for which buffer we are handling
+
+        Returns:
+            The processed data passed to :meth:`handle_processed_buffer`.
+        """
+        raise NotImplementedError(
+            'This method should be implemented in a subclass')
+
+    def handle_processed_buffer(self, result: Any, buffer_number: int) -> None:
+        """
+        Store the result of :meth:`process_buffer`. Called in buffer order on
+        the thread performing the acquisition.
+
+        Args:
+            result: The value returned by :meth:`process_buffer`.
+            buffer_number: counter for which buffer we are handling
+        """
+        raise NotImplementedError(
+            'This method should be implemented in a subclass')
+
     def post_acquire(self) -> OutputType:
         """
         This method should return any information you want to save from this
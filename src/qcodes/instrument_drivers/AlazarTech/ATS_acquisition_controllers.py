@@ -1,9 +1,82 @@
+from __future__ import annotations
+
 import math
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
-from .ATS import AcquisitionController
+from .ATS import AcquisitionController, AcquisitionInterface
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from qcodes.dataset.measurements import DataSaver, Measurement
+
+    from .ATS import AlazarTech_ATS
+
+
+def buffer_records(
+    buffer: np.ndarray,
+    records_per_buffer: int,
+    samples_per_record: int,
+    number_of_channels: int,
+    interleaved: bool = False,
+) -> np.ndarray:
+    """
+    Return a view of a buffer acquired in NPT mode with the shape
+    (records, samples, channels). No data is copied.
+
+    Args:
+        buffer: The one dimensional buffer from the Alazar card.
+        records_per_buffer: Number of records in the buffer.
+        samples_per_record: Number of samples in each record.
+        number_of_channels: Number of channels in the buffer.
+        interleaved: Whether the samples of the channels are interleaved,
+            i.e. whether ``interleave_samples`` was enabled. Otherwise all
+            records of a channel follow those of the previous channel.
+    """
+    if interleaved:
+        return buffer.reshape(
+            records_per_buffer, samples_per_record, number_of_channels
+        )
+    return buffer.reshape(
+        number_of_channels, records_per_buffer, samples_per_record
+    ).transpose(1, 2, 0)
+
+
+def _demodulation_weights(
+    samples_per_record: int,
+    demodulation_frequencies: np.ndarray,
+    sample_rate: float,
+) -> np.ndarray:
+    """
+    Return the cosines of the given frequencies followed by their sines at
+    the samples of a record, with the shape (samples, 2 * frequencies).
+    Multiplying records with the weights gives the real and imaginary parts
+    of their discrete Fourier transform at the frequencies.
+    """
+    angles = np.outer(
+        np.arange(samples_per_record),
+        2 * np.pi * demodulation_frequencies / sample_rate,
+    )
+    return np.concatenate([np.cos(angles), np.sin(angles)], axis=1)
+
+
+def _complex_amplitudes(demodulated: np.ndarray, samples_per_record: int) -> np.ndarray:
+    # the factor of 2 in the amplitude is due to the fact that there is
+    # a negative frequency as well
+    n_frequencies = demodulated.shape[-1] // 2
+    return (
+        2
+        * (demodulated[..., :n_frequencies] + 1j * demodulated[..., n_frequencies:])
+        / samples_per_record
+    )
+
+
+def _max_sample(alazar: AlazarTech_ATS) -> int:
+    # samples are transferred padded to whole bytes
+    _, bits_per_sample = alazar.api.get_channel_info_(alazar._handle)
+    return 2 ** (8 * ((bits_per_sample + 7) // 8)) - 1
 
 
 # DFT AcquisitionController
@@ -38,9 +111,9 @@ class DemodulationAcquisitionController(AcquisitionController[float]):
         self.records_per_buffer = 0
         self.buffers_per_acquisition = 0
         self.number_of_channels = 2
-        self.cos_list: Optional[np.ndarray] = None
-        self.sin_list: Optional[np.ndarray] = None
-        self.buffer: Optional[np.ndarray] = None
+        self.cos_list: np.ndarray | None = None
+        self.sin_list: np.ndarray | None = None
+        self.buffer: np.ndarray | None = None
         # make a call to the parent class and by extension, create the parameter
         # structure of this class
         super().__init__(name, alazar_name, **kwargs)
@@ -95,7 +168,7 @@ class DemodulationAcquisitionController(AcquisitionController[float]):
         pass
 
     def handle_buffer(
-        self, buffer: np.ndarray, buffer_number: Optional[int] = None
+        self, buffer: np.ndarray, buffer_number: int | None = None
     ) -> None:
         """
         See AcquisitionController
@@ -114,17 +187,15 @@ class DemodulationAcquisitionController(AcquisitionController[float]):
         # average all records in a buffer
         records_per_acquisition = (1. * self.buffers_per_acquisition *
                                    self.records_per_buffer)
-        recordA = np.zeros(self.samples_per_record)
-        for i in range(self.records_per_buffer):
-            i0 = i * self.samples_per_record
-            i1 = i0 + self.samples_per_record
-            recordA += self.buffer[i0:i1] / records_per_acquisition
-
-        recordB = np.zeros(self.samples_per_record)
-        for i in range(self.records_per_buffer):
-            i0 = i * self.samples_per_record + len(self.buffer) // 2
-            i1 = i0 + self.samples_per_record
-            recordB += self.buffer[i0:i1] / records_per_acquisition
+        records = buffer_records(
+            self.buffer,
+            self.records_per_buffer,
+            self.samples_per_record,
+            self.number_of_channels,
+        )
+        recordA, recordB = (
+            records.sum(axis=0) / records_per_acquisition
+        ).T
 
         if self.number_of_channels == 2:
             # fit channel A and channel B
@@ -164,3 +235,333 @@ class Demodulation_AcquisitionController(DemodulationAcquisitionController):
     """
 
     pass
+
+
+class DemodulatingAveragingController(AcquisitionInterface[np.ndarray]):
+    """
+    Acquisition controller that demodulates the records of an NPT mode
+    acquisition at one or more intermediate frequencies and averages the
+    result over all buffers, and optionally over all records.
+
+    The records of each buffer are reduced as a view with the shape
+    (records, samples, channels) of the buffer into preallocated
+    accumulators. When averaging over records, the records of a buffer are
+    summed as integers and the average record is demodulated once after the
+    acquisition, which is exact since demodulation is linear. Otherwise
+    each buffer is demodulated by a single matrix multiplication with the
+    cosines and sines of all frequencies.
+
+    The controller implements :meth:`process_buffer` so the buffers can be
+    processed in parallel by passing ``processing_workers`` to
+    :meth:`AlazarTech_ATS.acquire`.
+
+    Args:
+        alazar: The Alazar instrument performing the acquisition.
+        demodulation_frequencies: The frequencies in Hz to demodulate at.
+        average_records: Whether to average over the records of a buffer.
+        sample_offset: The sample value corresponding to 0 V. Defaults to
+            the middle of the range of the transferred samples, e.g. 127.5
+            for 8 bit samples.
+
+    Returns:
+        From :meth:`post_acquire`, the complex amplitudes of the
+        frequencies in units of samples, with the shape (channels,
+        frequencies) when averaging over records and (records, channels,
+        frequencies) otherwise. The absolute value is the amplitude and
+        the angle the phase of the signal at each frequency.
+    """
+
+    def __init__(
+        self,
+        alazar: AlazarTech_ATS,
+        demodulation_frequencies: Sequence[float],
+        average_records: bool = True,
+        sample_offset: float | None = None,
+    ):
+        self._alazar = alazar
+        self.demodulation_frequencies = np.asarray(
+            demodulation_frequencies, dtype=float
+        )
+        self.average_records = average_records
+        self.sample_offset = sample_offset
+        self.records_per_buffer = 0
+        self.samples_per_record = 0
+        self.number_of_channels = 0
+        self.interleaved = False
+        self._offset = 0.0
+        self._sum_dtype: type[np.unsignedinteger[Any]] = np.uint64
+        self._weights: np.ndarray | None = None
+        self._accumulator: np.ndarray | None = None
+        self._scratch: np.ndarray | None = None
+        self._buffers_handled = 0
+
+    def pre_start_capture(self) -> None:
+        alazar = self._alazar
+        if alazar.mode.get() != "NPT":
+            raise RuntimeError(
+                f"{type(self).__name__} only supports acquisitions in NPT mode"
+            )
+        self.records_per_buffer = alazar.records_per_buffer.get()
+        self.samples_per_record = alazar.samples_per_record.get()
+        self.number_of_channels = alazar.get_num_channels(
+            alazar.channel_selection.raw_value
+        )
+        self.interleaved = alazar.interleave_samples.get() == "ENABLED"
+        max_sample = _max_sample(alazar)
+        if self.sample_offset is None:
+            self._offset = max_sample / 2
+        else:
+            self._offset = self.sample_offset
+        self._weights = _demodulation_weights(
+            self.samples_per_record,
+            self.demodulation_frequencies,
+            alazar.get_sample_rate(),
+        )
+
+        if self.average_records:
+            # summing in 32 bit is much faster if it cannot overflow
+            fits_32_bit = self.records_per_buffer * max_sample < 2**32
+            self._sum_dtype = np.uint32 if fits_32_bit else np.uint64
+            self._accumulator = np.zeros(
+                (self.samples_per_record, self.number_of_channels), dtype=np.uint64
+            )
+            # the sums are only fast if they are in the memory layout of
+            # the buffer
+            if self.interleaved:
+                self._scratch = np.empty(
+                    (self.samples_per_record, self.number_of_channels),
+                    dtype=self._sum_dtype,
+                )
+            else:
+                self._scratch = np.empty(
+                    (self.number_of_channels, self.samples_per_record),
+                    dtype=self._sum_dtype,
+                ).T
+        else:
+            shape = (
+                self.records_per_buffer,
+                self.number_of_channels,
+                self._weights.shape[1],
+            )
+            self._accumulator = np.zeros(shape)
+            self._scratch = np.empty(shape)
+        self._buffers_handled = 0
+
+    def _reduce(self, buffer: np.ndarray, out: np.ndarray | None) -> np.ndarray:
+        records = buffer_records(
+            buffer,
+            self.records_per_buffer,
+            self.samples_per_record,
+            self.number_of_channels,
+            self.interleaved,
+        )
+        if self.average_records:
+            return np.sum(records, axis=0, dtype=self._sum_dtype, out=out)
+        assert self._weights is not None
+        return np.matmul(records.transpose(0, 2, 1), self._weights, out=out)
+
+    def handle_buffer(
+        self, buffer: np.ndarray, buffer_number: int | None = None
+    ) -> None:
+        self.handle_processed_buffer(
+            self._reduce(buffer, out=self._scratch), buffer_number or 0
+        )
+
+    def process_buffer(self, buffer: np.ndarray, buffer_number: int) -> np.ndarray:
+        return self._reduce(buffer, out=None)
+
+    def handle_processed_buffer(self, result: np.ndarray, buffer_number: int) -> None:
+        assert self._accumulator is not None
+        self._accumulator += result
+        self._buffers_handled += 1
+
+    def post_acquire(self) -> np.ndarray:
+        assert self._accumulator is not None
+        assert self._weights is not None
+        if self.average_records:
+            n_averaged = self._buffers_handled * self.records_per_buffer
+            mean_record = self._accumulator / n_averaged - self._offset
+            demodulated = mean_record.T @ self._weights
+        else:
+            # the offset only contributes through the sums of the weights
+            demodulated = (
+                self._accumulator / self._buffers_handled
+                - self._offset * self._weights.sum(axis=0)
+            )
+        return _complex_amplitudes(demodulated, self.samples_per_record)
+
+
+class DataSaverStreamingController(AcquisitionInterface[int]):
+    """
+    Acquisition controller that streams the records of each buffer of an NPT
+    mode acquisition into a :class:`.DataSaver` while acquiring, so that
+    acquisitions much larger than the available memory can be recorded.
+
+    For each buffer one row is added to the dataset holding the buffer
+    number and, for each channel, an array with either the raw records with
+    the shape (records, samples) or, if ``demodulation_frequencies`` is
+    given, the complex amplitudes of each record at the frequencies with
+    the shape (records, frequencies).
+
+    The parameters must be registered with :meth:`register_parameters`
+    before the measurement is started, and the datasaver assigned to
+    :attr:`datasaver` before acquiring. Each result is flushed to the
+    database as soon as it has been added, so memory use is bounded when
+    fewer buffers are allocated than acquired, such that buffers are
+    recycled, and the measurement is run with
+    ``write_in_background=True``, which writes to the database on a
+    background thread, and ``in_memory_cache=False``. Every
+    ``max_pending_buffers`` buffers the acquisition waits for the
+    background writer to catch up, so at most that many results are queued.
+
+    The results are computed in :meth:`process_buffer` so the buffers can be
+    processed in parallel by passing ``processing_workers`` to
+    :meth:`AlazarTech_ATS.acquire`.
+
+    Args:
+        alazar: The Alazar instrument performing the acquisition.
+        name: Prefix of the names of the parameters in the dataset.
+        demodulation_frequencies: If given, the frequencies in Hz to
+            demodulate the records at instead of storing the raw records.
+        max_pending_buffers: Maximal number of results waiting to be written
+            to the database by the background writer.
+        sample_offset: The sample value corresponding to 0 V, used when
+            demodulating. Defaults to the middle of the range of the
+            transferred samples.
+
+    Returns:
+        From :meth:`post_acquire`, the number of buffers added to the
+        dataset.
+    """
+
+    def __init__(
+        self,
+        alazar: AlazarTech_ATS,
+        name: str = "alazar",
+        demodulation_frequencies: Sequence[float] | None = None,
+        max_pending_buffers: int = 16,
+        sample_offset: float | None = None,
+    ):
+        self._alazar = alazar
+        self.name = name
+        self.demodulation_frequencies = (
+            None
+            if demodulation_frequencies is None
+            else np.asarray(demodulation_frequencies, dtype=float)
+        )
+        self.max_pending_buffers = max_pending_buffers
+        self.sample_offset = sample_offset
+        self.datasaver: DataSaver | None = None
+        self.records_per_buffer = 0
+        self.samples_per_record = 0
+        self.interleaved = False
+        self._result_names: tuple[str, ...] = ()
+        self._weights: np.ndarray | None = None
+        self._offset_weights: np.ndarray | None = None
+        self._buffers_written = 0
+
+    @property
+    def buffer_name(self) -> str:
+        """Name of the buffer number in the dataset."""
+        return f"{self.name}_buffer"
+
+    def result_names(self) -> tuple[str, ...]:
+        """
+        Names of the results of the selected channels in the dataset, e.g.
+        ``alazar_A`` and ``alazar_B``.
+        """
+        return tuple(
+            f"{self.name}_{channel}" for channel in self._alazar.channel_selection.get()
+        )
+
+    def register_parameters(self, measurement: Measurement) -> None:
+        """
+        Register the buffer number and the results of the currently
+        selected channels with a measurement.
+        """
+        measurement.register_custom_parameter(self.buffer_name, label="Buffer")
+        for result_name in self.result_names():
+            measurement.register_custom_parameter(
+                result_name, setpoints=(self.buffer_name,), paramtype="array"
+            )
+
+    def pre_start_capture(self) -> None:
+        alazar = self._alazar
+        if self.datasaver is None:
+            raise RuntimeError(
+                f"Assign a datasaver to {type(self).__name__}.datasaver "
+                f"before acquiring"
+            )
+        if alazar.mode.get() != "NPT":
+            raise RuntimeError(
+                f"{type(self).__name__} only supports acquisitions in NPT mode"
+            )
+        self.records_per_buffer = alazar.records_per_buffer.get()
+        self.samples_per_record = alazar.samples_per_record.get()
+        self.interleaved = alazar.interleave_samples.get() == "ENABLED"
+        self._result_names = self.result_names()
+        if self.demodulation_frequencies is not None:
+            offset = (
+                _max_sample(alazar) / 2
+                if self.sample_offset is None
+                else self.sample_offset
+            )
+            self._weights = _demodulation_weights(
+                self.samples_per_record,
+                self.demodulation_frequencies,
+                alazar.get_sample_rate(),
+            )
+            self._offset_weights = offset * self._weights.sum(axis=0)
+        self._buffers_written = 0
+
+    def process_buffer(
+        self, buffer: np.ndarray, buffer_number: int
+    ) -> tuple[np.ndarray, ...]:
+        records = buffer_records(
+            buffer,
+            self.records_per_buffer,
+            self.samples_per_record,
+            len(self._result_names),
+            self.interleaved,
+        )
+        if self._weights is None:
+            # copy since the buffer is reused
+            return tuple(
+                np.ascontiguousarray(records[..., channel])
+                for channel in range(records.shape[2])
+            )
+        demodulated = (
+            np.matmul(records.transpose(0, 2, 1), self._weights)
+            - self._offset_weights
+        )
+        amplitudes = _complex_amplitudes(demodulated, self.samples_per_record)
+        return tuple(
+            amplitudes[:, channel] for channel in range(amplitudes.shape[1])
+        )
+
+    def handle_processed_buffer(
+        self, result: tuple[np.ndarray, ...], buffer_number: int
+    ) -> None:
+        datasaver = self.datasaver
+        assert datasaver is not None
+        datasaver.add_result(
+            (self.buffer_name, buffer_number), *zip(self._result_names, result)
+        )
+        self._buffers_written += 1
+        # flush every buffer such that results are not held in memory
+        # until the write period has passed, and wait for the background
+        # writer every max_pending_buffers buffers
+        datasaver.flush_data_to_database(
+            block=self._buffers_written % self.max_pending_buffers == 0
+        )
+
+    def handle_buffer(
+        self, buffer: np.ndarray, buffer_number: int | None = None
+    ) -> None:
+        assert buffer_number is not None
+        self.handle_processed_buffer(
+            self.process_buffer(buffer, buffer_number), buffer_number
+        )
+
+    def post_acquire(self) -> int:
+        return self._buffers_written
@@ -3,7 +3,11 @@ from .ATS9360 import AlazarTechATS9360
 from .ATS9373 import AlazarTechATS9373
 from .ATS9440 import AlazarTechATS9440
 from .ATS9870 import AlazarTechATS9870
-from .ATS_acquisition_controllers import DemodulationAcquisitionController
+from .ATS_acquisition_controllers import (
+    DataSaverStreamingController,
+    DemodulatingAveragingController,
+    DemodulationAcquisitionController,
+)
 
 __all__ = [
     "AcquisitionController",
@@ -11,5 +15,7 @@ __all__ = [
     "AlazarTechATS9373",
     "AlazarTechATS9440",
     "AlazarTechATS9870",
+    "DataSaverStreamingController",
+    "DemodulatingAveragingController",
     "DemodulationAcquisitionController",
 ]
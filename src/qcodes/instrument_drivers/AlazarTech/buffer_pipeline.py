@@ -0,0 +1,157 @@
+"""
+Processing of the buffers of an Alazar acquisition on worker threads, such
+that the thread waiting for the board to fill buffers is not stalled by
+slow processing.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+
+    import numpy as np
+
+_BufferT = TypeVar("_BufferT")
+
+
+@dataclass
+class BufferPipelineStats:
+    """
+    Statistics of the buffer processing of an acquisition, which show if
+    the processing keeps up with the board.
+    """
+
+    buffers_processed: int = 0
+    """Number of buffers that have been processed."""
+    max_pending: int = 0
+    """
+    Largest number of buffers that were waiting for or undergoing
+    processing at the same time. If this reaches the number of allocated
+    buffers the board has no buffers left to fill.
+    """
+    stalls: int = 0
+    """
+    Number of times the acquisition had to wait for the processing of a
+    buffer before it could be posted to the board again.
+    """
+    stall_time: float = 0.0
+    """Total time in seconds the acquisition waited for processing."""
+    processing_time: float = 0.0
+    """Total time in seconds spent processing buffers, summed over workers."""
+
+
+class BufferPipeline(Generic[_BufferT]):
+    """
+    Hands filled buffers to a pool of worker threads for processing, and
+    hands them back in the order they were submitted once they have been
+    processed, so that they can be posted to the board again.
+
+    The number of buffers in the pipeline is bounded by the caller, which
+    must wait for the oldest buffer to complete with :meth:`complete_next`
+    before reusing it.
+
+    Args:
+        process: Function called on a worker thread with the data of a
+            buffer and the number of the buffer. Must not keep a reference to
+            the data, since the buffer is reused once the function returns.
+        handle_result: Optional function called in buffer order on the
+            thread calling :meth:`complete_next` with the value returned by
+            ``process`` and the number of the buffer.
+        workers: Number of worker threads. Buffers are processed in order
+            if this is 1.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[np.ndarray, int], Any],
+        handle_result: Callable[[Any, int], None] | None = None,
+        workers: int = 1,
+    ):
+        if workers < 1:
+            raise ValueError(f"Need at least one worker, got {workers}")
+        self._process = process
+        self._handle_result = handle_result
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="alazar_buffer_processing"
+        )
+        self._pending: deque[tuple[_BufferT, int, Future[Any]]] = deque()
+        self._lock = threading.Lock()
+        self.stats = BufferPipelineStats()
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted buffers that have not been completed."""
+        return len(self._pending)
+
+    def _timed_process(self, data: np.ndarray, buffer_number: int) -> Any:
+        t_start = perf_counter()
+        try:
+            return self._process(data, buffer_number)
+        finally:
+            duration = perf_counter() - t_start
+            with self._lock:
+                self.stats.processing_time += duration
+
+    def submit(self, buffer: _BufferT, data: np.ndarray, buffer_number: int) -> None:
+        """
+        Submit a filled buffer for processing.
+
+        Args:
+            buffer: The buffer, returned by :meth:`complete_next` once it has
+                been processed.
+            data: The data of the buffer passed to ``process``.
+            buffer_number: The number of the buffer in the acquisition.
+        """
+        future = self._executor.submit(self._timed_process, data, buffer_number)
+        self._pending.append((buffer, buffer_number, future))
+        self.stats.max_pending = max(self.stats.max_pending, len(self._pending))
+
+    def complete_next(self, block: bool = True) -> _BufferT | None:
+        """
+        Complete the processing of the oldest submitted buffer by handing
+        its result to ``handle_result``.
+
+        Args:
+            block: Whether to wait for the processing of the buffer to
+                finish.
+
+        Returns:
+            The completed buffer, which can be reused. None if no buffer has
+            been submitted or, if not blocking, the oldest buffer is still
+            being processed.
+
+        Raises:
+            Exception: Any exception raised while processing the buffer.
+        """
+        if not self._pending:
+            return None
+        buffer, buffer_number, future = self._pending[0]
+        if not future.done():
+            if not block:
+                return None
+            t_start = perf_counter()
+            future.exception()
+            self.stats.stalls += 1
+            self.stats.stall_time += perf_counter() - t_start
+        self._pending.popleft()
+        result = future.result()
+        if self._handle_result is not None:
+            self._handle_result(result, buffer_number)
+        self.stats.buffers_processed += 1
+        return buffer
+
+    def close(self) -> None:
+        """
+        Cancel the processing of buffers that has not started and wait for
+        the workers to finish.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._pending.clear()
@@ -11,6 +11,8 @@ from qcodes.parameters import (
 )
 from qcodes.validators import Arrays, Bool, Enum, Ints, Lists, Numbers
 
+from ._Keithley_buffer import _KeithleyBuffer
+
 if TYPE_CHECKING:
     from types import TracebackType
 
@@ -43,7 +45,7 @@ class ParameterWithSetpointsCustomized(ParameterWithSetpoints):
         return self._user_selected_data
 
 
-class Keithley2450Buffer(InstrumentChannel):
+class Keithley2450Buffer(_KeithleyBuffer):
     """
     Treat the reading buffer as a submodule, similar to Sense and Source
     """
@@ -168,19 +170,14 @@ class Keithley2450Buffer(InstrumentChannel):
             data elements from the reading buffer
 
         """
-        if (not self.elements()) or readings_only:
-            raw_data = self.ask(
-                f":TRACe:DATA? {start_idx}, {end_idx}, '{self.buffer_name}'"
-            )
-            return [float(i) for i in raw_data.split(",")]
-        elements = [self.buffer_elements[element] for element in self.elements()]
-        raw_data_with_extra = self.ask(
-            f":TRACe:DATA? {start_idx}, "
-            f"{end_idx}, "
-            f"'{self.buffer_name}', "
-            f"{','.join(elements)}"
-        )
-        return raw_data_with_extra.split(",")
+        if readings_only:
+            elements = []
+        else:
+            elements = [self.buffer_elements[element] for element in self.elements()]
+        data = self._ask_data(start_idx, end_idx, elements)
+        if not elements:
+            return np.array(data, dtype=float).tolist()
+        return data
 
     def clear_buffer(self) -> None:
         """
@@ -336,7 +333,7 @@ class Keithley2450Sense(InstrumentChannel):
         # Clear the trace so we can be assured that a subsequent measurement
         # will not be contaminated with data from this run.
         buffer.clear_buffer()
-        return np.array([float(i) for i in raw_data])
+        return np.array(raw_data, dtype=float)
 
     def auto_zero_once(self) -> None:
         """
@@ -13,6 +13,8 @@ from qcodes.parameters import (
 )
 from qcodes.validators import Arrays, Enum, Ints, Lists, Numbers
 
+from ._Keithley_buffer import _KeithleyBuffer
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from types import TracebackType
@@ -76,7 +78,7 @@ class GeneratedSetPoints(Parameter):
         return np.linspace(start, stop, n_points)
 
 
-class Keithley7510Buffer(InstrumentChannel):
+class Keithley7510Buffer(_KeithleyBuffer):
     """
     Treat the reading buffer as a submodule, similar to Sense.
     """
@@ -321,23 +323,8 @@ class Keithley7510Buffer(InstrumentChannel):
             "measurement_unit": "str",
         }
 
-        if not self.elements():
-            raw_data = self.ask(
-                f":TRACe:DATA? "
-                f"{self.data_start()}, "
-                f"{self.data_end()}, "
-                f"'{self.short_name}'"
-            )
-        else:
-            elements = [self.buffer_elements[element] for element in self.elements()]
-            raw_data = self.ask(
-                f":TRACe:DATA? {self.data_start()}, "
-                f"{self.data_end()}, "
-                f"'{self.short_name}', "
-                f"{','.join(elements)}"
-            )
-
-        all_data = raw_data.split(",")
+        scpi_elements = [self.buffer_elements[element] for element in self.elements()]
+        all_data = self._ask_data(self.data_start(), self.data_end(), scpi_elements)
 
         if len(self.elements()) == 0:
             elements = ["measurement"]
@@ -352,7 +339,7 @@ class Keithley7510Buffer(InstrumentChannel):
                 processed_data[element] = np.array(all_data[i::n_elements])
             else:
                 processed_data[element] = np.array(
-                    [float(v) for v in all_data[i::n_elements]]
+                    all_data[i::n_elements], dtype=float
                 )
 
         data = DataArray7510(
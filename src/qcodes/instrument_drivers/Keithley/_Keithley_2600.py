@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import logging
-import struct
 import sys
 import warnings
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
+from pyvisa import VisaIOError
 
 import qcodes.validators as vals
 from qcodes.instrument import Instrument, InstrumentChannel, VisaInstrument
@@ -173,20 +174,22 @@ class TimeTrace(ParameterWithSetpoints):
 
         mode_map = {"current": "i", "voltage": "v"}
 
-        script = [
-            f"{channel}.measure.count={npts}",
-            f"oldint={channel}.measure.interval",
-            f"{channel}.measure.interval={dt}",
+        body = [
+            f"{channel}.measure.count=npts",
+            f"local oldint={channel}.measure.interval",
+            f"{channel}.measure.interval=dt",
             f"{channel}.nvbuffer1.clear()",
             f"{channel}.measure.{mode_map[mode]}({channel}.nvbuffer1)",
             f"{channel}.measure.interval=oldint",
             f"{channel}.measure.count=1",
             "format.data = format.REAL32",
             "format.byteorder = format.LITTLEENDIAN",
-            f"printbuffer(1, {npts}, {channel}.nvbuffer1.readings)",
+            f"printbuffer(1, npts, {channel}.nvbuffer1.readings)",
         ]
 
-        return self.instrument._execute_lua(script, npts)
+        return self.instrument._execute_lua_function(
+            ("npts", "dt"), body, (npts, dt), npts
+        )
 
     def get_raw(self) -> np.ndarray:
 
@@ -694,36 +697,76 @@ class Keithley2600Channel(InstrumentChannel):
         else:
             raise ValueError(f"Invalid mode {mode}")
 
-        script = [
-            f"{channel}.measure.nplc = {nplc:.12f}",
+        # the script only depends on the channel and the mode, such that it
+        # is loaded onto the instrument once and reused for all sweeps
+        body = [
+            f"{channel}.measure.nplc = nplc",
             f"{channel}.source.output = 1",
-            f"startX = {start:.12f}",
-            f"dX = {dV:.12f}",
             f"{channel}.sense = {sense_mode}",
             f"{channel}.source.output = 1",
             f"{channel}.source.func = {func}",
             f"{channel}.measure.count = 1",
             f"{channel}.nvbuffer1.clear()",
             f"{channel}.nvbuffer1.appendmode = 1",
-            f"for index = 1, {steps} do",
-            "  target = startX + (index-1)*dX",
+            "for index = 1, steps do",
+            "  local target = startX + (index-1)*dX",
             f"  {channel}.source.level{sour} = target",
             f"  {channel}.measure.{meas}({channel}.nvbuffer1)",
             "end",
             "format.data = format.REAL32",
             "format.byteorder = format.LITTLEENDIAN",
-            f"printbuffer(1, {steps}, {channel}.nvbuffer1.readings)",
+            f"printbuffer(1, steps, {channel}.nvbuffer1.readings)",
         ]
 
-        return self._execute_lua(script, steps)
+        return self._execute_lua_function(
+            ("startX", "dX", "steps", "nplc"), body, (start, dV, steps, nplc), steps
+        )
 
-    def _execute_lua(self, _script: list[str], steps: int) -> np.ndarray:
+    def _execute_lua_function(
+        self,
+        arguments: Sequence[str],
+        body: Sequence[str],
+        values: Sequence[float],
+        steps: int,
+    ) -> np.ndarray:
         """
-        This is the function that sends the Lua script to be executed and
-        returns the corresponding data from the buffer.
+        Call a Lua function that prints a buffer of readings, loading the
+        function onto the instrument first if it has not been loaded yet,
+        and return the readings.
+
+        Args:
+            arguments: The names of the arguments of the function.
+            body: The body of the function, one line per item.
+            values: The values of the arguments to call the function with.
+            steps: Number of points printed by the function.
+        """
+        root_instrument = self.root_instrument
+        function_name = root_instrument.lua_function(arguments, body)
+        args = ", ".join(str(v) if isinstance(v, int) else repr(float(v)) for v in values)
+        try:
+            self.write(f"{function_name}({args})")
+            return self._read_lua_data(steps)
+        except VisaIOError:
+            # If the instrument has been power cycled, the loaded functions
+            # are lost and calling one prints nothing, such that the read
+            # times out. In that case the function is loaded again and the
+            # call is repeated once.
+            if root_instrument.ask(f"type({function_name})") != "nil":
+                raise
+            log.warning(
+                f"Lua function {function_name} is not defined on "
+                f"{root_instrument.name}, reloading the Lua functions."
+            )
+            root_instrument._lua_functions.clear()
+            function_name = root_instrument.lua_function(arguments, body)
+            self.write(f"{function_name}({args})")
+            return self._read_lua_data(steps)
+
+    def _read_lua_data(self, steps: int) -> np.ndarray:
+        """
+        Read the readings printed by a Lua script in the REAL32 format.
 
         Args:
-            _script: The Lua script to be executed.
             steps: Number of points.
         """
         nplc = self.nplc()
@@ -735,8 +778,6 @@ class Keithley2600Channel(InstrumentChannel):
             estimated_measurement_duration + _time_trace_extra_visa_timeout
         )
 
-        self.write(self.root_instrument._scriptwrapper(program=_script, debug=True))
-
         # now poll all the data
         # The problem is that a '\n' character might by chance be present in
         # the data
@@ -752,10 +793,9 @@ class Keithley2600Channel(InstrumentChannel):
 
         # From the manual p. 7-94, we know that a b'#0' is prepended
         # to the data and a b'\n' is appended
-        data = data[2:-1]
-        outdata = np.array(list(struct.iter_unpack("<f", data)))
-        outdata = np.reshape(outdata, len(outdata))
-        return outdata
+        return np.frombuffer(data, dtype="<f4", count=steps, offset=2).astype(
+            np.float64
+        )
 
     def _set_sourcerange_v(self, val: float) -> None:
         channel = self.channel
@@ -904,6 +944,9 @@ class Keithley2600(VisaInstrument):
             "2635B": [100e-12, 1.5],
             "2636B": [100e-12, 1.5],
         }
+        # names of the Lua functions loaded onto the instrument
+        self._lua_functions: set[str] = set()
+
         # Add the channel to the instrument
         self.channels: list[Keithley2600Channel] = []
         for ch in ["a", "b"]:
@@ -989,3 +1032,63 @@ class Keithley2600(VisaInstrument):
             log.debug("Wrapped the following script:")
             log.debug(wrapped)
         return wrapped
+
+    @staticmethod
+    def _scriptloader(name: str, program: Sequence[str]) -> str:
+        """
+        Wraps a program so that the output can be put into visa_handle.write
+        to load it onto the instrument as the named script ``name``. Unlike
+        :meth:`_scriptwrapper` the script is not run.
+
+        Args:
+            name: The name of the script.
+            program: A list of program instructions. One line per
+                list item.
+        """
+        mainprog = "\r\n".join(program) + "\r\n"
+        return f"loadscript {name}\r\n{mainprog}endscript"
+
+    def lua_function(self, arguments: Sequence[str], body: Sequence[str]) -> str:
+        """
+        Return the name of a global Lua function with the given arguments and
+        body that is defined on the instrument, such that it can be called
+        with a single short command, e.g. ``name(1, 2)``.
+
+        The first time a function is requested it is loaded onto the
+        instrument as a named script, which is run once to define the
+        function. The functions are named after a hash of their content, so
+        requesting the same function again does not upload anything. The
+        scripts are kept in the runtime memory of the instrument and are
+        lost when the instrument is power cycled. The sweeps of the
+        channels load their function again if calling it fails for that
+        reason, other users of this method should call
+        :meth:`clear_lua_functions` in that case.
+
+        Args:
+            arguments: The names of the arguments of the function.
+            body: The body of the function, one line per item.
+        """
+        content = "\n".join([",".join(arguments), *body])
+        digest = hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+        script_name = f"qcodes_{digest}"
+        function_name = f"{script_name}_fn"
+        if script_name not in self._lua_functions:
+            program = [
+                f"function {function_name}({', '.join(arguments)})",
+                *body,
+                "end",
+            ]
+            self.write(self._scriptloader(script_name, program))
+            self.write(f"{script_name}.run()")
+            self._lua_functions.add(script_name)
+        return function_name
+
+    def clear_lua_functions(self) -> None:
+        """
+        Delete the scripts of the Lua functions loaded by
+        :meth:`lua_function` from the instrument and forget about them, such
+        that they are loaded again when requested.
+        """
+        for script_name in self._lua_functions:
+            self.write(f'script.delete("{script_name}")')
+        self._lua_functions.clear()
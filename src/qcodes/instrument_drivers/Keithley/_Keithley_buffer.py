@@ -0,0 +1,99 @@
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+
+from qcodes.instrument import BufferedReadout, InstrumentChannel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class _KeithleyBuffer(InstrumentChannel):
+    """
+    Readout of a reading buffer of Keithley instruments using the SCPI
+    ``:TRACe`` subsystem, shared by the buffers of the 2450 and 7510. The
+    name of the buffer on the instrument is the short name of the channel
+    and the channel must have a ``number_of_readings`` parameter.
+    """
+
+    readout_chunk_size: int = 10_000
+    """Maximal number of readings transferred by a single query."""
+
+    def _ask_data(self, start_idx: int, end_idx: int, elements: list[str]) -> list[str]:
+        """
+        Return the data elements of the readings from ``start_idx`` to
+        ``end_idx`` (1-based, inclusive) as strings, or only the readings if
+        ``elements`` is empty. The data is read in chunks of
+        ``readout_chunk_size`` readings, such that a single response does
+        not exceed the timeout for large buffers.
+        """
+        data: list[str] = []
+        for start in range(start_idx, end_idx + 1, self.readout_chunk_size):
+            end = min(start + self.readout_chunk_size - 1, end_idx)
+            cmd = f":TRACe:DATA? {start}, {end}, '{self.short_name}'"
+            if elements:
+                cmd += f", {','.join(elements)}"
+            data.extend(self.ask(cmd).split(","))
+        return data
+
+    @contextmanager
+    def _binary_format(self) -> "Iterator[None]":
+        # the readings are transferred as binary doubles, the previous format
+        # is restored afterwards since it applies to all queries of readings
+        data_format = self.ask(":FORMat:DATA?")
+        byte_order = self.ask(":FORMat:BORDer?")
+        self.write(":FORMat:DATA REAL;:FORMat:BORDer SWAPped")
+        try:
+            yield
+        finally:
+            self.write(f":FORMat:DATA {data_format};:FORMat:BORDer {byte_order}")
+
+    def _fetch_readings(self, start: int, stop: int) -> np.ndarray:
+        return self.ask_binary(
+            f":TRACe:DATA? {start + 1}, {stop}, '{self.short_name}'",
+            dtype=np.float64,
+            is_big_endian=False,
+        )
+
+    def buffered_readout(
+        self,
+        n_points: int,
+        chunk_size: Optional[int] = None,
+        on_chunk: Optional["Callable[[np.ndarray, int], Any]"] = None,
+        poll_interval: float = 0.05,
+        timeout: Optional[float] = 10.0,
+    ) -> BufferedReadout:
+        """
+        Make a readout of the first ``n_points`` readings of the buffer that
+        transfers the readings in binary chunks as they are stored, while the
+        buffer is being filled. Call :meth:`.BufferedReadout.read` on the
+        returned readout after starting the acquisition to get the readings.
+
+        The buffer must be cleared before the acquisition is started and
+        must not wrap around during the acquisition, i.e. its size must be
+        at least ``n_points``. The data format of the instrument is switched
+        to binary while the readings are read and restored afterwards.
+
+        Args:
+            n_points: Number of readings to read.
+            chunk_size: Maximal number of readings transferred at once.
+                Defaults to ``readout_chunk_size``.
+            on_chunk: Optional function called with each chunk of readings
+                and the index of its first reading, e.g. to add the readings
+                to a :class:`.DataSaver` as they arrive.
+            poll_interval: Time in seconds between polls of the number of
+                readings in the buffer.
+            timeout: Time in seconds to wait for new readings before a
+                :class:`TimeoutError` is raised.
+        """
+        return BufferedReadout(
+            n_points,
+            n_available=self.number_of_readings,
+            fetch=self._fetch_readings,
+            chunk_size=chunk_size or self.readout_chunk_size,
+            on_chunk=on_chunk,
+            transfer_context=self._binary_format,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
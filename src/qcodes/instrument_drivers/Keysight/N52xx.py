@@ -14,6 +14,8 @@ from qcodes.parameters import (
 )
 from qcodes.validators import Arrays, Bool, Enum, Ints, Numbers
 
+from .._trace_state_cache import TraceStateCacheMixin
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
@@ -117,14 +119,13 @@ class FormattedSweep(ParameterWithSetpoints):
         if auto_sweep:
             prev_mode = self.instrument.run_sweep()
         # Ask for data, setting the format to the requested form
-        self.instrument.format(self.sweep_format)
-        data = root_instr.visa_handle.query_binary_values('CALC:DATA? FDATA',
-                                                          datatype='f',
-                                                          is_big_endian=True)
-        data = np.array(data)
+        root_instr._set_trace_state(self.instrument.format, self.sweep_format)
+        data = root_instr.ask_binary(
+            "CALC:DATA? FDATA", dtype=np.float32, is_big_endian=True
+        ).astype(np.float64)
         # Restore previous state if it was changed
         if auto_sweep:
-            root_instr.sweep_mode(prev_mode)
+            root_instr._set_trace_state(root_instr.sweep_mode, prev_mode)
 
         return data
 
@@ -291,13 +292,13 @@ class KeysightPNATrace(InstrumentChannel):
         """
         root_instr = self.root_instrument
         # Store previous mode
-        prev_mode = root_instr.sweep_mode()
+        prev_mode = root_instr._get_trace_state(root_instr.sweep_mode)
         # Take instrument out of continuous mode, and send triggers equal to
         # the number of averages
-        if root_instr.averages_enabled():
-            avg = root_instr.averages()
+        if root_instr._get_trace_state(root_instr.averages_enabled):
+            avg = root_instr._get_trace_state(root_instr.averages)
             root_instr.reset_averages()
-            root_instr.group_trigger_count(avg)
+            root_instr._set_trace_state(root_instr.group_trigger_count, avg)
             root_instr.sweep_mode('GRO')
         else:
             root_instr.sweep_mode('SING')
@@ -332,14 +333,16 @@ class KeysightPNATrace(InstrumentChannel):
         """
         Select correct trace before querying
         """
-        self.root_instrument.active_trace(self.trace_num)
+        root_instr = self.root_instrument
+        root_instr._set_trace_state(root_instr.active_trace, self.trace_num)
         super().write(cmd)
 
     def ask(self, cmd: str) -> str:
         """
         Select correct trace before querying
         """
-        self.root_instrument.active_trace(self.trace_num)
+        root_instr = self.root_instrument
+        root_instr._set_trace_state(root_instr.active_trace, self.trace_num)
         return super().ask(cmd)
 
     def _Sparam(self) -> str:
@@ -368,7 +371,7 @@ PNATrace = KeysightPNATrace
 "Alias for backwards compatiblitly"
 
 
-class PNABase(VisaInstrument):
+class PNABase(TraceStateCacheMixin, VisaInstrument):
     """
     Base qcodes driver for Agilent/Keysight series PNAs
     http://na.support.keysight.com/pna/help/latest/Programming/GP-IB_Command_Finder/SCPI_Command_Tree.htm
@@ -600,6 +603,22 @@ class PNABase(VisaInstrument):
                            vals=Bool(),
                            initial_value=True)
 
+        self.add_parameter(
+            "cache_trace_state",
+            label="Cache Trace State",
+            set_cmd=None,
+            get_cmd=None,
+            vals=Bool(),
+            initial_value=False,
+            docstring="If True, the state of the instrument that reading a "
+            "trace depends on, such as the active trace, the format, the "
+            "sweep mode and the averaging settings, is taken from the "
+            "parameter caches and only changed on the instrument when it "
+            "differs from the cached state. Call invalidate_cache after "
+            "changing the instrument outside of QCoDeS, e.g. on the front "
+            "panel.",
+        )
+
         # A default output format on initialisation
         self.write('FORM REAL,32')
         self.write('FORM:BORD NORM')
@@ -30,17 +30,58 @@ def fmt_response_base_parser(raw_data_val: str) -> _FMTResponse:
     as CH1,CH2), type (current 'I' or voltage 'V'). This parser is tested
     for FMT1,0 and FMT1,1 response.
 
+    The fields of the named tuple are numpy arrays, the values of dtype
+    float and the others of dtype str.
+
     Args:
         raw_data_val: Unparsed (raw) data for the instrument.
     """
 
     values_separator = ','
+    raw_data_val = raw_data_val.strip()
+    n_values = raw_data_val.count(values_separator) + 1
+    width = (len(raw_data_val) + 1) // n_values
+
+    if width < 5 or n_values * width - 1 != len(raw_data_val):
+        # the values do not all have the same number of digits
+        return _fmt_response_parser_by_value(raw_data_val.split(values_separator))
+
+    # All values have the same width, so the response is parsed as a table
+    # of characters with one row per value, which avoids handling each value
+    # in python. A length check alone does not guarantee that the separators
+    # are aligned, this is checked below.
+    chars = np.frombuffer(
+        (raw_data_val + values_separator).encode("ascii"), dtype=np.uint8
+    ).reshape(n_values, width)
+    if not np.all(chars[:, -1] == ord(values_separator)):
+        return _fmt_response_parser_by_value(raw_data_val.split(values_separator))
+
+    # for ascii characters the character code is the single UCS4 code unit
+    # of a numpy str of length 1
+    status = chars[:, 0].astype(np.uint32).view("U1")
+    datatype = chars[:, 2].astype(np.uint32).view("U1")
+    channel_ids, channel_index = np.unique(chars[:, 1], return_inverse=True)
+    channel_names = np.array(
+        [constants.ChannelName[chr(channel_id)].value for channel_id in channel_ids]
+    )
+    channel = channel_names[channel_index.reshape(-1)]
+    value = (
+        np.ascontiguousarray(chars[:, 3:-1])
+        .view(f"S{width - 4}")
+        .reshape(-1)
+        .astype(np.float64)
+    )
+
+    return _FMTResponse(value, status, channel, datatype)
+
+
+def _fmt_response_parser_by_value(str_values: list[str]) -> _FMTResponse:
     data_val = []
     data_status = []
     data_channel = []
     data_datatype = []
 
-    for str_value in raw_data_val.split(values_separator):
+    for str_value in str_values:
         status = str_value[0]
         channel_id = constants.ChannelName[str_value[1]].value
 
@@ -52,8 +93,12 @@ def fmt_response_base_parser(raw_data_val: str) -> _FMTResponse:
         data_channel.append(channel_id)
         data_datatype.append(datatype)
 
-    data = _FMTResponse(data_val, data_status, data_channel, data_datatype)
-    return data
+    return _FMTResponse(
+        np.array(data_val, dtype=np.float64),
+        np.array(data_status, dtype=str),
+        np.array(data_channel, dtype=str),
+        np.array(data_datatype, dtype=str),
+    )
 
 
 def parse_module_query_response(response: str) -> dict[SlotNr, str]:
@@ -257,6 +302,9 @@ def convert_dummy_val_to_nan(param: _FMTResponse) -> None:
         param: This must be of type named tuple _FMTResponse.
 
     """
+    if isinstance(param.value, np.ndarray):
+        param.value[param.value > 1e99] = np.nan
+        return
     for index, value in enumerate(param.value):
         param.value[index] = _convert_to_nan_if_dummy_value(param.value[index])
 
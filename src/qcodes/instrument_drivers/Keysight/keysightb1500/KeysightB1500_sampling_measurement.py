@@ -99,19 +99,22 @@ class SamplingMeasurement(ParameterWithSetpoints):
             raise MeasurementNotTaken('First run sampling_measurement'
                                       ' method to generate the data')
         else:
-            data = self.data
-            total_count = len(data.status)
-            normal_count = data.status.count(constants.MeasurementStatus.N.name)
+            status = numpy.asarray(self.data.status)
+            total_count = len(status)
+            normal_count = int(numpy.count_nonzero(
+                status == constants.MeasurementStatus.N.name))
             exception_count = total_count - normal_count
             if total_count == normal_count:
                 print('All measurements are normal')
             else:
-                indices = [i for i, x in enumerate(data.status) if x in {"C", "T"}]
+                indices = numpy.flatnonzero(numpy.isin(status, ["C", "T"]))
                 warnings.warn(
                     f"{exception_count!s} measurements were "
-                    f"out of compliance at {indices!s}"
+                    f"out of compliance at {indices.tolist()!s}"
                 )
 
-            compliance_list = [constants.MeasurementError[key].value
-                               for key in data.status]
+            keys, key_index = numpy.unique(status, return_inverse=True)
+            errors = numpy.array([constants.MeasurementError[key].value
+                                  for key in keys], dtype=int)
+            compliance_list: list[int] = errors[key_index.reshape(-1)].tolist()
             return compliance_list
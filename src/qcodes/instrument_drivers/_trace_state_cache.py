@@ -0,0 +1,44 @@
+from typing import TYPE_CHECKING, Any, Protocol
+
+from qcodes.instrument.base import InstrumentProtocol
+
+if TYPE_CHECKING:
+    from qcodes.parameters import Parameter
+
+
+class TraceStateCacheProtocol(InstrumentProtocol, Protocol):
+    cache_trace_state: "Parameter"
+
+
+class TraceStateCacheMixin:
+    """
+    Mixin class for network analyzers that can take the state of the
+    instrument that reading a trace depends on from the parameter caches.
+
+    The instrument must have a boolean ``cache_trace_state`` parameter that
+    enables the caching.
+    """
+
+    def _get_trace_state(self: TraceStateCacheProtocol, parameter: "Parameter") -> Any:
+        """
+        Get a parameter that reading a trace depends on, from its cache if
+        ``cache_trace_state`` is enabled.
+        """
+        if self.cache_trace_state():
+            return parameter.cache.get()
+        return parameter()
+
+    def _set_trace_state(
+        self: TraceStateCacheProtocol, parameter: "Parameter", value: Any
+    ) -> None:
+        """
+        Set a parameter that reading a trace depends on, unless
+        ``cache_trace_state`` is enabled and its cache holds the value.
+        """
+        if (
+            self.cache_trace_state()
+            and parameter.cache.valid
+            and parameter.cache.get() == value
+        ):
+            return
+        parameter(value)
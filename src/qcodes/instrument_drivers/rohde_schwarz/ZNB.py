@@ -14,6 +14,8 @@ from qcodes.parameters import (
     create_on_off_val_mapping,
 )
 
+from .._trace_state_cache import TraceStateCacheMixin
+
 log = logging.getLogger(__name__)
 
 
@@ -648,9 +650,25 @@ class RohdeSchwarzZNBChannel(InstrumentChannel):
 
     def _get_format(self, tracename: str) -> str:
         n = self._instrument_channel
-        self.write(f"CALC{n}:PAR:SEL '{tracename}'")
+        self._select_trace(tracename)
         return self.ask(f"CALC{n}:FORM?")
 
+    def _select_trace(self, tracename: str) -> None:
+        """
+        Select the trace of the channel that trace commands act on. If the
+        trace state is cached, the trace is only selected if it is not known
+        to be selected already.
+        """
+        n = self._instrument_channel
+        selected_traces = self.root_instrument._selected_traces
+        if (
+            self.root_instrument.cache_trace_state()
+            and selected_traces.get(n) == tracename
+        ):
+            return
+        self.write(f"CALC{n}:PAR:SEL '{tracename}'")
+        selected_traces[n] = tracename
+
     def _set_format(self, val: str) -> None:
         unit_mapping = {
             "MLOG\n": "dB",
@@ -681,7 +699,7 @@ class RohdeSchwarzZNBChannel(InstrumentChannel):
             "COMP\n": "Complex Magnitude",
         }
         channel = self._instrument_channel
-        self.write(f"CALC{channel}:PAR:SEL '{self._tracename}'")
+        self._select_trace(self._tracename)
         self.write(f"CALC{channel}:FORM {val}")
         self.trace.unit = unit_mapping[val]
         self.trace.label = f"{self.short_name} {label_mapping[val]}"
@@ -788,54 +806,64 @@ class RohdeSchwarzZNBChannel(InstrumentChannel):
         self.sweep_time()
 
     def _get_sweep_data(self, force_polar: bool = False) -> np.ndarray:
-
-        if not self._parent.rf_power():
+        root_instr = self.root_instrument
+        if not root_instr._get_trace_state(root_instr.rf_power):
             log.warning("RF output is off when getting sweep data")
         # It is possible that the instrument and QCoDeS disagree about
         # which parameter is measured on this channel.
-        instrument_parameter = self.vna_parameter()
+        instrument_parameter = root_instr._get_trace_state(self.vna_parameter)
         if instrument_parameter != self._vna_parameter:
             raise RuntimeError(
                 "Invalid parameter. Tried to measure "
                 f"{self._vna_parameter} "
                 f"got {instrument_parameter}"
             )
-        self.averaging_enabled(True)
+        root_instr._set_trace_state(self.averaging_enabled, True)
         self.write(f"SENS{self._instrument_channel}:AVER:CLE")
 
+        if root_instr.cache_trace_state():
+            # the channel is left measuring and continuous measurement off,
+            # such that the next trace does not have to toggle them again
+            root_instr._set_trace_state(self.status, 1)
+            if root_instr._cont_meas_enabled is not False:
+                root_instr.cont_meas_off()
+            return self._measure_trace(force_polar)
+
         # preserve original state of the znb
         with self.status.set_to(1):
-            self.root_instrument.cont_meas_off()
+            root_instr.cont_meas_off()
             try:
-                # if force polar is set, the SDAT data format will be used.
-                # Here the data will be transferred as a complex number
-                # independent of the set format in the instrument.
-                if force_polar:
-                    data_format_command = "SDAT"
-                else:
-                    data_format_command = "FDAT"
-
-                with self.root_instrument.timeout.set_to(self._get_timeout()):
-                    # instrument averages over its last 'avg' number of sweeps
-                    # need to ensure averaged result is returned
-                    for _ in range(self.avg()):
-                        self.write(f"INIT{self._instrument_channel}:IMM; *WAI")
-                    self.write(
-                        f"CALC{self._instrument_channel}:PAR:SEL "
-                        f"'{self._tracename}'"
-                    )
-                    data_str = self.ask(
-                        f"CALC{self._instrument_channel}:DATA?"
-                        f" {data_format_command}"
-                    )
-                data = np.array(data_str.rstrip().split(",")).astype("float64")
-                if self.format() in ["Polar",
-                                     "Complex",
-                                     "Smith",
-                                     "Inverse Smith"]:
-                    data = data[0::2] + 1j * data[1::2]
+                data = self._measure_trace(force_polar)
             finally:
-                self.root_instrument.cont_meas_on()
+                root_instr.cont_meas_on()
+        return data
+
+    def _measure_trace(self, force_polar: bool) -> np.ndarray:
+        root_instr = self.root_instrument
+        # if force polar is set, the SDAT data format will be used.
+        # Here the data will be transferred as a complex number
+        # independent of the set format in the instrument.
+        if force_polar:
+            data_format_command = "SDAT"
+        else:
+            data_format_command = "FDAT"
+
+        with root_instr.timeout.set_to(self._get_timeout()):
+            # instrument averages over its last 'avg' number of sweeps
+            # need to ensure averaged result is returned
+            for _ in range(root_instr._get_trace_state(self.avg)):
+                self.write(f"INIT{self._instrument_channel}:IMM; *WAI")
+            self._select_trace(self._tracename)
+            data = self._ask_trace_data(
+                f"CALC{self._instrument_channel}:DATA? {data_format_command}"
+            )
+        if root_instr._get_trace_state(self.format) in [
+            "Polar",
+            "Complex",
+            "Smith",
+            "Inverse Smith",
+        ]:
+            data = data[0::2] + 1j * data[1::2]
         return data
 
     def setup_cw_sweep(self) -> None:
@@ -914,14 +942,28 @@ class RohdeSchwarzZNBChannel(InstrumentChannel):
         with self.status.set_to(1):
             with self.root_instrument.timeout.set_to(self._get_timeout()):
                 self.write(f"INIT{self._instrument_channel}:IMM; *WAI")
-                data_str = self.ask(f"CALC{self._instrument_channel}:DATA? "
-                                    f"SDAT")
-            data = np.array(data_str.rstrip().split(",")).astype("float64")
+                data = self._ask_trace_data(
+                    f"CALC{self._instrument_channel}:DATA? SDAT"
+                )
             i = data[0::2]
             q = data[1::2]
 
         return i, q
 
+    def _ask_trace_data(self, cmd: str) -> np.ndarray:
+        """
+        Ask for trace data in the format given by the ``data_transfer_format``
+        parameter of the instrument.
+        """
+        data_transfer_format = self.root_instrument.data_transfer_format.cache.get()
+        if data_transfer_format == "ascii":
+            data_str = self.ask(cmd)
+            return np.array(data_str.rstrip().split(",")).astype("float64")
+        dtype = np.float32 if data_transfer_format == "real32" else np.float64
+        # the ZNB uses little endian byte order by default (FORM:BORD SWAP)
+        data = self.ask_binary(cmd, dtype=dtype, is_big_endian=False)
+        return data.astype("float64")
+
     def _get_timeout(self) -> float:
         timeout = self.root_instrument.timeout() or float("+inf")
         timeout = max(self.sweep_time.cache.get() * 1.5, timeout)
@@ -931,7 +973,7 @@ class RohdeSchwarzZNBChannel(InstrumentChannel):
 ZNBChannel = RohdeSchwarzZNBChannel
 
 
-class ZNB(VisaInstrument):
+class ZNB(TraceStateCacheMixin, VisaInstrument):
     """
     QCoDeS driver for the Rohde & Schwarz ZNB8 and ZNB20
     virtual network analyser. It can probably be extended to ZNB4 and 40
@@ -1000,11 +1042,48 @@ class ZNB(VisaInstrument):
             set_cmd="OUTP1 {}",
             val_mapping={True: "1\n", False: "0\n"},
         )
-        self.add_function("reset", call_cmd="*RST")
+        self.add_parameter(
+            name="data_transfer_format",
+            get_cmd="FORM:DATA?",
+            set_cmd="FORM:DATA {}",
+            val_mapping={
+                "ascii": "ASC,0\n",
+                "real32": "REAL,32\n",
+                "real64": "REAL,64\n",
+            },
+            docstring="Format used to transfer trace data from the "
+            "instrument. The binary formats transfer the data as an "
+            "IEEE 488.2 binary block which is considerably faster "
+            "for long traces than the default ascii format.",
+        )
+        self.add_parameter(
+            name="cache_trace_state",
+            initial_value=False,
+            get_cmd=None,
+            set_cmd=None,
+            vals=vals.Bool(),
+            docstring="If True, the state of the instrument that reading a "
+            "trace depends on, such as the selected trace, the format and "
+            "the number of averages, is taken from the parameter caches and "
+            "only changed on the instrument when it differs from the cached "
+            "state. Between traces the channel is left enabled and continuous "
+            "measurement is left off. Call invalidate_cache after changing "
+            "the instrument outside of QCoDeS, e.g. on the front panel.",
+        )
+        # state of the instrument that is not held by parameters, None or
+        # missing if not known
+        self._selected_traces: dict[int, str] = {}
+        self._cont_meas_enabled: Optional[bool] = None
+
+        self.add_function("reset", call_cmd=self._reset)
         self.add_function("tooltip_on", call_cmd="SYST:ERR:DISP ON")
         self.add_function("tooltip_off", call_cmd="SYST:ERR:DISP OFF")
-        self.add_function("cont_meas_on", call_cmd="INIT:CONT:ALL ON")
-        self.add_function("cont_meas_off", call_cmd="INIT:CONT:ALL OFF")
+        self.add_function(
+            "cont_meas_on", call_cmd=partial(self._set_cont_meas, True)
+        )
+        self.add_function(
+            "cont_meas_off", call_cmd=partial(self._set_cont_meas, False)
+        )
         self.add_function("update_display_once", call_cmd="SYST:DISP:UPD ONCE")
         self.add_function("update_display_on", call_cmd="SYST:DISP:UPD ON")
         self.add_function("update_display_off", call_cmd="SYST:DISP:UPD OFF")
@@ -1040,6 +1119,24 @@ class ZNB(VisaInstrument):
             self.rf_off()
         self.connect_message()
 
+    def _reset(self) -> None:
+        self.write("*RST")
+        self.invalidate_cache()
+
+    def _set_cont_meas(self, enabled: bool) -> None:
+        self.write(f"INIT:CONT:ALL {'ON' if enabled else 'OFF'}")
+        self._cont_meas_enabled = enabled
+
+    def invalidate_cache(self) -> None:
+        """
+        Invalidate the cache of all parameters on the instrument and forget
+        which traces are selected and whether continuous measurement is on,
+        such that the state is read from or sent to the instrument again.
+        """
+        self._selected_traces.clear()
+        self._cont_meas_enabled = None
+        super().invalidate_cache()
+
     def display_grid(self, rows: int, cols: int) -> None:
         """
         Display a grid of channels rows by columns.
@@ -1068,6 +1165,7 @@ class ZNB(VisaInstrument):
         unlock the channel list.
         """
         self.write("CALCulate:PARameter:DELete:ALL")
+        self._selected_traces.clear()
         for submodule in self.submodules.values():
             if isinstance(submodule, ChannelList):
                 submodule.clear()
@@ -1,8 +1,9 @@
 import ctypes as ct
+import itertools
 import logging
 from enum import IntEnum
 from time import sleep
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
 
@@ -10,6 +11,9 @@ import qcodes.validators as vals
 from qcodes.instrument import Instrument
 from qcodes.parameters import ArrayParameter, Parameter, ParameterWithSetpoints
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
 log = logging.getLogger(__name__)
 
 
@@ -197,6 +201,10 @@ class SignalHoundUSBSA124B(Instrument):
         super().__init__(name, **kwargs)
         self._parameters_synced = False
         self._trace_updated = False
+        # buffers the sweeps are read into, reallocated when the number of
+        # points of the sweep changes
+        self._sweep_min = np.zeros(0, dtype=np.float32)
+        self._sweep_max = np.zeros(0, dtype=np.float32)
         log.info("Initializing instrument SignalHound USB 124B")
         self.dll = ct.CDLL(dll_path or self.dll_path)
 
@@ -671,23 +679,81 @@ class SignalHoundUSBSA124B(Instrument):
             self.sync_parameters()
         sweep_len, _, _ = self.QuerySweep()
 
+        if self._sweep_min.shape != (sweep_len,):
+            self._sweep_min = np.zeros(sweep_len, dtype=np.float32)
+        datamin = self._sweep_min
+
         data = np.zeros(sweep_len)
         Navg = self.avg()
         for i in range(Navg):
-
-            datamin = np.zeros((sweep_len), dtype=np.float32)
-            datamax = np.zeros((sweep_len), dtype=np.float32)
-
-            minarr = datamin.ctypes.data_as(ct.POINTER(ct.c_float))
-            maxarr = datamax.ctypes.data_as(ct.POINTER(ct.c_float))
-
             sleep(self.sleep_time.get())  # Added extra sleep for updating issue
-            err = self.dll.saGetSweep_32f(self.deviceHandle, minarr, maxarr)
-            self.check_for_error(err, "saGetSweep_32f")
+            self._read_sweep_into(datamin)
             data += datamin
 
         return data / Navg
 
+    def _read_sweep_into(self, datamin: np.ndarray) -> None:
+        """
+        Acquire a sweep and write it into ``datamin``, a contiguous float32
+        array with one element per point of the sweep. The array is handed
+        to the dll directly, so no data is copied.
+        """
+        if self._sweep_max.shape != datamin.shape:
+            self._sweep_max = np.zeros(datamin.shape, dtype=np.float32)
+        err = self.dll.saGetSweep_32f(
+            self.deviceHandle,
+            datamin.ctypes.data_as(ct.POINTER(ct.c_float)),
+            self._sweep_max.ctypes.data_as(ct.POINTER(ct.c_float)),
+        )
+        self.check_for_error(err, "saGetSweep_32f")
+
+    def stream_sweeps(
+        self, n_sweeps: Optional[int] = None, buffer_size: int = 8
+    ) -> "Generator[np.ndarray, None, None]":
+        """
+        Acquire sweeps back to back and yield each sweep as soon as it has
+        been acquired, e.g. to add it to a DataSaver or a live plot.
+
+        Unlike ``freq_sweep`` and ``trace``, there is no sleep between the
+        sweeps and the sweeps are not averaged. The sweeps are written into
+        a ring of ``buffer_size`` preallocated arrays. A yielded array is
+        overwritten ``buffer_size`` sweeps later, so it must be copied to
+        keep it for longer.
+
+        The parameters are synced to the device when this method is called,
+        the sweeps are acquired while iterating over the returned iterator.
+
+        Args:
+            n_sweeps: Number of sweeps to acquire. None to acquire sweeps
+                until the generator is closed.
+            buffer_size: Number of sweeps in the ring of arrays.
+
+        Raises:
+            ValueError: If ``buffer_size`` is smaller than 1.
+            RuntimeError: If a parameter of the sweep is changed while
+                streaming.
+        """
+        if buffer_size < 1:
+            raise ValueError(f"buffer_size must be at least 1, got {buffer_size}")
+        if not self._parameters_synced:
+            self.sync_parameters()
+        sweep_len, _, _ = self.QuerySweep()
+        ring = np.zeros((buffer_size, sweep_len), dtype=np.float32)
+        return self._stream_sweeps_into(ring, n_sweeps)
+
+    def _stream_sweeps_into(
+        self, ring: np.ndarray, n_sweeps: Optional[int]
+    ) -> "Generator[np.ndarray, None, None]":
+        indices = itertools.count() if n_sweeps is None else range(n_sweeps)
+        for i in indices:
+            if not self._parameters_synced:
+                raise RuntimeError(
+                    "The parameters of the sweep were changed while streaming"
+                )
+            sweep = ring[i % len(ring)]
+            self._read_sweep_into(sweep)
+            yield sweep
+
     def _get_power_at_freq(self) -> float:
         """
         Returns the maximum power in a window of 250 kHz
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, ClassVar
 
 import numpy as np
 
-from qcodes.instrument import VisaInstrument
+from qcodes.instrument import BufferedReadout, VisaInstrument
 from qcodes.parameters import (
     ArrayParameter,
     Parameter,
@@ -16,7 +16,7 @@ from qcodes.parameters import (
 from qcodes.validators import Arrays, ComplexNumbers, Enum, Ints, Numbers, Strings
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
 
 
 class ChannelTrace(ParameterWithSetpoints):
@@ -70,24 +70,15 @@ class ChannelTrace(ParameterWithSetpoints):
             raise ValueError('No points stored in SR830 data buffer.'
                              ' Can not poll anything.')
 
-        # poll raw binary data
-        self.root_instrument.write(f'TRCL ? {self.channel}, 0, {N}')
-        rawdata = self.root_instrument.visa_handle.read_raw()
-
-        # parse it
-        realdata = np.frombuffer(rawdata, dtype="<i2")
-        numbers = realdata[::2] * 2.0 ** (realdata[1::2] - 124)
-
-        return numbers
+        return self.root_instrument._get_buffer_points(self.channel, 0, N)
 
 
 class ChannelBuffer(ArrayParameter):
     """
     Parameter class for the two channel buffers
 
-    Currently always returns the entire buffer
-    TODO (WilliamHPNielsen): Make it possible to query parts of the buffer.
-    The instrument natively supports this in its TRCL call.
+    Always returns the entire buffer. Use :meth:`SR830.buffered_readout`
+    to read the buffer in parts while it is being filled.
     """
 
     def __init__(self, name: str, instrument: SR830, channel: int) -> None:
@@ -179,13 +170,7 @@ class ChannelBuffer(ArrayParameter):
             raise ValueError('No points stored in SR830 data buffer.'
                              ' Can not poll anything.')
 
-        # poll raw binary data
-        self.instrument.write(f"TRCL ? {self.channel}, 0, {N}")
-        rawdata = self.instrument.visa_handle.read_raw()
-
-        # parse it
-        realdata = np.frombuffer(rawdata, dtype="<i2")
-        numbers = realdata[::2] * 2.0 ** (realdata[1::2] - 124)
+        numbers = self.instrument._get_buffer_points(self.channel, 0, N)
         if self.shape[0] != N:
             raise RuntimeError(
                 f"SR830 got {N} points in buffer expected {self.shape[0]}"
@@ -725,6 +710,62 @@ class SR830(VisaInstrument):
         self.sensitivity.set(n_to[n + dn])
         return True
 
+    def _get_buffer_points(self, channel: int, start: int, n_points: int) -> np.ndarray:
+        """
+        Read ``n_points`` points of the data buffer of a channel, starting
+        from the point with index ``start``, in the binary format of TRCL.
+        """
+        self.write(f"TRCL ? {channel}, {start}, {n_points}")
+        rawdata = self.visa_handle.read_raw()
+
+        # each point is a 16 bit mantissa followed by a 16 bit exponent
+        realdata = np.frombuffer(rawdata, dtype="<i2")
+        return realdata[::2] * 2.0 ** (realdata[1::2] - 124)
+
+    def buffered_readout(
+        self,
+        channel: int,
+        n_points: int,
+        *,
+        chunk_size: int = 4096,
+        on_chunk: Callable[[np.ndarray, int], Any] | None = None,
+        poll_interval: float = 0.05,
+        timeout: float | None = 10.0,
+    ) -> BufferedReadout:
+        """
+        Make a readout of the first ``n_points`` points of the data buffer of
+        a channel that transfers the points in chunks as they are stored,
+        while the buffer is being filled. Call :meth:`.BufferedReadout.read`
+        on the returned readout after starting the acquisition to get the
+        points.
+
+        Args:
+            channel: The channel (1 or 2) to read the buffer of.
+            n_points: Number of points to read.
+            chunk_size: Maximal number of points transferred at once.
+            on_chunk: Optional function called with each chunk of points and
+                the index of its first point, e.g. to add the points to a
+                :class:`.DataSaver` as they arrive.
+            poll_interval: Time in seconds between polls of the number of
+                points in the buffer.
+            timeout: Time in seconds to wait for new points before a
+                :class:`TimeoutError` is raised.
+        """
+        if channel not in (1, 2):
+            raise ValueError("Invalid channel specifier. SR830 only has "
+                             "channels 1 and 2.")
+        return BufferedReadout(
+            n_points,
+            n_available=self.buffer_npts,
+            fetch=lambda start, stop: self._get_buffer_points(
+                channel, start, stop - start
+            ),
+            chunk_size=chunk_size,
+            on_chunk=on_chunk,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
+
     def _set_buffer_SR(self, SR: int) -> None:
         self.write(f'SRAT {SR}')
         self._buffer1_ready = False
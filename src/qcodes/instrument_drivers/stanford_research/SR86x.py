@@ -5,7 +5,12 @@ from typing import TYPE_CHECKING, Any, Callable, ClassVar
 
 import numpy as np
 
-from qcodes.instrument import ChannelList, InstrumentChannel, VisaInstrument
+from qcodes.instrument import (
+    BufferedReadout,
+    ChannelList,
+    InstrumentChannel,
+    VisaInstrument,
+)
 from qcodes.parameters import ArrayParameter
 from qcodes.validators import ComplexNumbers, Enum, Ints, Numbers
 
@@ -385,25 +390,18 @@ class SR86xBuffer(InstrumentChannel):
                              f"is larger than current capture length of the "
                              f"buffer ({current_capture_length}kB).")
 
-        values: np.ndarray = np.array([])
-        data_size_to_read_in_kb = size_in_kb
-        n_readings = 0
+        values_per_kb = 1024 // self.bytes_per_sample
+        values = np.empty(size_in_kb * values_per_kb)
 
-        while data_size_to_read_in_kb > 0:
-            offset = n_readings * self.max_size_per_reading_in_kb
-
-            if data_size_to_read_in_kb > self.max_size_per_reading_in_kb:
-                size_of_this_reading = self.max_size_per_reading_in_kb
-            else:
-                size_of_this_reading = data_size_to_read_in_kb
-
-            data_from_this_reading = self._get_raw_capture_data_block(
-                size_of_this_reading,
-                offset_in_kb=offset)
-            values = np.append(values, data_from_this_reading)
-
-            data_size_to_read_in_kb -= size_of_this_reading
-            n_readings += 1
+        for offset in range(0, size_in_kb, self.max_size_per_reading_in_kb):
+            size_of_this_reading = min(
+                self.max_size_per_reading_in_kb, size_in_kb - offset
+            )
+            start = offset * values_per_kb
+            stop = start + size_of_this_reading * values_per_kb
+            values[start:stop] = self._get_raw_capture_data_block(
+                size_of_this_reading, offset_in_kb=offset
+            )
 
         return values
 
@@ -471,6 +469,90 @@ class SR86xBuffer(InstrumentChannel):
 
         return np.array(values)
 
+    def _get_capture_samples(
+        self, start: int, stop: int, n_variables: int
+    ) -> np.ndarray:
+        """
+        Read the samples with indices from ``start`` to ``stop`` of the
+        capture data, as an array of shape ``(stop - start, n_variables)``.
+        """
+        values_per_kb = 1024 // self.bytes_per_sample
+        offset_in_kb = start * n_variables // values_per_kb
+        end_in_kb = -(-stop * n_variables // values_per_kb)
+        values = self._get_raw_capture_data_block(
+            end_in_kb - offset_in_kb, offset_in_kb=offset_in_kb
+        )
+        first = start * n_variables - offset_in_kb * values_per_kb
+        return values[first : first + (stop - start) * n_variables].reshape(
+            -1, n_variables
+        )
+
+    def buffered_capture_readout(
+        self,
+        sample_count: int,
+        on_chunk: Callable[[np.ndarray, int], Any] | None = None,
+        poll_interval: float = 0.05,
+        timeout: float | None = 10.0,
+    ) -> BufferedReadout:
+        """
+        Make a readout of the first ``sample_count`` samples of the capture
+        data that transfers the samples in chunks of at most
+        ``max_size_per_reading_in_kb`` as they are captured, while the
+        capture is running. Call :meth:`.BufferedReadout.read` on the
+        returned readout after starting the capture to get the samples.
+
+        Args:
+            sample_count: Number of samples to read.
+            on_chunk: Optional function called with each chunk of samples and
+                the index of its first sample, e.g. to add the samples to a
+                :class:`.DataSaver` as they arrive. A chunk has one column
+                per captured variable.
+            poll_interval: Time in seconds between polls of the number of
+                captured bytes.
+            timeout: Time in seconds to wait for new samples before a
+                :class:`TimeoutError` is raised. None to wait forever.
+
+        Returns:
+            A readout whose data has one column per captured variable, in the
+            order of the capture config.
+        """
+        n_variables = self._get_number_of_capture_variables()
+        sample_size = n_variables * self.bytes_per_sample
+        # a chunk that does not start at a kB boundary spans one more kB
+        chunk_size = (self.max_size_per_reading_in_kb - 1) * 1024 // sample_size
+        return BufferedReadout(
+            sample_count,
+            n_available=lambda: self.count_capture_bytes() // sample_size,
+            fetch=lambda start, stop: self._get_capture_samples(
+                start, stop, n_variables
+            ),
+            chunk_size=chunk_size,
+            point_shape=(n_variables,),
+            on_chunk=on_chunk,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
+
+    def _capture_and_read(self, sample_count: int) -> dict[str, np.ndarray]:
+        """
+        Read the samples of a capture that has been started while it is
+        running, then stop the capture.
+        """
+        capture_variables = self._get_list_of_capture_variable_names()
+        readout = self.buffered_capture_readout(sample_count, timeout=None)
+        try:
+            values = readout.read()
+        finally:
+            self.stop_capture()
+
+        data = {k: v for k, v in zip(capture_variables, values.T)}
+
+        for capture_variable in capture_variables:
+            buffer_parameter = getattr(self, capture_variable)
+            buffer_parameter.prepare_readout(data[capture_variable])
+
+        return data
+
     def capture_one_sample_per_trigger(
             self,
             trigger_count: int,
@@ -495,9 +577,7 @@ class SR86xBuffer(InstrumentChannel):
         self.set_capture_length_to_fit_samples(trigger_count)
         self.start_capture("ONE", "SAMP")
         start_triggers_pulsetrain()
-        self.wait_until_samples_captured(trigger_count)
-        self.stop_capture()
-        return self.get_capture_data(trigger_count)
+        return self._capture_and_read(trigger_count)
 
     def capture_samples_after_trigger(
         self, sample_count: int, send_trigger: Callable[..., Any]
@@ -521,9 +601,7 @@ class SR86xBuffer(InstrumentChannel):
         self.set_capture_length_to_fit_samples(sample_count)
         self.start_capture("ONE", "TRIG")
         send_trigger()
-        self.wait_until_samples_captured(sample_count)
-        self.stop_capture()
-        return self.get_capture_data(sample_count)
+        return self._capture_and_read(sample_count)
 
     def capture_samples(self, sample_count: int) -> dict[str, np.ndarray]:
         """
@@ -546,9 +624,7 @@ class SR86xBuffer(InstrumentChannel):
         """
         self.set_capture_length_to_fit_samples(sample_count)
         self.start_capture("ONE", "IMM")
-        self.wait_until_samples_captured(sample_count)
-        self.stop_capture()
-        return self.get_capture_data(sample_count)
+        return self._capture_and_read(sample_count)
 
 
 class SR86xDataChannel(InstrumentChannel):
@@ -4,7 +4,6 @@ import re
 import struct
 from collections import abc
 from collections.abc import Sequence
-from io import BytesIO
 from time import localtime, sleep
 from typing import Any, ClassVar, Literal, NamedTuple, Optional, Union, cast
 
@@ -13,6 +12,7 @@ from pyvisa.errors import VisaIOError
 
 from qcodes import validators as vals
 from qcodes.instrument import VisaInstrument
+from qcodes.instrument_drivers.tektronix.waveform_cache import WaveformUploadCache
 
 log = logging.getLogger(__name__)
 
@@ -163,6 +163,12 @@ class TektronixAWG5014(VisaInstrument):
         ] = {}
         self._values["files"] = {}
 
+        self.waveform_cache = WaveformUploadCache()
+        """
+        The waveforms in the waveform list that have been uploaded by
+        :meth:`upload_waveforms`.
+        """
+
         self.add_function('reset', call_cmd='*RST')
 
         self.add_parameter('state',
@@ -852,7 +858,7 @@ class TektronixAWG5014(VisaInstrument):
             assert isinstance(value, (abc.Sequence, np.ndarray))
             if dtype[-1] == "H" and isinstance(value, np.ndarray):
                 # numpy conversion is fast
-                record_data = value.astype("<u2").tobytes()
+                record_data = value.astype("<u2", copy=False).tobytes()
             else:
                 # argument unpacking is slow
                 record_data = struct.pack("<" + dtype, *value)
@@ -862,7 +868,7 @@ class TektronixAWG5014(VisaInstrument):
         record_name_size = len(record_name)
         record_data_size = len(record_data)
         size_struct = struct.pack('<II', record_name_size, record_data_size)
-        packed_record = size_struct + record_name + record_data
+        packed_record = b"".join((size_struct, record_name, record_data))
 
         return packed_record
 
@@ -1114,30 +1120,31 @@ class TektronixAWG5014(VisaInstrument):
 
         timetuple = tuple(np.array(localtime())[[0, 1, 8, 2, 3, 4, 5, 6, 7]])
 
+        # the records are collected and joined once at the end to avoid
+        # copying the waveform data repeatedly
         # general settings
-        head_str = BytesIO()
-        bytes_to_write = (self._pack_record('MAGIC', 5000, 'h') +
-                          self._pack_record('VERSION', 1, 'h'))
-        head_str.write(bytes_to_write)
-        # head_str.write(string(bytes_to_write))
+        head_str: list[bytes] = [
+            self._pack_record("MAGIC", 5000, "h"),
+            self._pack_record("VERSION", 1, "h"),
+        ]
 
         if sequence_cfg is None:
             sequence_cfg = self.generate_sequence_cfg()
 
         for k in list(sequence_cfg.keys()):
             if k in self.AWG_FILE_FORMAT_HEAD:
-                head_str.write(self._pack_record(k, sequence_cfg[k],
-                                                 self.AWG_FILE_FORMAT_HEAD[k]))
+                head_str.append(self._pack_record(k, sequence_cfg[k],
+                                                  self.AWG_FILE_FORMAT_HEAD[k]))
             else:
                 log.warning(f"AWG: {k} not recognized as valid AWG setting")
         # channel settings
-        ch_record_str = BytesIO()
+        ch_record_str: list[bytes] = []
         for k in list(channel_cfg.keys()):
             ch_k = k[:-1] + 'N'
             if ch_k in self.AWG_FILE_FORMAT_CHANNEL:
                 pack = self._pack_record(k, channel_cfg[k],
                                          self.AWG_FILE_FORMAT_CHANNEL[ch_k])
-                ch_record_str.write(pack)
+                ch_record_str.append(pack)
 
             else:
                 log.warning(f"AWG: {k} not recognized as valid AWG channel setting")
@@ -1145,54 +1152,55 @@ class TektronixAWG5014(VisaInstrument):
         # waveforms
         ii = 21
 
-        wf_record_str = BytesIO()
+        wf_record_str: list[bytes] = []
         wlist = list(packed_waveforms.keys())
         wlist.sort()
         for wf in wlist:
             wfdat = packed_waveforms[wf]
             lenwfdat = len(wfdat)
 
-            wf_record_str.write(
+            wf_record_str.extend((
                 self._pack_record(f'WAVEFORM_NAME_{ii}', wf + '\x00',
-                                  '{}s'.format(len(wf + '\x00'))) +
-                self._pack_record(f'WAVEFORM_TYPE_{ii}', 1, 'h') +
+                                  '{}s'.format(len(wf + '\x00'))),
+                self._pack_record(f'WAVEFORM_TYPE_{ii}', 1, 'h'),
                 self._pack_record(f'WAVEFORM_LENGTH_{ii}',
-                                  lenwfdat, 'l') +
+                                  lenwfdat, 'l'),
                 self._pack_record(f'WAVEFORM_TIMESTAMP_{ii}',
-                                  timetuple[:-1], '8H') +
+                                  timetuple[:-1], '8H'),
                 self._pack_record(f'WAVEFORM_DATA_{ii}', wfdat,
-                                  f'{lenwfdat}H'))
+                                  f'{lenwfdat}H')))
             ii += 1
 
         # sequence
         kk = 1
-        seq_record_str = BytesIO()
+        seq_record_str: list[bytes] = []
 
         for segment in wfname_l.transpose():
 
-            seq_record_str.write(
+            seq_record_str.extend((
                 self._pack_record(f'SEQUENCE_WAIT_{kk}',
-                                  trig_wait[kk - 1], 'h') +
+                                  trig_wait[kk - 1], 'h'),
                 self._pack_record(f'SEQUENCE_LOOP_{kk}',
-                                  int(nrep[kk - 1]), 'l') +
+                                  int(nrep[kk - 1]), 'l'),
                 self._pack_record(f'SEQUENCE_JUMP_{kk}',
-                                  jump_to[kk - 1], 'h') +
+                                  jump_to[kk - 1], 'h'),
                 self._pack_record(f'SEQUENCE_GOTO_{kk}',
-                                  goto_state[kk - 1], 'h'))
+                                  goto_state[kk - 1], 'h')))
             for wfname in segment:
                 if wfname is not None:
                     # TODO (WilliamHPNielsen): maybe infer ch automatically
                     # from the data size?
                     ch = wfname[-1]
-                    seq_record_str.write(
+                    seq_record_str.append(
                         self._pack_record('SEQUENCE_WAVEFORM_NAME_CH_' + ch
                                           + f'_{kk}', wfname + '\x00',
                                           '{}s'.format(len(wfname + '\x00')))
                     )
             kk += 1
 
-        awg_file = (head_str.getvalue() + ch_record_str.getvalue() +
-                    wf_record_str.getvalue() + seq_record_str.getvalue())
+        awg_file = b"".join(
+            (*head_str, *ch_record_str, *wf_record_str, *seq_record_str)
+        )
         return awg_file
 
     def send_awg_file(
@@ -1236,6 +1244,8 @@ class TektronixAWG5014(VisaInstrument):
         b = s.encode(encoding="ASCII")
         log.debug(f'Loading awg file using {s}')
         self.visa_handle.write_raw(b)
+        # loading the file replaces the waveform list
+        self.waveform_cache.clear()
         # we must update the appropriate parameter(s) for the sequence
         self.sequence_length.set(self.sequence_length.get())
 
@@ -1347,6 +1357,8 @@ class TektronixAWG5014(VisaInstrument):
         Makes an .awg-file, sends it to the AWG and loads it. The .awg-file
         is uploaded to C:\\\\Users\\\\OEM\\\\Documents. The waveforms appear in
         the user defined waveform list with names wfm001ch1, wfm002ch1, ...
+        To update a sequence repeatedly, e.g. in a sweep, use
+        :meth:`upload_sequence`, which only sends the changed waveforms.
 
         Args:
             waveforms: A list of the waveforms to upload. The list
@@ -1525,22 +1537,18 @@ class TektronixAWG5014(VisaInstrument):
             raise TypeError(
                 "Waveform values out of bonds. Allowed values: -1 to 1 (inclusive)"
             )
-        if not np.all(np.isin(m1, np.array([0, 1]))):
+        if not np.all((m1 == 0) | (m1 == 1)):
             raise TypeError(
                 "Marker 1 contains invalid values. Only 0 and 1 are allowed"
             )
-        if not np.all(np.isin(m2, np.array([0, 1]))):
+        if not np.all((m2 == 0) | (m2 == 1)):
             raise TypeError(
                 "Marker 2 contains invalid values. Only 0 and 1 are allowed"
             )
 
-        # Note: we use np.trunc here rather than np.round
-        # as it is an order of magnitude faster
-        packed_wf = np.trunc(16384 * m1 + 32768 * m2
-                             + wf * 8191 + 8191.5).astype(np.uint16)
-
-        if len(np.where(packed_wf == -1)[0]) > 0:
-            print(np.where(packed_wf == -1))
+        # All values are positive so converting to an unsigned integer
+        # truncates them like np.trunc would
+        packed_wf = (16384 * m1 + 32768 * m2 + wf * 8191 + 8191.5).astype(np.uint16)
         return packed_wf
 
     ###########################
@@ -1587,6 +1595,7 @@ class TektronixAWG5014(VisaInstrument):
         channel is on, it will be switched off.
         """
         self.write('WLISt:WAVeform:DELete ALL')
+        self.waveform_cache.clear()
 
     def get_filenames(self) -> str:
         """Duplicate of self.get_folder_contents"""
@@ -1676,7 +1685,32 @@ class TektronixAWG5014(VisaInstrument):
             )
 
         self._values['files'][wfmname] = self._file_dict(w, m1, m2, None)
+        # the waveform may replace one uploaded by upload_waveforms
+        self.waveform_cache.discard(wfmname)
+
+        # Prepare the data block
+        number = ((2**13 - 1) + (2**13 - 1) * w + 2**14 *
+                  np.array(m1) + 2**15 * np.array(m2))
+        number = number.astype('int')
+        ws_array = arr.array('H', number)
+
+        self._write_waveform_to_list(wfmname, ws_array.tobytes(), dim)
+
+    def _write_waveform_to_list(
+            self,
+            wfmname: str,
+            data: bytes,
+            num_points: int) -> None:
+        """
+        Create a waveform in the "User defined" waveform list from data
+        in the 16-bit integer format of the AWG.
 
+        Args:
+            wfmname: The name of the waveform
+            data: The waveform and markers packed as little-endian
+                unsigned 16-bit integers
+            num_points: The number of points of the waveform
+        """
         # if we create a waveform with the same name but different size,
         # it will not get over written
         # Delete the possibly existing file (will do nothing if the file
@@ -1685,24 +1719,204 @@ class TektronixAWG5014(VisaInstrument):
         self.write(s)
 
         # create the waveform
-        s = f'WLISt:WAVeform:NEW "{wfmname}",{dim:d},INTEGER'
+        s = f'WLISt:WAVeform:NEW "{wfmname}",{num_points:d},INTEGER'
         self.write(s)
-        # Prepare the data block
-        number = ((2**13 - 1) + (2**13 - 1) * w + 2**14 *
-                  np.array(m1) + 2**15 * np.array(m2))
-        number = number.astype('int')
-        ws_array = arr.array('H', number)
-
-        ws = ws_array.tobytes()
         s1_str = f'WLISt:WAVeform:DATA "{wfmname}",'
         s1 = s1_str.encode('UTF-8')
-        s3 = ws
+        s3 = data
         s2_str = '#' + str(len(str(len(s3)))) + str(len(s3))
         s2 = s2_str.encode('UTF-8')
 
         mes = s1 + s2 + s3
         self.visa_handle.write_raw(mes)
 
+    def upload_waveforms(
+            self,
+            waveforms: Sequence[Sequence[np.ndarray]],
+            m1s: Sequence[Sequence[np.ndarray]],
+            m2s: Sequence[Sequence[np.ndarray]]
+    ) -> list[list[str]]:
+        """
+        Send waveforms to the "User defined" waveform list, skipping the
+        waveforms that are already in the list. The waveforms are named
+        after a hash of their content, see :class:`.WaveformUploadCache`,
+        so only new or changed waveforms are sent.
+
+        Args:
+            waveforms: A list of the waveforms to upload. The list
+                should be filled like so:
+                [[wfm1ch1, wfm2ch1, ...], [wfm1ch2, wfm2ch2], ...]
+                Each waveform should be a numpy array with values in the range
+                -1 to 1 (inclusive).
+            m1s: A list of marker 1's, filled like the waveforms.
+                Each marker should be a numpy array containing only 0's and 1's
+            m2s: A list of marker 2's, filled like the waveforms.
+                Each marker should be a numpy array containing only 0's and 1's
+
+        Returns:
+            The names of the waveforms in the waveform list, filled like
+            the waveforms.
+        """
+        waveform_names = []
+        for ch_wfms, ch_m1s, ch_m2s in zip(waveforms, m1s, m2s):
+            namelist = []
+            for wfm, m1, m2 in zip(ch_wfms, ch_m1s, ch_m2s):
+                package = self._pack_waveform(wfm, m1, m2)
+                data = package.astype("<u2", copy=False).tobytes()
+                wfmname = self.waveform_cache.waveform_name(data)
+                if wfmname not in self.waveform_cache:
+                    log.debug(f'Sending waveform {wfmname} to instrument')
+                    self._write_waveform_to_list(wfmname, data, len(package))
+                    self.waveform_cache.add(wfmname)
+                namelist.append(wfmname)
+            waveform_names.append(namelist)
+
+        return waveform_names
+
+    def link_sequence(
+            self,
+            waveform_names: Sequence[Sequence[str]],
+            nreps: Sequence[int],
+            trig_waits: Sequence[int],
+            goto_states: Sequence[int],
+            jump_tos: Sequence[int],
+            channels: Optional[Sequence[int]] = None
+    ) -> None:
+        """
+        Replace the sequence in the sequencer by a sequence of waveforms in
+        the waveform list and switch to the sequence run mode.
+
+        Args:
+            waveform_names: The names of the waveforms in the waveform list,
+                filled like so:
+                [[wfm1ch1, wfm2ch1, ...], [wfm1ch2, wfm2ch2], ...]
+            nreps: List of integers specifying the no. of
+                repetions per sequence element.  Allowed values: 0 to
+                65536. 0 corresponds to Infinite repetions.
+            trig_waits: List of len(segments) of integers specifying the
+                trigger wait state of each sequence element.
+                Allowed values: 0 (OFF) or 1 (ON).
+            goto_states: List of len(segments) of integers
+                specifying the goto state of each sequence
+                element. Allowed values: 0 to 65536 (0 means next)
+            jump_tos: List of len(segments) of integers specifying
+                the event jump target of each sequence element. Allowed
+                values: 0 (OFF), -1 (next) or an element number.
+            channels: List of channels to play the waveforms on.
+                Default: 1, 2, ...
+
+        Raises:
+            ValueError: If the lengths of the inputs do not match.
+        """
+        num_elements = len(nreps)
+        if not all(len(lst) == num_elements
+                   for lst in (trig_waits, goto_states, jump_tos,
+                               *waveform_names)):
+            raise ValueError('All input lists must have the same length!')
+        if channels is None:
+            channels = list(range(1, len(waveform_names) + 1))
+
+        # clear the sequence such that no settings of a previous
+        # sequence are left
+        self.sequence_length.set(0)
+        self.sequence_length.set(num_elements)
+        for element_no in range(1, num_elements + 1):
+            for channel, namelist in zip(channels, waveform_names):
+                self.set_sqel_waveform(namelist[element_no - 1], channel,
+                                       element_no)
+            nrep = nreps[element_no - 1]
+            if nrep == 0:
+                self.set_sqel_loopcnt_to_inf(element_no, state=1)
+            else:
+                self.set_sqel_loopcnt_to_inf(element_no, state=0)
+                self.set_sqel_loopcnt(nrep, element_no)
+            self.write(f'SEQuence:ELEMent{element_no}:TWAit '
+                       f'{trig_waits[element_no - 1]}')
+            goto_state = goto_states[element_no - 1]
+            if goto_state == 0:
+                self.set_sqel_goto_state(element_no, 0)
+            else:
+                self.set_sqel_goto_state(element_no, 1)
+                self.set_sqel_goto_target_index(element_no, goto_state)
+            jump_to = jump_tos[element_no - 1]
+            if jump_to == 0:
+                self.set_sqel_event_jump_type(element_no, 'OFF')
+            elif jump_to == -1:
+                self.set_sqel_event_jump_type(element_no, 'NEXT')
+            else:
+                self.set_sqel_event_jump_type(element_no, 'INDEX')
+                self.set_sqel_event_jump_target_index(element_no, jump_to)
+        self.run_mode.set('SEQ')
+
+    def upload_sequence(
+            self,
+            waveforms: Sequence[Sequence[np.ndarray]],
+            m1s: Sequence[Sequence[np.ndarray]],
+            m2s: Sequence[Sequence[np.ndarray]],
+            nreps: Sequence[int],
+            trig_waits: Sequence[int],
+            goto_states: Sequence[int],
+            jump_tos: Sequence[int],
+            channels: Optional[Sequence[int]] = None
+    ) -> list[list[str]]:
+        """
+        Send the waveforms that are not already in the waveform list to the
+        AWG and replace the sequence in the sequencer by a sequence of the
+        waveforms. Unlike :meth:`make_send_and_load_awg_file` this only
+        sends the waveforms that have changed since the previous call and
+        leaves the channel settings untouched, so updating a sequence in
+        a sweep is fast.
+
+        Args:
+            waveforms: A list of the waveforms to upload. The list
+                should be filled like so:
+                [[wfm1ch1, wfm2ch1, ...], [wfm1ch2, wfm2ch2], ...]
+                Each waveform should be a numpy array with values in the range
+                -1 to 1 (inclusive).
+            m1s: A list of marker 1's, filled like the waveforms.
+            m2s: A list of marker 2's, filled like the waveforms.
+            nreps: List of integers specifying the no. of
+                repetions per sequence element.  Allowed values: 0 to
+                65536. 0 corresponds to Infinite repetions.
+            trig_waits: List of len(segments) of integers specifying the
+                trigger wait state of each sequence element.
+                Allowed values: 0 (OFF) or 1 (ON).
+            goto_states: List of len(segments) of integers
+                specifying the goto state of each sequence
+                element. Allowed values: 0 to 65536 (0 means next)
+            jump_tos: List of len(segments) of integers specifying
+                the event jump target of each sequence element. Allowed
+                values: 0 (OFF), -1 (next) or an element number.
+            channels: List of channels to play the waveforms on.
+                Default: 1, 2, ...
+
+        Returns:
+            The names of the waveforms in the waveform list, filled like
+            the waveforms.
+        """
+        waveform_names = self.upload_waveforms(waveforms, m1s, m2s)
+        self.link_sequence(waveform_names, nreps, trig_waits, goto_states,
+                           jump_tos, channels=channels)
+        return waveform_names
+
+    def delete_unused_waveforms(
+            self,
+            waveform_names: Sequence[Sequence[str]]
+    ) -> None:
+        """
+        Delete the waveforms uploaded by :meth:`upload_waveforms` that are
+        not among ``waveform_names`` from the waveform list, e.g. to free
+        the memory of the AWG in a long sweep.
+
+        Args:
+            waveform_names: The names of the waveforms to keep, e.g. as
+                returned by :meth:`upload_sequence`.
+        """
+        in_use = {name for namelist in waveform_names for name in namelist}
+        for wfmname in sorted(self.waveform_cache.unused(in_use)):
+            self.write(f'WLISt:WAVeform:DEL "{wfmname}"')
+            self.waveform_cache.discard(wfmname)
+
     def clear_message_queue(self, verbose: bool = False) -> None:
         """
         Function to clear up (flush) the VISA message queue of the AWG
@@ -3,7 +3,6 @@ from __future__ import annotations
 import datetime as dt
 import io
 import logging
-import struct
 import time
 import xml.etree.ElementTree as ET
 import zipfile as zf
@@ -15,6 +14,7 @@ from broadbean.sequence import InvalidForgedSequenceError, fs_schema
 
 from qcodes import validators as vals
 from qcodes.instrument import ChannelList, Instrument, InstrumentChannel, VisaInstrument
+from qcodes.instrument_drivers.tektronix.waveform_cache import WaveformUploadCache
 from qcodes.parameters import create_on_off_val_mapping
 
 if TYPE_CHECKING:
@@ -527,6 +527,12 @@ class AWG70000A(VisaInstrument):
         self.wfmxFileFolder = "\\Users\\OEM\\Documents"
         self.seqxFileFolder = "\\Users\\OEM\\Documents"
 
+        self.waveform_cache = WaveformUploadCache()
+        """
+        The waveforms in the waveform list that have been uploaded by
+        :meth:`upload_waveforms`.
+        """
+
         self.current_directory(self.wfmxFileFolder)
 
         self.connect_message()
@@ -632,6 +638,7 @@ class AWG70000A(VisaInstrument):
         Clear the waveform list
         """
         self.write('WLISt:WAVeform:DELete ALL')
+        self.waveform_cache.clear()
 
     @staticmethod
     def makeWFMXFile(data: np.ndarray, amplitude: float) -> bytes:
@@ -781,6 +788,198 @@ class AWG70000A(VisaInstrument):
         # the above command is overlapping, but we want a blocking command
         self.ask('*OPC?')
 
+    def upload_waveforms(
+        self, wfms: Sequence[Sequence[np.ndarray]], amplitudes: Sequence[float]
+    ) -> list[list[str]]:
+        """
+        Send waveforms to the waveform list, skipping the waveforms that
+        are already in the list. The waveforms are named after a hash of
+        their content, see :class:`.WaveformUploadCache`, so only new or
+        changed waveforms are sent. Each waveform is sent as a .wfmx file
+        to the wfmxFileFolder, loaded from there and the file is deleted
+        again.
+
+        Args:
+            wfms: numpy arrays describing each waveform plus two markers,
+                packed like np.array([wfm, m1, m2]). These numpy arrays
+                are then again packed in lists according to:
+                [[wfmch1pos1, wfmch1pos2, ...], [wfmch2pos1, ...], ...]
+            amplitudes: The peak-to-peak amplitude in V of the channels, i.e.
+                a list [ch1_amp, ch2_amp].
+
+        Returns:
+            The names of the waveforms in the waveform list, packed like
+            the waveforms.
+        """
+        # drop waveforms that have been deleted by other means
+        self.waveform_cache.sync(self.waveformList)
+
+        waveform_names = []
+        for amplitude, wfm_lst in zip(amplitudes, wfms):
+            namelist = []
+            for wfm in wfm_lst:
+                binary_data = self._makeWFMXFileBinaryData(wfm, amplitude)
+                wfmname = self.waveform_cache.waveform_name(binary_data)
+                if wfmname not in self.waveform_cache:
+                    header = self._makeWFMXFileHeader(
+                        num_samples=np.shape(wfm)[-1],
+                        markers_included=np.ndim(wfm) > 1,
+                    )
+                    filename = f"{wfmname}.wfmx"
+                    self.sendWFMXFile(bytes(header, "ascii") + binary_data, filename)
+                    self.loadWFMXFile(filename)
+                    # the waveform is now in the waveform list, so the file
+                    # is deleted such that files do not pile up on the disk
+                    self.write(f'MMEMory:DELete "{filename}"')
+                    self.waveform_cache.add(wfmname)
+                namelist.append(wfmname)
+            waveform_names.append(namelist)
+
+        return waveform_names
+
+    def link_sequence(
+        self,
+        trig_waits: Sequence[int],
+        nreps: Sequence[int],
+        event_jumps: Sequence[int],
+        event_jump_to: Sequence[int],
+        go_to: Sequence[int],
+        waveform_names: Sequence[Sequence[str]],
+        seqname: str,
+        flags: Sequence[Sequence[Sequence[int]]] | None = None,
+    ) -> None:
+        """
+        Make a sequence in the sequence list from waveforms in the waveform
+        list, e.g. the waveforms uploaded by :meth:`upload_waveforms`. A
+        sequence with the same name is replaced. Like after loading a
+        .seqx file, the sequence must then be assigned to the channels
+        with ``setSequenceTrack``.
+
+        Args:
+            trig_waits: Wait for a trigger? If yes, you must specify the
+                trigger input. 0 for off, 1 for 'TrigA', 2 for 'TrigB',
+                3 for 'Internal'.
+            nreps: No. of repetitions. 0 corresponds to infinite.
+            event_jumps: Jump when event triggered? If yes, you must specify
+                the trigger input. 0 for off, 1 for 'TrigA', 2 for 'TrigB',
+                3 for 'Internal'.
+            event_jump_to: Jump target in case of event. 1-indexed,
+                0 means next. Must be specified for all elements.
+            go_to: Which element to play next. 1-indexed, 0 means next.
+            waveform_names: The names of the waveforms in the waveform list,
+                packed like:
+                [[wfmch1pos1, wfmch1pos2, ...], [wfmch2pos1, ...], ...]
+            seqname: The name of the sequence. This name will appear in the
+                sequence list. Note that all spaces are converted to '_'
+            flags: Flags for the auxiliary outputs. 0 for 'No change', 1 for
+                'High', 2 for 'Low', 3 for 'Toggle', or 4 for 'Pulse'. 4 flags
+                [A, B, C, D] for every channel in every element, packed like:
+                [[ch1pos1, ch1pos2, ...], [ch2pos1, ...], ...]
+                If omitted, no flags will be set.
+
+        Raises:
+            ValueError: If the lengths of the inputs do not match.
+        """
+        inputs = {0: "OFF", 1: "ATRigger", 2: "BTRigger", 3: "ITRigger"}
+        flaginputs = {0: "NCHange", 1: "HIGH", 2: "LOW", 3: "TOGGle", 4: "PULSe"}
+
+        seqname = seqname.replace(" ", "_")
+        num_steps = len(nreps)
+        if not all(
+            len(lst) == num_steps
+            for lst in (trig_waits, event_jumps, event_jump_to, go_to, *waveform_names)
+        ):
+            raise ValueError("All input lists must have the same length!")
+        if num_steps == 0:
+            raise ValueError("Received empty sequence option lengths!")
+
+        if seqname in self.sequenceList:
+            self.delete_sequence_from_list(seqname)
+        self.write(f'SLISt:SEQuence:NEW "{seqname}",{num_steps},{len(waveform_names)}')
+
+        cmd = "SLISt:SEQuence:STEP{}:{} " + f'"{seqname}",' + "{}"
+        for n in range(1, num_steps + 1):
+            for track, namelist in enumerate(waveform_names, start=1):
+                self.write(
+                    cmd.format(n, f"TASSet{track}:WAVeform", f'"{namelist[n - 1]}"')
+                )
+            if nreps[n - 1] == 0:
+                repeat = "INFinite"
+            elif nreps[n - 1] == 1:
+                repeat = "ONCE"
+            else:
+                repeat = f"{nreps[n - 1]:d}"
+            self.write(cmd.format(n, "RCOunt", repeat))
+            self.write(cmd.format(n, "WINPut", inputs[trig_waits[n - 1]]))
+            self.write(cmd.format(n, "EJINput", inputs[event_jumps[n - 1]]))
+            jump_to = event_jump_to[n - 1]
+            self.write(cmd.format(n, "EJUMp", f"{jump_to:d}" if jump_to else "NEXT"))
+            goto = go_to[n - 1]
+            self.write(cmd.format(n, "GOTO", f"{goto:d}" if goto else "NEXT"))
+            if flags is not None:
+                for track, chflags in enumerate(flags, start=1):
+                    for flagname, flag in zip("ABCD", chflags[n - 1]):
+                        self.write(
+                            cmd.format(
+                                n, f"TFLag{track}:{flagname}FLag", flaginputs[flag]
+                            )
+                        )
+
+    def upload_sequence(
+        self,
+        trig_waits: Sequence[int],
+        nreps: Sequence[int],
+        event_jumps: Sequence[int],
+        event_jump_to: Sequence[int],
+        go_to: Sequence[int],
+        wfms: Sequence[Sequence[np.ndarray]],
+        amplitudes: Sequence[float],
+        seqname: str,
+        flags: Sequence[Sequence[Sequence[int]]] | None = None,
+    ) -> list[list[str]]:
+        """
+        Send the waveforms that are not already in the waveform list to the
+        AWG and make a sequence of them in the sequence list. Unlike sending
+        and loading the output of :meth:`makeSEQXFile` this only sends the
+        waveforms that have changed since the previous call, so updating a
+        sequence in a sweep is fast. The arguments are the same as for
+        :meth:`makeSEQXFile`. Like after loading a .seqx file, the sequence
+        must then be assigned to the channels with ``setSequenceTrack``.
+
+        Returns:
+            The names of the waveforms in the waveform list, packed like
+            the waveforms.
+        """
+        waveform_names = self.upload_waveforms(wfms, amplitudes)
+        self.link_sequence(
+            trig_waits,
+            nreps,
+            event_jumps,
+            event_jump_to,
+            go_to,
+            waveform_names,
+            seqname,
+            flags=flags,
+        )
+        return waveform_names
+
+    def delete_unused_waveforms(self, waveform_names: Sequence[Sequence[str]]) -> None:
+        """
+        Delete the waveforms uploaded by :meth:`upload_waveforms` that are
+        not among ``waveform_names`` from the waveform list, e.g. to free
+        the memory of the AWG in a long sweep. Waveforms used by other
+        sequences in the sequence list must be included in
+        ``waveform_names``.
+
+        Args:
+            waveform_names: The names of the waveforms to keep, e.g. as
+                returned by :meth:`upload_sequence`.
+        """
+        in_use = {name for namelist in waveform_names for name in namelist}
+        for wfmname in sorted(self.waveform_cache.unused(in_use)):
+            self.write(f'WLISt:WAVeform:DELete "{wfmname}"')
+            self.waveform_cache.discard(wfmname)
+
     @staticmethod
     def _makeWFMXFileHeader(num_samples: int,
                             markers_included: bool) -> str:
@@ -904,19 +1103,22 @@ class AWG70000A(VisaInstrument):
         shape = np.shape(data)
 
         if len(shape) == 1:
-            N = shape[0]
             binary_marker = b''
-            wfm = data
+            wfm = np.asarray(data)
         else:
-            N = shape[1]
             M = shape[0]
             wfm = data[0, :]
-            markers = data[1, :]
+            markers = data[1, :].copy()
             for i in range(1, M-1):
                 markers += data[i+1, :] * (2**i)
             markers = markers.astype(int)
-            fmt = N*'B'  # endian-ness doesn't matter for one byte
-            binary_marker = struct.pack(fmt, *markers)
+            if markers.size and (markers.min() < 0 or markers.max() > 255):
+                raise ValueError(
+                    "Markers must combine to values between 0 and 255, got "
+                    f"values between {markers.min()} and {markers.max()}."
+                )
+            # endian-ness doesn't matter for one byte
+            binary_marker = markers.astype(np.uint8).tobytes()
 
         if wfm.max() > channel_max or wfm.min() < channel_min:
             log.warning(
@@ -929,11 +1131,7 @@ class AWG70000A(VisaInstrument):
         # the data must be such that channel_max becomes 1 and
         # channel_min becomes -1
         scale = 2/amplitude
-        wfm = wfm*scale
-
-        # TODO: Is this a fast method?
-        fmt = '<' + N*'f'
-        binary_wfm = struct.pack(fmt, *wfm)
+        binary_wfm = (wfm * scale).astype('<f4').tobytes()
         binary_out = binary_wfm + binary_marker
 
         return binary_out
@@ -325,17 +325,10 @@ def _unpacker(
         The waveform scaled to have values from -1 to 1, marker 1, marker 2.
     """
 
-    wflength = len(binaryarray)
-    wf = np.zeros(wflength)
-    m1 = np.zeros(wflength)
-    m2 = np.zeros(wflength)
-
-    for ii, bitnum in enumerate(binaryarray):
-        bitstring = bin(bitnum)[2:].zfill(16)
-        m2[ii] = int(bitstring[0])
-        m1[ii] = int(bitstring[1])
-        wf[ii] = (int(bitstring[2:], base=2)-2**13)/2**13
-        # print(bitstring, int(bitstring[2:], base=2))
+    binaryarray = np.asarray(binaryarray, dtype=np.uint16)
+    m2 = (binaryarray >> 15).astype(float)
+    m1 = ((binaryarray >> 14) & 1).astype(float)
+    wf = ((binaryarray & 0x3FFF).astype(float) - 2**13) / 2**13
 
     return wf, m1, m2
 
@@ -432,20 +425,24 @@ def _parser1(
                 namestop = name[name.find('_')+1:].find('_')+name.find('_')
                 lookupname = name[:namestop+1]
 
+                (number, barename) = _getendingnumber(name)
+                fieldname = barename + f"{number-20}"
+                waveformlist[0].append(fieldname)
+
                 if 'DATA' in name:
                     if wfmlen is None:
                         raise ValueError(
                             "Found DATA before LENGTH: this is unexpected."
                         )
-                    fmtstr = f"{wfmlen}H"
-                    AWG_FILE_FORMAT_WAV["WAVEFORM_DATA"] = fmtstr
+                    # numpy conversion is much faster than struct unpacking
+                    waveformlist[1].append(
+                        np.frombuffer(rawvalue, dtype='<u2', count=wfmlen)
+                    )
+                    continue
 
                 file_format = AWG_FILE_FORMAT_WAV[lookupname]
                 assert file_format is not None
                 value = _unwrap(rawvalue, file_format)
-                (number, barename) = _getendingnumber(name)
-                fieldname = barename + f"{number-20}"
-                waveformlist[0].append(fieldname)
                 waveformlist[1].append(value)
 
                 if 'LENGTH' in name:
@@ -337,11 +337,10 @@ class TekronixDPOWaveform(InstrumentChannel):
 
             is_big_endian = waveform.is_big_endian()
 
-            raw_data = self.root_instrument.visa_handle.query_binary_values(
+            raw_data = self.root_instrument.ask_binary(
                 "CURVE?",
-                datatype=data_type,
+                dtype=data_type,
                 is_big_endian=is_big_endian,
-                container=np.array
             )
 
         return (raw_data - self.raw_data_offset()) * self.scale() \
@@ -24,6 +24,7 @@ from .Tektronix_DSA70000 import TektronixDSA70000
 from .Tektronix_MSO5000 import TektronixMSO5000
 from .Tektronix_MSO70000 import TektronixMSO70000
 from .TPS2012 import TektronixTPS2012, TektronixTPS2012Channel
+from .waveform_cache import WaveformUploadCache
 
 __all__ = [
     "TekronixDPOTrigger",
@@ -51,4 +52,5 @@ __all__ = [
     "TektronixMSO70000",
     "TektronixTPS2012",
     "TektronixTPS2012Channel",
+    "WaveformUploadCache",
 ]
@@ -0,0 +1,88 @@
+"""
+Bookkeeping of the waveforms that have been uploaded to the waveform list
+of a Tektronix AWG, such that unchanged waveforms are not uploaded again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class WaveformUploadCache:
+    """
+    Record of the waveforms an AWG driver has uploaded to the waveform list
+    of the instrument.
+
+    Waveforms are named after a hash of their packed content, so a waveform
+    whose name is in the cache is already in the waveform list with exactly
+    that content and does not have to be uploaded again. Changing a single
+    segment of a sequence thus only uploads that segment.
+
+    The cache is cleared by the driver methods that clear or replace the
+    waveform list. If the waveform list is modified by other means, e.g. on
+    the front panel of the instrument, the cache must be cleared with
+    :meth:`clear`.
+
+    Args:
+        prefix: Prefix of the names of the waveforms.
+    """
+
+    def __init__(self, prefix: str = "qc"):
+        self.prefix = prefix
+        self._names: set[str] = set()
+
+    def waveform_name(self, packed: bytes) -> str:
+        """
+        Return the name of the waveform with the given packed content.
+
+        Args:
+            packed: The waveform as it is sent to the instrument.
+        """
+        digest = hashlib.blake2b(packed, digest_size=8).hexdigest()
+        return f"{self.prefix}_{digest}"
+
+    @property
+    def names(self) -> frozenset[str]:
+        """The names of the waveforms in the cache."""
+        return frozenset(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str) -> None:
+        """Record that the waveform ``name`` has been uploaded."""
+        self._names.add(name)
+
+    def discard(self, name: str) -> None:
+        """Remove the waveform ``name`` from the cache if it is present."""
+        self._names.discard(name)
+
+    def clear(self) -> None:
+        """Remove all waveforms from the cache."""
+        self._names.clear()
+
+    def sync(self, waveform_list: Iterable[str]) -> None:
+        """
+        Remove the waveforms that are no longer in the waveform list of the
+        instrument from the cache.
+
+        Args:
+            waveform_list: The names of the waveforms in the waveform list.
+        """
+        self._names.intersection_update(waveform_list)
+
+    def unused(self, used_names: Iterable[str]) -> set[str]:
+        """
+        Return the waveforms in the cache that are not in ``used_names``.
+
+        Args:
+            used_names: The names of the waveforms that are in use.
+        """
+        return self._names.difference(used_names)
@@ -10,6 +10,7 @@ and functions to extract log messages to :class:`pandas.DataFrame` s
 """
 
 from .instrument_logger import filter_instrument, get_instrument_logger
+from .io_trace import IOTrace, IOTraceEntry, ResponseSummary
 from .log_analysis import (
     capture_dataframe,
     log_to_dataframe,
@@ -32,7 +33,10 @@ from .logger import (
 )
 
 __all__ = [
+    "IOTrace",
+    "IOTraceEntry",
     "LogCapture",
+    "ResponseSummary",
     "capture_dataframe",
     "console_level",
     "filter_instrument",
@@ -0,0 +1,162 @@
+"""
+A ring buffer of the most recent I/O operations of an instrument.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, NamedTuple
+
+import numpy as np
+
+MAX_RESPONSE_LENGTH = 200
+"""
+Longest string or bytes response stored in an :class:`IOTrace`. Longer
+responses are stored as a :class:`ResponseSummary`.
+"""
+
+
+class ResponseSummary(NamedTuple):
+    """
+    Summary of a response that an :class:`IOTrace` stores instead of the
+    response itself, such that the trace does not keep large data alive.
+    """
+
+    description: str
+    """Type and size of the response and, if any, its first characters."""
+
+    def __repr__(self) -> str:
+        return f"<{self.description}>"
+
+
+def _summarize_response(response: Any) -> Any:
+    """
+    Return the response if it is small, otherwise a :class:`ResponseSummary`
+    of it. Arrays are always summarized by their shape and dtype.
+    """
+    if isinstance(response, np.ndarray):
+        return ResponseSummary(
+            f"ndarray shape={response.shape} dtype={response.dtype}"
+        )
+    if (
+        isinstance(response, (str, bytes, bytearray))
+        and len(response) > MAX_RESPONSE_LENGTH
+    ):
+        head = response[:MAX_RESPONSE_LENGTH]
+        return ResponseSummary(
+            f"{type(response).__name__} of length {len(response)}: {head!r}..."
+        )
+    return response
+
+
+class IOTraceEntry(NamedTuple):
+    """A single I/O operation recorded by an :class:`IOTrace`."""
+
+    timestamp: float
+    """Wall clock time at which the operation started, in seconds since the epoch."""
+    duration: float
+    """Time taken by the operation in seconds."""
+    operation: str
+    """The kind of operation, e.g. ``write`` or ``ask``."""
+    command: str
+    """The command sent to the instrument."""
+    response: Any
+    """
+    The response of the instrument, None for a write. Arrays and long
+    responses are stored as a :class:`ResponseSummary`.
+    """
+    error: BaseException | None
+    """The exception raised by the operation, None if it succeeded."""
+
+
+class IOTrace:
+    """
+    Ring buffer recording the most recent I/O operations of an instrument.
+
+    Recording an operation only stores a tuple of the raw command and
+    response without any formatting, so tracing can be left enabled in
+    fast loops. Arrays and long responses, e.g. binary traces, are stored
+    as a short :class:`ResponseSummary` so that the trace stays small. The
+    trace is formatted only when it is dumped, e.g. after an error. See
+    :meth:`.Instrument.enable_io_trace`.
+
+    Args:
+        maxlen: Number of operations to keep. Older operations are discarded.
+    """
+
+    def __init__(self, maxlen: int = 1000):
+        self._entries: deque[IOTraceEntry] = deque(maxlen=maxlen)
+        # offset between the wall clock and the high resolution counter
+        # used to time operations
+        self._time_offset = time.time() - time.perf_counter()
+
+    @property
+    def maxlen(self) -> int | None:
+        """Number of operations kept in the trace."""
+        return self._entries.maxlen
+
+    def record(
+        self,
+        operation: str,
+        command: str,
+        response: Any,
+        t_start: float,
+        t_stop: float,
+        error: BaseException | None = None,
+    ) -> None:
+        """
+        Record an operation.
+
+        Args:
+            operation: The kind of operation, e.g. ``write`` or ``ask``.
+            command: The command sent to the instrument.
+            response: The response of the instrument. Arrays and long
+                responses are replaced by a :class:`ResponseSummary`.
+            t_start: Value of :func:`time.perf_counter` when the operation
+                started.
+            t_stop: Value of :func:`time.perf_counter` when the operation
+                completed.
+            error: The exception raised by the operation if any.
+        """
+        self._entries.append(
+            IOTraceEntry(
+                t_start + self._time_offset,
+                t_stop - t_start,
+                operation,
+                command,
+                _summarize_response(response),
+                error,
+            )
+        )
+
+    def entries(self) -> list[IOTraceEntry]:
+        """Return the recorded operations, oldest first."""
+        return list(self._entries)
+
+    def clear(self) -> None:
+        """Remove all recorded operations."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def format(self) -> str:
+        """
+        Format the recorded operations as one line per operation, oldest
+        first.
+        """
+        lines = []
+        for entry in self._entries:
+            timestamp = datetime.fromtimestamp(entry.timestamp).strftime("%H:%M:%S.%f")
+            line = (
+                f"{timestamp} {entry.duration * 1e3:9.3f} ms "
+                f"{entry.operation} {entry.command!r}"
+            )
+            if entry.response is not None:
+                line += f" -> {entry.response!r}"
+            if entry.error is not None:
+                line += f" !! {entry.error!r}"
+            lines.append(line)
+        return "\n".join(lines)
@@ -84,6 +84,7 @@ from .parameter_base import (
     invert_val_mapping,
 )
 from .parameter_with_setpoints import ParameterWithSetpoints, expand_setpoints_helper
+from .ramp import RampAbortedError, RampProgress
 from .scaled_paramter import ScaledParameter
 from .specialized_parameters import ElapsedTimeParameter, InstrumentRefParameter
 from .sweep_values import SweepFixedValues, SweepValues
@@ -110,6 +111,8 @@ __all__ = [
     "Parameter",
     "ParameterBase",
     "ParameterWithSetpoints",
+    "RampAbortedError",
+    "RampProgress",
     "ScaledParameter",
     "SweepFixedValues",
     "SweepValues",
@@ -305,7 +305,14 @@ class Group:
                 f"parameters - {parameter_names} since it "
                 f"has no `get_cmd` defined."
             )
-        ret = self.get_parser(self.instrument.ask(self._get_cmd))
+        ret_str = self.instrument.ask(self._get_cmd)
+        # within a batch of the root instrument (see VisaInstrument.batch)
+        # the gets of the other parameters of the group are answered from
+        # the same response rather than by querying the instrument again
+        batch = getattr(self.instrument.root_instrument, "active_batch", None)
+        if batch is not None:
+            batch.reuse_response(self._get_cmd, ret_str, len(self.parameters) - 1)
+        ret = self.get_parser(ret_str)
         for name, p in list(self.parameters.items()):
             p.cache._set_from_raw_value(ret[name])
 
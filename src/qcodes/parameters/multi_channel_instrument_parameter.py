@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from .multi_parameter import MultiParameter
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from contextlib import AbstractContextManager
 
     from qcodes.instrument.channel import InstrumentModule
 
-    from .parameter_base import ParamRawDataType
+    from .parameter_base import ParameterBase, ParamRawDataType
 
 InstrumentModuleType = TypeVar("InstrumentModuleType", bound="InstrumentModule")
 
@@ -21,6 +23,14 @@ class MultiChannelInstrumentParameter(MultiParameter, Generic[InstrumentModuleTy
     Will normally be created by a :class:`ChannelList` and not directly by
     anything else.
 
+    The parameter of all channels is gotten or set with a single call to
+    the ``_bulk_get`` or ``_bulk_set`` hook of the channel class if the
+    driver implements it, see :meth:`.InstrumentModule._bulk_get`.
+    Otherwise the channels are gotten or set one by one. For a
+    :class:`.VisaInstrument` that supports batched queries this is done
+    within a :meth:`.VisaInstrument.batch` such that all channels still
+    take a single round trip to the instrument.
+
     Args:
         channels: A list of channels which we can operate on
           simultaneously.
@@ -38,23 +48,81 @@ class MultiChannelInstrumentParameter(MultiParameter, Generic[InstrumentModuleTy
         self._channels = channels
         self._param_name = param_name
 
+    def _channel_parameters(self) -> list[ParameterBase]:
+        return [chan.parameters[self._param_name] for chan in self._channels]
+
+    def _batch(self) -> tuple[AbstractContextManager[Any], bool]:
+        """
+        Return a batch of the root instrument of the channels if it supports
+        batched queries, and whether it does.
+        """
+        root_instrument = self._channels[0].root_instrument
+        if getattr(root_instrument, "supports_batched_queries", False):
+            return root_instrument.batch(), True
+        return nullcontext(), False
+
     def get_raw(self) -> tuple[ParamRawDataType, ...]:
         """
         Return a tuple containing the data from each of the channels in the
         list.
         """
-        return tuple(chan.parameters[self._param_name].get() for chan in self._channels)
+        if len(self._channels) == 0:
+            return ()
+        parameters = self._channel_parameters()
+        values = type(self._channels[0])._bulk_get(self._channels, self._param_name)
+        if values is not None:
+            values = tuple(values)
+            if len(values) != len(parameters):
+                raise RuntimeError(
+                    f"Bulk get of {self._param_name} returned {len(values)} "
+                    f"values for {len(parameters)} channels."
+                )
+            for parameter, value in zip(parameters, values):
+                parameter.cache.set(value)
+            return values
+        batch_context, batched = self._batch()
+        with batch_context as batch:
+            if batched:
+                batch.prefetch(parameters)
+            return tuple(parameter.get() for parameter in parameters)
 
     def set_raw(self, value: ParamRawDataType) -> None:
         """
         Set all parameters to this value.
 
+        The value is validated and converted to the raw value of each
+        channel parameter before it is passed to the ``_bulk_set`` hook.
+        Parameters that are set in steps or with an ``inter_delay`` or
+        ``post_delay`` are always set one by one and outside of a batch
+        such that their ramps and delays are respected.
+
         Args:
             value: The value to set to. The type is given by the
                 underlying parameter.
         """
-        for chan in self._channels:
-            getattr(chan, self._param_name).set(value)
+        if len(self._channels) == 0:
+            return
+        parameters = self._channel_parameters()
+        if any(_is_ramped(parameter) for parameter in parameters):
+            for parameter in parameters:
+                parameter.set(value)
+            return
+
+        for parameter in parameters:
+            parameter.validate(value)
+        raw_values = [
+            parameter._from_value_to_raw_value(value) for parameter in parameters
+        ]
+        if type(self._channels[0])._bulk_set(
+            self._channels, self._param_name, raw_values
+        ):
+            for parameter, raw_value in zip(parameters, raw_values):
+                parameter.cache._update_with(value=value, raw_value=raw_value)
+            return
+        batch_context, _ = self._batch()
+        with batch_context:
+            for parameter in parameters:
+                parameter.set(value)
 
     @property
     def full_names(self) -> tuple[str, ...]:
@@ -65,3 +133,15 @@ class MultiChannelInstrumentParameter(MultiParameter, Generic[InstrumentModuleTy
         """
 
         return self.names
+
+
+def _is_ramped(parameter: ParameterBase) -> bool:
+    """
+    Whether setting the parameter steps to the value or waits between or
+    after sets.
+    """
+    return (
+        parameter.step is not None
+        or parameter.inter_delay > 0
+        or parameter.post_delay > 0
+    )
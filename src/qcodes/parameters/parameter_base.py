@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import collections.abc
 import logging
 import time
@@ -15,7 +16,13 @@ from qcodes.validators import Enum, Ints, Validator
 
 from .cache import _Cache, _CacheProtocol
 from .named_repr import named_repr
-from .permissive_range import permissive_range
+from .ramp import (
+    RampAbortedError,
+    RampProgress,
+    ramp_values,
+    sleep_until,
+    validates_by_bounds,
+)
 
 # for now the type the parameter may contain is not restricted at all
 ParamDataType = Any
@@ -26,6 +33,7 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from qcodes.instrument.base import InstrumentBase
+    from qcodes.instrument.io_stats import InstrumentIOStats
 
 LOG = logging.getLogger(__name__)
 
@@ -252,6 +260,9 @@ class ParameterBase(MetadatableWithName):
         self.get_latest: GetLatest
         self.get_latest = GetLatest(self)
 
+        # get and set methods wrapped by a timer when io statistics are enabled
+        self._untimed_methods: dict[str, Callable[..., Any]] = {}
+
         self.get: Callable[..., ParamDataType]
         implements_get_raw = hasattr(self, "get_raw") and not getattr(
             self.get_raw, "__qcodes_is_abstract_method__", False
@@ -300,6 +311,15 @@ class ParameterBase(MetadatableWithName):
         # Specify time of last set operation, used when comparing to delay to
         # check if additional waiting time is needed before next set
         self._t_last_set = time.perf_counter()
+        self._ramp_progress: RampProgress | None = None
+        self._ramp_abort_requested = False
+        self.hardware_ramp: Callable[[ParamRawDataType], None] | None = None
+        """
+        Optional function used instead of stepping in software when the
+        parameter has a ``step``. It is called with the raw target value and
+        should return once the instrument has ramped to that value, e.g.
+        by using a ramp rate built into the instrument.
+        """
         # should we call validate when getting data. default to False
         # intended to be changed in a subclass if you want the subclass
         # to perform a validation on get
@@ -690,40 +710,71 @@ class ParameterBase(MetadatableWithName):
                     )
                 self.validate(value)
 
+                if self.hardware_ramp is not None and self.step is not None:
+                    self._set_with_hardware_ramp(value)
+                    return
+
                 # In some cases intermediate sweep values must be used.
                 # Unless `self.step` is defined, get_sweep_values will return
                 # a list containing only `value`.
                 steps = self.get_ramp_values(value, step=self.step)
 
-                for step_index, val_step in enumerate(steps):
-                    # even if the final value is valid we may be generating
-                    # steps that are not so validate them too
-                    self.validate(val_step)
-
-                    raw_val_step = self._from_value_to_raw_value(val_step)
-
-                    # Check if delay between set operations is required
-                    t_elapsed = time.perf_counter() - self._t_last_set
-                    if t_elapsed < self.inter_delay:
-                        # Sleep until time since last set is larger than
-                        # self.inter_delay
-                        time.sleep(self.inter_delay - t_elapsed)
-
-                    # Start timer to measure execution time of set_function
-                    t0 = time.perf_counter()
-
-                    self.set_raw(raw_val_step, **kwargs)
-
-                    # Update last set time (used for calculating delays)
-                    self._t_last_set = time.perf_counter()
-
-                    # Check if any delay after setting is required
-                    t_elapsed = self._t_last_set - t0
-                    if t_elapsed < self.post_delay:
-                        # Sleep until total time is larger than self.post_delay
-                        time.sleep(self.post_delay - t_elapsed)
-
-                    self.cache._update_with(value=val_step, raw_value=raw_val_step)
+                n_steps: int | None = None
+                validate_steps = True
+                if isinstance(steps, collections.abc.Sequence):
+                    n_steps = len(steps)
+                    # a numeric ramp is monotonic so if the validators only
+                    # check bounds it is enough to validate the end points
+                    if (
+                        n_steps > 1
+                        and type(self).validate is ParameterBase.validate
+                        and validates_by_bounds(self._vals)
+                    ):
+                        self.validate(steps[0])
+                        self.validate(steps[-1])
+                        validate_steps = False
+
+                self._ramp_abort_requested = False
+                # time at which the next step may be set, honouring both
+                # inter_delay and the post_delay of the previous step
+                t_next = self._t_last_set + self.inter_delay
+                t_post = 0.0
+                try:
+                    for step_index, val_step in enumerate(steps):
+                        if self._ramp_abort_requested:
+                            raise RampAbortedError(
+                                f"Ramp of {self.full_name} to {value!r} aborted "
+                                f"at {self.cache.get(get_if_invalid=False)!r}"
+                            )
+                        self._ramp_progress = RampProgress(
+                            value, step_index, n_steps, val_step
+                        )
+                        # even if the final value is valid we may be generating
+                        # steps that are not so validate them too
+                        if validate_steps:
+                            self.validate(val_step)
+
+                        raw_val_step = self._from_value_to_raw_value(val_step)
+
+                        sleep_until(t_next)
+
+                        # Start timer to measure execution time of set_function
+                        t0 = time.perf_counter()
+
+                        self.set_raw(raw_val_step, **kwargs)
+
+                        # Update last set time (used for calculating delays)
+                        self._t_last_set = time.perf_counter()
+                        t_post = t0 + self.post_delay
+                        t_next = max(self._t_last_set + self.inter_delay, t_post)
+
+                        self.cache._update_with(value=val_step, raw_value=raw_val_step)
+                    # Wait until total time since the start of the last set
+                    # is larger than self.post_delay
+                    sleep_until(t_post)
+                finally:
+                    self._ramp_progress = None
+                    self._ramp_abort_requested = False
 
             except Exception as e:
                 e.args = e.args + (f"setting {self} to {value}",)
@@ -771,7 +822,41 @@ class ParameterBase(MetadatableWithName):
                 return [value]
 
             # drop the initial value, we're already there
-            return permissive_range(start_value, value, step)[1:] + [value]
+            return ramp_values(start_value, value, step)
+
+    def _set_with_hardware_ramp(self, value: ParamDataType) -> None:
+        raw_value = self._from_value_to_raw_value(value)
+        assert self.hardware_ramp is not None
+        sleep_until(self._t_last_set + self.inter_delay)
+        t0 = time.perf_counter()
+        self._ramp_progress = RampProgress(value, 0, 1, value)
+        try:
+            self.hardware_ramp(raw_value)
+        finally:
+            self._ramp_progress = None
+        self._t_last_set = time.perf_counter()
+        self.cache._update_with(value=value, raw_value=raw_value)
+        sleep_until(t0 + self.post_delay)
+
+    @property
+    def ramp_progress(self) -> RampProgress | None:
+        """
+        Progress of the ongoing ramp of this parameter, None if the
+        parameter is not being set. Can be polled from another thread to
+        follow a long ramp.
+        """
+        return self._ramp_progress
+
+    def abort_ramp(self) -> None:
+        """
+        Abort the ongoing ramp of this parameter, e.g. from another thread.
+        The ramp stops before setting the next step, leaving the parameter
+        at the last step that was set, and the set raises a
+        :class:`.RampAbortedError`. Has no effect if the parameter is not
+        being ramped.
+        """
+        if self._ramp_progress is not None:
+            self._ramp_abort_requested = True
 
     @cached_property
     def _validate_context(self) -> str:
@@ -816,6 +901,11 @@ class ParameterBase(MetadatableWithName):
         All but the final change will attempt to change by +/- step exactly.
         If step is None stepping will not be used.
 
+        The steps are set as fast as ``inter_delay`` and ``post_delay``
+        allow. A ramp can be followed with :attr:`ramp_progress` and
+        stopped with :meth:`abort_ramp`. If :attr:`hardware_ramp` is set it
+        is used instead of stepping in software.
+
         :getter: Returns the current stepsize.
         :setter: Sets the value of the step.
 
@@ -947,6 +1037,40 @@ class ParameterBase(MetadatableWithName):
         """
         return self._instrument
 
+    def _enable_io_stats(self, io_stats: InstrumentIOStats) -> None:
+        """
+        Record the latency of each get and set of this parameter in
+        ``io_stats`` by wrapping :meth:`get` and :meth:`set` in a timer.
+        Parameters are not timed otherwise, such that their get and set
+        do not pay for the statistics unless they are enabled. See
+        :meth:`.Instrument.enable_io_stats`.
+        """
+        self._disable_io_stats()
+        for operation in ("get", "set"):
+            if operation not in self.__dict__:
+                continue
+            untimed = self.__dict__[operation]
+
+            def timed(
+                *args: Any,
+                _operation: str = operation,
+                _untimed: Callable[..., Any] = untimed,
+                **kwargs: Any,
+            ) -> Any:
+                with io_stats.timed(_operation, self.full_name):
+                    return _untimed(*args, **kwargs)
+
+            self._untimed_methods[operation] = untimed
+            setattr(self, operation, wraps(untimed)(timed))
+
+    def _disable_io_stats(self) -> None:
+        """
+        Remove the timers installed by :meth:`_enable_io_stats`.
+        """
+        for operation, untimed in self._untimed_methods.items():
+            setattr(self, operation, untimed)
+        self._untimed_methods.clear()
+
     @property
     def root_instrument(self) -> InstrumentBase | None:
         """
@@ -1005,6 +1129,36 @@ class ParameterBase(MetadatableWithName):
         """
         return self.set_to(self.cache(), allow_changes=allow_changes)
 
+    async def get_async(self) -> ParamDataType:
+        """
+        Get the parameter without blocking the event loop.
+
+        The get is executed on the I/O worker thread of the underlying
+        instrument in the process wide
+        :class:`qcodes.dataset.InstrumentIOExecutor`. Gets and sets of
+        parameters of the same instrument are therefore executed one at a
+        time in the order in which they were awaited, while parameters of
+        different instruments can be gotten concurrently e.g. using
+        :func:`asyncio.gather`.
+        """
+        from qcodes.dataset.threading import get_instrument_io_executor
+
+        future = get_instrument_io_executor().submit_get(self)
+        return await asyncio.wrap_future(future)
+
+    async def set_async(self, value: ParamDataType) -> None:
+        """
+        Set the parameter without blocking the event loop. See
+        :meth:`get_async` for details.
+
+        Args:
+            value: The value to set the parameter to.
+        """
+        from qcodes.dataset.threading import get_instrument_io_executor
+
+        future = get_instrument_io_executor().submit_set(self, value)
+        await asyncio.wrap_future(future)
+
     @property
     def name_parts(self) -> list[str]:
         """
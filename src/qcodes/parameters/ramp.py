@@ -0,0 +1,91 @@
+"""
+Helpers used by :class:`.ParameterBase` to ramp a stepped parameter to a
+new value.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+from qcodes.validators import Ints, Numbers
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from qcodes.validators import Validator
+
+# sleeping is only accurate to within the resolution of the scheduler so
+# the last part of a wait is spent polling the clock instead
+_SPIN_TIME = 1e-3
+
+
+class RampAbortedError(RuntimeError):
+    """Raised by the set of a parameter when its ramp has been aborted."""
+
+
+class RampProgress(NamedTuple):
+    """Progress of an ongoing ramp of a parameter."""
+
+    target: Any
+    """The value the parameter is being ramped to."""
+    index: int
+    """Index of the step that is being set, starting from 0."""
+    n_steps: int | None
+    """Total number of steps of the ramp, None if not known in advance."""
+    value: Any
+    """The value of the step that is being set."""
+
+
+def ramp_values(start: float, stop: float, step: float) -> list[float]:
+    """
+    Return the values to step through to go from ``start`` to ``stop`` in
+    steps of at most ``step``, excluding ``start`` and including ``stop``.
+
+    The values are the same as
+    ``permissive_range(start, stop, step)[1:] + [stop]`` but are computed
+    in one go with numpy.
+
+    Args:
+        start: The value to ramp from.
+        stop: The value to ramp to.
+        step: Maximal size of a step.
+    """
+    signed_step = abs(step) * (1 if stop > start else -1)
+    # take off a tiny bit for rounding errors
+    step_count = math.ceil((stop - start) / signed_step - 1e-10)
+    if step_count <= 1:
+        return [stop]
+    values: list[float] = (start + np.arange(1, step_count) * signed_step).tolist()
+    values.append(stop)
+    return values
+
+
+def sleep_until(deadline: float) -> None:
+    """
+    Wait until :func:`time.perf_counter` reaches ``deadline``.
+
+    Most of the wait is spent in :func:`time.sleep` and the last
+    millisecond polling the clock, so the wait does not overshoot by the
+    resolution of the scheduler.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > _SPIN_TIME:
+        time.sleep(remaining - _SPIN_TIME)
+    while time.perf_counter() < deadline:
+        pass
+
+
+def validates_by_bounds(validators: Sequence[Validator[Any] | None]) -> bool:
+    """
+    Return True if the given validators only check the type and range of a
+    number, such that a monotonic sequence of numbers is valid if its first
+    and last values are.
+    """
+    return all(
+        validator is None or type(validator) in (Numbers, Ints)
+        for validator in validators
+    )
@@ -11,8 +11,10 @@ import json
 import logging
 import os
 import pkgutil
+import time
 import warnings
 from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import suppress
 from copy import copy, deepcopy
 from functools import partial
@@ -37,6 +39,7 @@ import qcodes.instrument_drivers
 from qcodes import validators
 from qcodes.instrument.base import Instrument, InstrumentBase
 from qcodes.instrument.channel import ChannelTuple
+from qcodes.instrument.io_stats import format_io_stats_report
 from qcodes.metadatable import Metadatable, MetadatableWithName
 from qcodes.monitor.monitor import Monitor
 from qcodes.parameters import (
@@ -166,6 +169,11 @@ class Station(Metadatable, DelegateAttributes):
 
         self._added_methods: list[str] = []
         self._monitor_parameters: list[Parameter] = []
+        self.instrument_load_times: dict[str, float] = {}
+        """
+        Time in seconds taken to construct each instrument loaded with
+        :meth:`load_instrument` or :meth:`load_all_instruments`.
+        """
 
         if config_file is None:
             self.config_file = []
@@ -364,6 +372,38 @@ class Station(Metadatable, DelegateAttributes):
             if isinstance(c, Instrument):
                 self.close_and_remove_instrument(c)
 
+    def enable_io_stats(self, trace_spans: bool = False) -> None:
+        """
+        Start recording latency statistics of all instruments registered to
+        this `Station`. See :meth:`.Instrument.enable_io_stats`.
+
+        Args:
+            trace_spans: If True, an opentelemetry span is also emitted for
+                each command and each parameter get and set.
+        """
+        for c in self.components.values():
+            if isinstance(c, Instrument):
+                c.enable_io_stats(trace_spans=trace_spans)
+
+    def io_stats_report(self, limit: int | None = None) -> str:
+        """
+        Return a table of the latency statistics of the instruments
+        registered to this `Station` that have statistics enabled, with one
+        row per instrument and command or parameter, the operations taking
+        the most time in total first.
+
+        Args:
+            limit: Maximal number of rows in the table.
+        """
+        return format_io_stats_report(
+            [
+                c._io_stats
+                for c in self.components.values()
+                if isinstance(c, Instrument) and c._io_stats is not None
+            ],
+            limit=limit,
+        )
+
     @staticmethod
     def _get_config_file_path(filename: str | None = None) -> str | None:
         """
@@ -541,7 +581,19 @@ class Station(Metadatable, DelegateAttributes):
         # little slower but makes the overall workflow more convenient.
         self.load_config_files(*self.config_file)
 
+        instr_class, instr_kwargs = self._prepare_instrument_load(identifier, kwargs)
+        instr = self._construct_instrument(identifier, instr_class, instr_kwargs)
+        self._setup_loaded_instrument(instr, self._instrument_config[identifier])
+        return instr
 
+    def _prepare_instrument_load(
+        self, identifier: str, kwargs: dict[str, Any]
+    ) -> tuple[type[Instrument], dict[str, Any]]:
+        """
+        Look up the class and keyword arguments of an instrument in the
+        loaded configuration and close any existing instance if forced
+        reconnect is enabled.
+        """
         # load from config
         if identifier not in self._instrument_config.keys():
             raise RuntimeError(f'Instrument {identifier} not found in '
@@ -573,13 +625,41 @@ class Station(Metadatable, DelegateAttributes):
         # instrument instances via kwargs
         instr_kwargs = deepcopy(init_kwargs)
         instr_kwargs.update(kwargs)
-        name = instr_kwargs.pop('name', identifier)
+        instr_kwargs.setdefault("name", identifier)
 
         module_name = ".".join(instr_cfg["type"].split(".")[:-1])
         instr_class_name = instr_cfg["type"].split(".")[-1]
         module = importlib.import_module(module_name)
         instr_class = getattr(module, instr_class_name)
-        instr = instr_class(name=name, **instr_kwargs)
+        # instruments such as the DelegateInstrument that are built from
+        # other instruments of the station get the station passed on
+        if (
+            "station" not in instr_kwargs
+            and "station" in inspect.signature(instr_class).parameters
+        ):
+            instr_kwargs["station"] = self
+        return instr_class, instr_kwargs
+
+    def _construct_instrument(
+        self,
+        identifier: str,
+        instr_class: type[Instrument],
+        instr_kwargs: dict[str, Any],
+    ) -> Instrument:
+        t_start = time.perf_counter()
+        instr = instr_class(**instr_kwargs)
+        load_time = time.perf_counter() - t_start
+        self.instrument_load_times[identifier] = load_time
+        log.info("Loaded instrument %s in %.3f s", identifier, load_time)
+        return instr
+
+    def _setup_loaded_instrument(
+        self, instr: InstrumentBase, instr_cfg: dict[str, Any]
+    ) -> None:
+        """
+        Set up the parameters of a newly constructed instrument as described
+        in its configuration and add it to the station.
+        """
 
         def resolve_instrument_identifier(
             instrument: ChannelOrInstrumentBase,
@@ -689,13 +769,15 @@ class Station(Metadatable, DelegateAttributes):
             add_parameter_from_dict(local_instr, parts[-1], options)
         self.add_component(instr)
         update_monitor()
-        return instr
 
     @overload
     def load_all_instruments(
         self,
         only_names: None,
         only_types: Iterable[str],
+        *,
+        parallel: bool = ...,
+        max_workers: int | None = ...,
     ) -> tuple[str, ...]:
         ...
 
@@ -704,6 +786,9 @@ class Station(Metadatable, DelegateAttributes):
         self,
         only_names: Iterable[str],
         only_types: None,
+        *,
+        parallel: bool = ...,
+        max_workers: int | None = ...,
     ) -> tuple[str, ...]:
         ...
 
@@ -712,6 +797,9 @@ class Station(Metadatable, DelegateAttributes):
         self,
         only_names: None,
         only_types: None,
+        *,
+        parallel: bool = ...,
+        max_workers: int | None = ...,
     ) -> tuple[str, ...]:
         ...
 
@@ -720,6 +808,9 @@ class Station(Metadatable, DelegateAttributes):
         self,
         only_names: Iterable[str],
         only_types: Iterable[str],
+        *,
+        parallel: bool = ...,
+        max_workers: int | None = ...,
     ) -> NoReturn:
         ...
 
@@ -727,6 +818,9 @@ class Station(Metadatable, DelegateAttributes):
         self,
         only_names: Iterable[str] | None = None,
         only_types: Iterable[str] | None = None,
+        *,
+        parallel: bool = False,
+        max_workers: int | None = None,
     ) -> tuple[str, ...]:
         """
         Load all instruments specified in the loaded YAML station
@@ -737,15 +831,40 @@ class Station(Metadatable, DelegateAttributes):
         arguments for that. It is an error to supply both ``only_names``
         and ``only_types``.
 
+        Instruments are loaded after the instruments they depend on. These
+        are the instruments listed under the ``depends_on`` key of an
+        instrument in the configuration, and the source instruments of the
+        ``parameters`` and ``channels`` of a
+        :class:`~qcodes.instrument.delegate.DelegateInstrument` given in its
+        ``init`` section. If the latter form a cycle, only the ``depends_on``
+        keys are respected.
+        The time taken to construct each instrument is stored in
+        :attr:`instrument_load_times`.
+
         Args:
             only_names: List of instrument names to load from the config.
                 If left as None, then all instruments are loaded.
             only_types: List of instrument types e.g. the class names
                 of the instruments to load. If left as None, then all
                 instruments are loaded.
+            parallel: If True, instruments are constructed concurrently in a
+                pool of threads, so that the station is loaded in roughly
+                the time of the slowest chain of dependent instruments.
+                Each instrument is still constructed only once the
+                instruments it depends on have been loaded, and the
+                parameters of each instrument are set up and the
+                instrument is added to the station on the calling thread.
+            max_workers: The maximal number of threads used to construct
+                instruments if ``parallel`` is True. Defaults to the
+                default of :class:`concurrent.futures.ThreadPoolExecutor`.
 
         Returns:
-            The names of the loaded instruments
+            The names of the loaded instruments in the order they were
+            loaded.
+
+        Raises:
+            RuntimeError: If the dependencies of the instruments listed under
+                their ``depends_on`` keys are cyclic.
         """
         config = self.config
         if config is None:
@@ -773,10 +892,176 @@ class Station(Metadatable, DelegateAttributes):
                 "and ``only_types`` arguments."
             )
 
-        for instrument in instrument_names_to_load:
+        dependencies = {
+            name: (
+                self._declared_dependencies(name)
+                | self._referenced_instruments(name)
+            )
+            & instrument_names_to_load
+            for name in instrument_names_to_load
+        }
+        try:
+            load_order = _dependency_order(dependencies)
+        except RuntimeError:
+            # only cycles of dependencies declared with ``depends_on`` are
+            # an error, references found in ``init`` may be spurious
+            dependencies = {
+                name: self._declared_dependencies(name) & instrument_names_to_load
+                for name in instrument_names_to_load
+            }
+            load_order = _dependency_order(dependencies)
+            log.warning(
+                "The instruments referred to in the init sections of the "
+                "station configuration form a cycle, loading the instruments "
+                "only respecting their depends_on keys."
+            )
+
+        if parallel:
+            return self._load_instruments_in_parallel(
+                load_order, dependencies, max_workers
+            )
+
+        for instrument in load_order:
             self.load_instrument(instrument)
 
-        return tuple(instrument_names_to_load)
+        return tuple(load_order)
+
+    def _declared_dependencies(self, identifier: str) -> set[str]:
+        """
+        Return the names of the instruments listed under the ``depends_on``
+        key of an instrument in the configuration.
+        """
+        instr_cfg = self._instrument_config.get(identifier, {})
+        dependencies = set(instr_cfg.get("depends_on") or ())
+        dependencies.discard(identifier)
+        return dependencies
+
+    def _referenced_instruments(self, identifier: str) -> set[str]:
+        """
+        Return the names of the other instruments in the configuration that
+        the ``parameters`` and ``channels`` paths in the ``init`` section of
+        an instrument refer to, as used by
+        :class:`~qcodes.instrument.delegate.DelegateInstrument` and, per
+        submodule, by
+        :class:`~qcodes.instrument.delegate.InstrumentGroup`.
+        """
+        instrument_config = self._instrument_config
+        init = instrument_config.get(identifier, {}).get("init") or {}
+        init_sections = [init]
+        submodules = init.get("submodules")
+        if isinstance(submodules, dict):
+            init_sections.extend(
+                section for section in submodules.values() if isinstance(section, dict)
+            )
+
+        paths: list[Any] = []
+        for section in init_sections:
+            parameters = section.get("parameters")
+            if isinstance(parameters, dict):
+                for parameter_paths in parameters.values():
+                    if isinstance(parameter_paths, str):
+                        paths.append(parameter_paths)
+                    elif isinstance(parameter_paths, (list, tuple)):
+                        paths.extend(parameter_paths)
+            channels = section.get("channels")
+            if isinstance(channels, dict):
+                for channel_name, channel in channels.items():
+                    if channel_name == "type":
+                        continue
+                    if isinstance(channel, dict):
+                        channel = channel.get("channel")
+                    paths.append(channel)
+
+        references = {
+            path.split(".", maxsplit=1)[0] for path in paths if isinstance(path, str)
+        }
+        references &= set(instrument_config)
+        references.discard(identifier)
+        return references
+
+    def _load_instruments_in_parallel(
+        self,
+        load_order: Sequence[str],
+        dependencies: dict[str, set[str]],
+        max_workers: int | None,
+    ) -> tuple[str, ...]:
+        self.load_config_files(*self.config_file)
+        # looking up the instrument classes and closing instruments that
+        # are reconnected is done up front on this thread
+        prepared = {
+            name: self._prepare_instrument_load(name, {}) for name in load_order
+        }
+        remaining = {name: set(dependencies[name]) for name in load_order}
+        running: dict[Future[Instrument], str] = {}
+        loaded: list[str] = []
+        error: BaseException | None = None
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="qcodes_station_load"
+        ) as executor:
+
+            def submit_ready() -> None:
+                for name in [n for n in load_order if n in remaining]:
+                    if not remaining[name]:
+                        del remaining[name]
+                        instr_class, instr_kwargs = prepared[name]
+                        future = executor.submit(
+                            self._construct_instrument, name, instr_class, instr_kwargs
+                        )
+                        running[future] = name
+
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        instr = future.result()
+                        self._setup_loaded_instrument(
+                            instr, self._instrument_config[name]
+                        )
+                    except BaseException as e:
+                        # stop loading further instruments but let the
+                        # ones already being constructed finish such that
+                        # they are added to the station and can be closed
+                        if error is None:
+                            error = e
+                        remaining.clear()
+                        continue
+                    loaded.append(name)
+                    for pending_dependencies in remaining.values():
+                        pending_dependencies.discard(name)
+                if error is None:
+                    submit_ready()
+
+        if error is not None:
+            raise error
+        return tuple(loaded)
+
+
+def _dependency_order(dependencies: dict[str, set[str]]) -> list[str]:
+    """
+    Order the keys of ``dependencies`` such that each name comes after
+    all the names it depends on.
+
+    Raises:
+        RuntimeError: If the dependencies are cyclic.
+    """
+    order: list[str] = []
+    remaining = {name: set(deps) for name, deps in dependencies.items()}
+    while remaining:
+        ready = sorted(name for name, deps in remaining.items() if not deps)
+        if not ready:
+            raise RuntimeError(
+                "Cannot load instruments with cyclic dependencies: "
+                f"{sorted(remaining)}"
+            )
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+        order.extend(ready)
+    return order
 
 
 def update_config_schema(
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import math
+import threading
+
+
+class LatencyHistogram:
+    """
+    Histogram of latencies with logarithmically spaced bins. Similar to an
+    HDR histogram this gives a fixed relative resolution over many decades
+    of values at a small, constant memory cost, and recording a value is
+    cheap enough to be done on every instrument call.
+
+    Args:
+        min_value: Lower edge of the first bin in seconds. Smaller values
+            are counted in the first bin.
+        max_value: Upper edge of the last bin in seconds. Larger values
+            are counted in the last bin.
+        bins_per_decade: Number of bins per decade. This sets the relative
+            resolution of the percentiles.
+    """
+
+    def __init__(
+        self,
+        min_value: float = 1e-6,
+        max_value: float = 1e3,
+        bins_per_decade: int = 20,
+    ):
+        if min_value <= 0 or max_value <= min_value:
+            raise ValueError(
+                f"Expected 0 < min_value < max_value, got "
+                f"min_value={min_value} and max_value={max_value}."
+            )
+        self._min_value = min_value
+        self._bins_per_decade = bins_per_decade
+        self._log_min = math.log10(min_value)
+        self._n_bins = math.ceil(
+            (math.log10(max_value) - self._log_min) * bins_per_decade
+        )
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Remove all recorded values.
+        """
+        with self._lock:
+            self._counts = [0] * self._n_bins
+            self._count = 0
+            self._total = 0.0
+            self._min = math.inf
+            self._max = -math.inf
+
+    def record(self, value: float) -> None:
+        """
+        Record a single latency in seconds.
+        """
+        if value > self._min_value:
+            index = min(
+                int((math.log10(value) - self._log_min) * self._bins_per_decade),
+                self._n_bins - 1,
+            )
+        else:
+            index = 0
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._total += value
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+
+    def _bin_upper_edge(self, index: int) -> float:
+        return 10 ** (self._log_min + (index + 1) / self._bins_per_decade)
+
+    @property
+    def count(self) -> int:
+        """Number of recorded values."""
+        return self._count
+
+    @property
+    def total(self) -> float:
+        """Sum of all recorded values in seconds."""
+        return self._total
+
+    @property
+    def min(self) -> float:
+        """Smallest recorded value, NaN if nothing has been recorded."""
+        return self._min if self._count else math.nan
+
+    @property
+    def max(self) -> float:
+        """Largest recorded value, NaN if nothing has been recorded."""
+        return self._max if self._count else math.nan
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded values, NaN if nothing has been recorded."""
+        return self._total / self._count if self._count else math.nan
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Return an upper bound for the given percentile (between 0 and 100)
+        of the recorded values. The bound is accurate to the width of a bin
+        and never exceeds the largest recorded value.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {percentile}")
+        with self._lock:
+            if self._count == 0:
+                return math.nan
+            target = percentile / 100 * self._count
+            cumulative = 0
+            for index, bin_count in enumerate(self._counts):
+                cumulative += bin_count
+                if bin_count and cumulative >= target:
+                    return min(self._bin_upper_edge(index), self._max)
+            return self._max
+
+    def summary(self) -> dict[str, float]:
+        """
+        Return a dict with the count, total, mean, min, max and the
+        50th, 90th and 99th percentiles of the recorded values.
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__}: count={self.count}, mean={self.mean:.3g} s, "
+            f"p99={self.percentile(99):.3g} s>"
+        )
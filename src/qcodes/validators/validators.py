@@ -916,11 +916,24 @@ class Arrays(Validator[np.ndarray]):
 
     @property
     def shape(self) -> tuple[int, ...] | None:
+        """
+        The shape of the array with any callables evaluated.
+
+        Settable parameters given as part of the shape are read from their
+        cache, which is updated whenever they are set or gotten, such that the
+        instrument is only queried when the cache is invalid (never captured,
+        older than ``max_val_age`` or explicitly invalidated). Other callables
+        are called every time the shape is evaluated.
+        """
         if self._shape is None:
             return None
+        from qcodes.parameters import ParameterBase
+
         shape_array = []
         for s in self._shape:
-            if callable(s):
+            if isinstance(s, ParameterBase) and s.settable:
+                shape_array.append(s.cache.get())
+            elif callable(s):
                 shape_array.append(s())
             else:
                 shape_array.append(s)
@@ -939,8 +952,8 @@ class Arrays(Validator[np.ndarray]):
                 f"type of {value} is not any of {self.valid_types}"
                 f" it is {value.dtype}; {context}"
             )
-        if self.shape is not None:
-            shape = self.shape
+        shape = self.shape
+        if shape is not None:
             if np.shape(value) != shape:
                 raise ValueError(
                     f"{value!r} does not have expected shape {shape},"
@@ -17,6 +17,7 @@ import qcodes as qc
 from qcodes import config, validators
 from qcodes.dataset import (
     ArraySweep,
+    BufferedSweep,
     DataSetProtocol,
     LinSweep,
     LogSweep,
@@ -837,6 +838,150 @@ def test_dond_2d_output_data(_param, _param_complex, _param_set, _param_set_2) -
     )
 
 
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_2d_pipeline_results(_param_set, _param_set_2) -> None:
+    meas_1 = Parameter("meas_1", get_cmd=lambda: _param_set() + _param_set_2())
+    meas_2 = Parameter("meas_2", get_cmd=lambda: _param_set() * _param_set_2())
+    sweep_1 = LinSweep(_param_set, 0, 0.5, 5, 0)
+    sweep_2 = LinSweep(_param_set_2, 0.5, 1, 7, 0)
+
+    datasets, _, _ = dond(
+        sweep_1,
+        sweep_2,
+        [meas_1],
+        [meas_2],
+        pipeline_results=True,
+        write_period=0.001,
+    )
+    assert isinstance(datasets, tuple)
+
+    setpoints_1, setpoints_2 = np.meshgrid(
+        sweep_1.get_setpoints(), sweep_2.get_setpoints(), indexing="ij"
+    )
+    data_1 = datasets[0].get_parameter_data()["meas_1"]
+    np.testing.assert_allclose(data_1[_param_set.name], setpoints_1)
+    np.testing.assert_allclose(data_1[_param_set_2.name], setpoints_2)
+    np.testing.assert_allclose(data_1["meas_1"], setpoints_1 + setpoints_2)
+    data_2 = datasets[1].get_parameter_data()["meas_2"]
+    np.testing.assert_allclose(data_2["meas_2"], setpoints_1 * setpoints_2)
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_use_async(_param_set, _param_set_2) -> None:
+    meas_1 = Parameter("meas_1", get_cmd=lambda: _param_set() + _param_set_2())
+    meas_2 = Parameter("meas_2", get_cmd=lambda: _param_set() * _param_set_2())
+    sweep_1 = LinSweep(_param_set, 0, 0.5, 3, 0)
+    sweep_2 = LinSweep(_param_set_2, 0.5, 1, 4, 0)
+
+    dataset, _, _ = dond(sweep_1, sweep_2, meas_1, meas_2, use_async=True)
+    assert isinstance(dataset, DataSetProtocol)
+
+    setpoints_1, setpoints_2 = np.meshgrid(
+        sweep_1.get_setpoints(), sweep_2.get_setpoints(), indexing="ij"
+    )
+    data = dataset.get_parameter_data()
+    np.testing.assert_allclose(data["meas_1"]["meas_1"], setpoints_1 + setpoints_2)
+    np.testing.assert_allclose(data["meas_2"]["meas_2"], setpoints_1 * setpoints_2)
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_pipeline_results_raises_invalid_result(_param_set) -> None:
+    param = Parameter("param", get_cmd=lambda: "not a number")
+
+    with pytest.raises(ValueError, match="is of type"):
+        dond(LinSweep(_param_set, 0, 1, 5), param, pipeline_results=True)
+
+
+class DummyBufferedSweep(BufferedSweep[np.float64]):
+    """
+    A buffered sweep that computes a measured value for each setpoint
+    when triggered, standing in for an instrument sweeping in hardware.
+    """
+
+    def __init__(self, param, setpoints, measure, delay=0.0):
+        self._param = param
+        self._setpoints = np.asarray(setpoints, dtype=float)
+        self._measure = measure
+        self._delay = delay
+        self.buffer = np.array([])
+        self.n_armed = 0
+        self.n_triggered = 0
+
+    def arm(self) -> None:
+        self.buffer = np.array([])
+        self.n_armed += 1
+
+    def trigger(self) -> None:
+        self.buffer = np.array([self._measure(value) for value in self._setpoints])
+        self.n_triggered += 1
+
+    def get_setpoints(self):
+        return self._setpoints
+
+    @property
+    def param(self):
+        return self._param
+
+    @property
+    def delay(self) -> float:
+        return self._delay
+
+    @property
+    def num_points(self) -> int:
+        return len(self._setpoints)
+
+    @property
+    def post_actions(self):
+        return ()
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_buffered_sweep() -> None:
+    outer = ManualParameter("outer", initial_value=0.0)
+    inner = TrackingParameter("inner", initial_value=0.0)
+    inner.reset_count()
+
+    buffered_sweep = DummyBufferedSweep(
+        inner, np.linspace(0, 1, 11), measure=lambda value: outer() + 10 * value
+    )
+    meas = Parameter("meas", get_cmd=lambda: buffered_sweep.buffer)
+
+    sweeper = _Sweeper([LinSweep(outer, 0, 2, 3), buffered_sweep], [])
+    assert sweeper.buffered_sweep is buffered_sweep
+    assert sweeper.shape == (3, 11)
+    assert len(sweeper) == 3
+
+    dataset, _, _ = dond(LinSweep(outer, 0, 2, 3), buffered_sweep, meas)
+    assert isinstance(dataset, DataSetProtocol)
+
+    assert inner.set_count == 0
+    assert buffered_sweep.n_armed == 3
+    assert buffered_sweep.n_triggered == 3
+    assert dataset.description.shapes == {"meas": (3, 11)}
+
+    outer_setpoints, inner_setpoints = np.meshgrid(
+        np.linspace(0, 2, 3), np.linspace(0, 1, 11), indexing="ij"
+    )
+    data = dataset.get_parameter_data()["meas"]
+    np.testing.assert_allclose(data["outer"], outer_setpoints)
+    np.testing.assert_allclose(data["inner"], inner_setpoints)
+    np.testing.assert_allclose(data["meas"], outer_setpoints + 10 * inner_setpoints)
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_buffered_sweep_must_be_last() -> None:
+    outer = ManualParameter("outer", initial_value=0.0)
+    inner = ManualParameter("inner", initial_value=0.0)
+    meas = ManualParameter("meas", initial_value=0.0)
+    buffered_sweep = DummyBufferedSweep(inner, [0, 1], measure=lambda value: value)
+
+    with pytest.raises(ValueError, match="A BufferedSweep must be the last"):
+        dond(buffered_sweep, LinSweep(outer, 0, 1, 2), meas)
+
+    with pytest.raises(ValueError, match="cannot be part of a TogetherSweep"):
+        TogetherSweep(LinSweep(outer, 0, 1, 2), buffered_sweep)
+
+
 @pytest.mark.usefixtures("plot_close", "experiment")
 def test_dond_2d_multi_datasets_output_type(
     _param, _param_complex, _param_set, _param_set_2
@@ -1099,12 +1244,73 @@ def test_dond_together_sweep_sweeper(_param_set, _param_set_2, _param) -> None:
         assert output[0].parameter == sweep_1.param
         assert output[0].new_value == setpoint_1
         assert output[0].should_set is True
-        assert output[0].delay == delay_1
+        # the delays of a together sweep are merged into a single
+        # sleep after the last parameter has been set
+        assert output[0].delay == 0
 
         assert output[1].parameter == sweep_2.param
         assert output[1].new_value == setpoint_2
         assert output[1].should_set is True
-        assert output[1].delay == delay_2
+        assert output[1].delay == max(delay_1, delay_2)
+
+    assert sweeper.planned_delay == pytest.approx(sweep_len * max(delay_1, delay_2))
+
+
+def test_sweeper_planned_delay_matches_set_events() -> None:
+    a = ManualParameter("a", initial_value=0)
+    b = ManualParameter("b", initial_value=0)
+    c = ManualParameter("c", initial_value=0)
+    d = ManualParameter("d", initial_value=0)
+
+    sweep_a = ArraySweep(a, [0, 0, 1, 1], delay=0.3)
+    sweep_b = ArraySweep(b, [5, 6, 6, 5], delay=0.5)
+    sweep_c = ArraySweep(c, [1, 2, 3], delay=0.1)
+    sweep_d = ArraySweep(d, [7, 8, 7], delay=0.01)
+
+    sweeper = _Sweeper([sweep_c, TogetherSweep(sweep_a, sweep_b), sweep_d], [])
+
+    total_delay = 0.0
+    for set_events in sweeper:
+        total_delay += sum(event.delay for event in set_events if event.should_set)
+
+    assert sweeper.planned_delay == pytest.approx(total_delay)
+
+
+def test_sweeper_together_sweep_only_waits_for_changed_params() -> None:
+    a = ManualParameter("a", initial_value=0)
+    b = ManualParameter("b", initial_value=0)
+
+    sweep_a = ArraySweep(a, [0, 0, 1], delay=0.3)
+    sweep_b = ArraySweep(b, [5, 6, 6], delay=0.5)
+
+    sweeper = _Sweeper([TogetherSweep(sweep_a, sweep_b)], [])
+    events = [[(e.should_set, e.delay) for e in set_events] for set_events in sweeper]
+
+    assert events == [
+        [(True, 0), (True, 0.5)],
+        [(False, 0.3), (True, 0.5)],
+        [(True, 0.3), (False, 0.5)],
+    ]
+    assert sweeper.planned_delay == pytest.approx(0.5 + 0.5 + 0.3)
+
+
+def test_sweeper_together_sweep_get_after_set_keeps_delays() -> None:
+    a = ManualParameter("a", initial_value=0)
+    b = ManualParameter("b", initial_value=0)
+
+    sweep_a = ArraySweep(a, [0, 0, 1], delay=0.3, get_after_set=True)
+    sweep_b = ArraySweep(b, [5, 6, 6], delay=0.5)
+
+    sweeper = _Sweeper([TogetherSweep(sweep_a, sweep_b)], [])
+    events = [[(e.should_set, e.delay) for e in set_events] for set_events in sweeper]
+
+    # a is read back right after it is set so it must settle first
+    assert events == [
+        [(True, 0.3), (True, 0.5)],
+        [(False, 0.3), (True, 0.5)],
+        [(True, 0.3), (False, 0.5)],
+    ]
+    assert sweeper.planned_delay == pytest.approx(0.3 + 0.5 + 0.5 + 0.3)
 
 
 @pytest.mark.usefixtures("plot_close", "experiment")
@@ -0,0 +1,178 @@
+import numpy as np
+import pytest
+
+from qcodes.dataset import Measurement
+from qcodes.instrument.mockers.simulated_ats_api import SimulatedATS9360API
+from qcodes.instrument_drivers.AlazarTech.ATS9360 import AlazarTech_ATS9360
+from qcodes.instrument_drivers.AlazarTech.ATS_acquisition_controllers import (
+    DataSaverStreamingController,
+    DemodulatingAveragingController,
+    buffer_records,
+)
+
+SAMPLE_RATE = 1_000_000_000
+SAMPLES_PER_RECORD = 1024
+RECORDS_PER_BUFFER = 8
+# frequencies with a whole number of periods per record
+FREQUENCIES = (
+    SAMPLE_RATE * 16 / SAMPLES_PER_RECORD,
+    SAMPLE_RATE * 40 / SAMPLES_PER_RECORD,
+)
+OFFSET = 32767.5
+
+
+def signal_generator(buffer: np.ndarray) -> None:
+    """
+    Fill channel A with a cosine at the first frequency and channel B with
+    a sine at the second, the amplitude increasing with the record.
+    """
+    t = np.arange(SAMPLES_PER_RECORD)
+    amplitudes = 1000 * (1 + np.arange(RECORDS_PER_BUFFER))[:, np.newaxis]
+    phases = 2 * np.pi * np.array(FREQUENCIES) / SAMPLE_RATE
+    records = buffer_records(buffer, RECORDS_PER_BUFFER, SAMPLES_PER_RECORD, 2)
+    records[..., 0] = np.round(OFFSET + amplitudes * np.cos(phases[0] * t))
+    records[..., 1] = np.round(OFFSET + amplitudes * np.sin(phases[1] * t))
+
+
+@pytest.fixture(name="alazar")
+def _make_alazar():
+    driver = AlazarTech_ATS9360(
+        "Alazar",
+        api=SimulatedATS9360API(
+            dll_path="simulated", buffer_generator=signal_generator
+        ),
+    )
+    with driver.syncing():
+        driver.sample_rate(SAMPLE_RATE)
+    try:
+        yield driver
+    finally:
+        driver.close()
+
+
+def acquire(alazar, controller, processing_workers=None):
+    return alazar.acquire(
+        mode="NPT",
+        samples_per_record=SAMPLES_PER_RECORD,
+        records_per_buffer=RECORDS_PER_BUFFER,
+        buffers_per_acquisition=6,
+        channel_selection="AB",
+        allocated_buffers=2,
+        acquisition_controller=controller,
+        processing_workers=processing_workers,
+    )
+
+
+def test_buffer_records_is_a_view() -> None:
+    buffer = np.arange(2 * 3 * 4)
+    records = buffer_records(buffer, 3, 4, 2)
+    assert records.shape == (3, 4, 2)
+    assert np.shares_memory(records, buffer)
+    np.testing.assert_array_equal(records[1, :, 1], buffer[16:20])
+
+    interleaved = buffer_records(buffer, 3, 4, 2, interleaved=True)
+    np.testing.assert_array_equal(interleaved[1, :, 1], buffer[9:16:2])
+
+
+@pytest.mark.parametrize("processing_workers", [None, 3])
+def test_demodulate_and_average_records(alazar, processing_workers) -> None:
+    controller = DemodulatingAveragingController(alazar, FREQUENCIES)
+    result = acquire(alazar, controller, processing_workers)
+
+    assert result.shape == (2, 2)
+    mean_amplitude = 1000 * np.mean(1 + np.arange(RECORDS_PER_BUFFER))
+    np.testing.assert_allclose(
+        np.abs(result), [[mean_amplitude, 0], [0, mean_amplitude]], atol=1
+    )
+    np.testing.assert_allclose(np.angle(result[0, 0]), 0, atol=1e-3)
+    np.testing.assert_allclose(np.angle(result[1, 1]), np.pi / 2, atol=1e-3)
+
+
+@pytest.mark.parametrize("processing_workers", [None, 3])
+def test_demodulate_each_record(alazar, processing_workers) -> None:
+    controller = DemodulatingAveragingController(
+        alazar, FREQUENCIES, average_records=False
+    )
+    result = acquire(alazar, controller, processing_workers)
+
+    assert result.shape == (RECORDS_PER_BUFFER, 2, 2)
+    amplitudes = 1000 * (1 + np.arange(RECORDS_PER_BUFFER))
+    np.testing.assert_allclose(np.abs(result[:, 0, 0]), amplitudes, atol=1)
+    np.testing.assert_allclose(np.abs(result[:, 1, 1]), amplitudes, atol=1)
+    np.testing.assert_allclose(np.abs(result[:, 0, 1]), 0, atol=1)
+    np.testing.assert_allclose(np.angle(result[:, 1, 1]), np.pi / 2, atol=1e-3)
+
+
+def test_demodulation_requires_npt_mode(alazar) -> None:
+    controller = DemodulatingAveragingController(alazar, FREQUENCIES)
+    with pytest.raises(RuntimeError, match="only supports acquisitions in NPT mode"):
+        alazar.acquire(
+            mode="TS",
+            samples_per_record=SAMPLES_PER_RECORD,
+            records_per_buffer=1,
+            buffers_per_acquisition=4,
+            acquisition_controller=controller,
+        )
+
+
+@pytest.mark.usefixtures("experiment")
+@pytest.mark.parametrize("write_in_background", [False, True])
+@pytest.mark.parametrize("processing_workers", [None, 2])
+def test_stream_records_to_datasaver(
+    alazar, write_in_background, processing_workers
+) -> None:
+    controller = DataSaverStreamingController(alazar, max_pending_buffers=1)
+    meas = Measurement()
+    controller.register_parameters(meas)
+
+    with meas.run(
+        write_in_background=write_in_background, in_memory_cache=False
+    ) as datasaver:
+        controller.datasaver = datasaver
+        n_buffers = acquire(alazar, controller, processing_workers)
+
+    assert n_buffers == 6
+    data = datasaver.dataset.get_parameter_data()
+    # the buffer number is expanded to the shape of the records
+    np.testing.assert_array_equal(
+        data["alazar_A"]["alazar_buffer"][:, 0, 0], np.arange(6)
+    )
+    records = data["alazar_A"]["alazar_A"]
+    assert records.shape == (6, RECORDS_PER_BUFFER, SAMPLES_PER_RECORD)
+    expected = np.empty(2 * RECORDS_PER_BUFFER * SAMPLES_PER_RECORD, dtype=np.uint16)
+    signal_generator(expected)
+    expected_records = buffer_records(
+        expected, RECORDS_PER_BUFFER, SAMPLES_PER_RECORD, 2
+    )
+    np.testing.assert_array_equal(records[3], expected_records[..., 0])
+    np.testing.assert_array_equal(
+        data["alazar_B"]["alazar_B"][5], expected_records[..., 1]
+    )
+
+
+@pytest.mark.usefixtures("experiment")
+def test_stream_demodulated_records_to_datasaver(alazar) -> None:
+    controller = DataSaverStreamingController(
+        alazar, name="iq", demodulation_frequencies=FREQUENCIES
+    )
+    meas = Measurement()
+    controller.register_parameters(meas)
+
+    with meas.run() as datasaver:
+        controller.datasaver = datasaver
+        acquire(alazar, controller, processing_workers=2)
+
+    data = datasaver.dataset.get_parameter_data()
+    iq_a = data["iq_A"]["iq_A"]
+    assert iq_a.shape == (6, RECORDS_PER_BUFFER, 2)
+    amplitudes = 1000 * (1 + np.arange(RECORDS_PER_BUFFER))
+    np.testing.assert_allclose(np.abs(iq_a[:, :, 0]), [amplitudes] * 6, atol=1)
+    np.testing.assert_allclose(
+        np.angle(data["iq_B"]["iq_B"][:, :, 1]), np.pi / 2, atol=1e-3
+    )
+
+
+def test_streaming_requires_datasaver(alazar) -> None:
+    controller = DataSaverStreamingController(alazar)
+    with pytest.raises(RuntimeError, match="Assign a datasaver"):
+        acquire(alazar, controller)
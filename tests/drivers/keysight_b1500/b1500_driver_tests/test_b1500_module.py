@@ -1,9 +1,13 @@
 import math
 from unittest.mock import MagicMock
 
+import numpy as np
+import pytest
+
 from qcodes.instrument_drivers.Keysight.keysightb1500.constants import (
     DCORR,
     IMP,
+    ChannelName,
     SlotNr,
 )
 from qcodes.instrument_drivers.Keysight.keysightb1500.KeysightB1500_module import (
@@ -11,6 +15,7 @@ from qcodes.instrument_drivers.Keysight.keysightb1500.KeysightB1500_module impor
     _FMTResponse,
     convert_dummy_val_to_nan,
     fixed_negative_float,
+    fmt_response_base_parser,
     format_dcorr_response,
     get_name_label_unit_of_impedance_model,
     parse_module_query_response,
@@ -116,3 +121,47 @@ def test_convert_dummy_val_to_nan() -> None:
     convert_dummy_val_to_nan(param)
     assert math.isnan(param.value[1])
     assert math.isnan(param.value[3])
+
+
+@pytest.mark.parametrize(
+    "raw_data",
+    [
+        "NAI+000.005E-06,CBV+001.000E+00,VZI+199.999E+99\r\n",
+        # values with different number of digits
+        "NAI+000.005E-06,NBV+1.000E+00,NJI-000.004E-03",
+        "NAI+0000.005E-06",
+    ],
+)
+def test_fmt_response_base_parser(raw_data) -> None:
+    str_values = raw_data.strip().split(",")
+
+    parsed = fmt_response_base_parser(raw_data)
+
+    np.testing.assert_array_equal(
+        parsed.value, [float(value[3:]) for value in str_values]
+    )
+    np.testing.assert_array_equal(parsed.status, [value[0] for value in str_values])
+    np.testing.assert_array_equal(
+        parsed.channel,
+        [ChannelName[value[1]].value for value in str_values],
+    )
+    np.testing.assert_array_equal(parsed.type, [value[2] for value in str_values])
+    assert parsed.value.dtype == np.float64
+
+
+def test_fmt_response_base_parser_misaligned_separators() -> None:
+    # same total length as two values of equal width, but the separator
+    # is not where it would be
+    raw_data = "NAI+00.005E-06,NAV+0001.000E+00"
+
+    parsed = fmt_response_base_parser(raw_data)
+
+    np.testing.assert_array_equal(parsed.value, [0.005e-6, 1.0])
+    np.testing.assert_array_equal(parsed.type, ["I", "V"])
+
+
+def test_convert_dummy_val_to_nan_array() -> None:
+    param = fmt_response_base_parser("VAV+199.999E+99,NAV+001.000E+00")
+    convert_dummy_val_to_nan(param)
+    assert math.isnan(param.value[0])
+    assert param.value[1] == 1
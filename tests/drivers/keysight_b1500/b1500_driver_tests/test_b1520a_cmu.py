@@ -248,7 +248,12 @@ def test_run_sweep(cmu) -> None:
     cmu.cv_sweep.sweep_steps(steps)
     cmu.adc_mode(constants.ACT.Mode.PLC)
     cmu.adc_coef(5)
-    cmu.run_sweep()
+    cmu.parent.ask.return_value = ",".join(
+        f"NCG{1e-6 * i:+012.3E},NCX{2e-6 * i:+012.3E}" for i in range(steps)
+    )
+    conductance, reactance = cmu.run_sweep()
+    np.testing.assert_allclose(conductance, 1e-6 * np.arange(steps))
+    np.testing.assert_allclose(reactance, 2e-6 * np.arange(steps))
     mainframe.write.assert_has_calls([
         call('WDCV 3,1,-1.0,0.0,1'),
         call('WDCV 3,1,-1.0,1.0,1'),
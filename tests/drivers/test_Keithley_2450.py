@@ -1,4 +1,6 @@
 import logging
+import re
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -129,3 +131,73 @@ def test_sweep(k2450) -> None:
     k2450.source.function("voltage")
     k2450.source.sweep_setup(0, 1, 10)
     k2450.sense.sweep.get()
+
+
+def _buffer_range(cmd: str) -> tuple[int, int]:
+    match = re.fullmatch(r":TRACe:DATA\? (\d+), (\d+), 'defbuffer1'", cmd)
+    assert match is not None, cmd
+    return int(match[1]), int(match[2])
+
+
+def test_get_data_in_chunks(k2450) -> None:
+    buffer = k2450.buffer("defbuffer1")
+    buffer.readout_chunk_size = 4
+
+    def ask_raw(cmd: str) -> str:
+        start, end = _buffer_range(cmd)
+        return ",".join(str(float(i)) for i in range(start, end + 1))
+
+    with patch.object(k2450, "ask_raw", side_effect=ask_raw) as mock_ask:
+        data = buffer.get_data(1, 10)
+
+    assert data == [float(i) for i in range(1, 11)]
+    assert [call.args[0] for call in mock_ask.call_args_list] == [
+        ":TRACe:DATA? 1, 4, 'defbuffer1'",
+        ":TRACe:DATA? 5, 8, 'defbuffer1'",
+        ":TRACe:DATA? 9, 10, 'defbuffer1'",
+    ]
+
+
+def test_buffered_readout(k2450) -> None:
+    buffer = k2450.buffer("defbuffer1")
+    readings = np.linspace(0, 1, 25)
+    n_stored = iter([5, 5, 12, 25])
+    chunks = []
+
+    def ask_raw(cmd: str) -> str:
+        if cmd == ":FORMat:DATA?":
+            return "ASC"
+        if cmd == ":FORMat:BORDer?":
+            return "NORM"
+        assert cmd == ":TRACe:ACTual? 'defbuffer1'"
+        return str(next(n_stored))
+
+    def ask_binary_raw(cmd: str, *args) -> np.ndarray:
+        start, end = _buffer_range(cmd)
+        return readings[start - 1 : end]
+
+    with patch.object(k2450, "ask_raw", side_effect=ask_raw), patch.object(
+        k2450, "ask_binary_raw", side_effect=ask_binary_raw
+    ) as mock_ask_binary, patch.object(k2450, "write_raw") as mock_write:
+        readout = buffer.buffered_readout(
+            25,
+            chunk_size=10,
+            on_chunk=lambda chunk, start: chunks.append(start),
+            poll_interval=0,
+        )
+        data = readout.read()
+
+    np.testing.assert_array_equal(data, readings)
+    assert chunks == [0, 5, 12, 22]
+    assert [call.args[0] for call in mock_ask_binary.call_args_list] == [
+        ":TRACe:DATA? 1, 5, 'defbuffer1'",
+        ":TRACe:DATA? 6, 12, 'defbuffer1'",
+        ":TRACe:DATA? 13, 22, 'defbuffer1'",
+        ":TRACe:DATA? 23, 25, 'defbuffer1'",
+    ]
+    # the binary format is set once for all chunks and the previous data
+    # format is restored after the readout
+    assert [call.args[0] for call in mock_write.call_args_list] == [
+        ":FORMat:DATA REAL;:FORMat:BORDer SWAPped",
+        ":FORMat:DATA ASC;:FORMat:BORDer NORM",
+    ]
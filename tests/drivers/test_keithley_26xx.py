@@ -1,7 +1,10 @@
 from collections import Counter
+from unittest.mock import patch
 
 import numpy as np
 import pytest
+from pyvisa import VisaIOError
+from pyvisa.constants import StatusCode
 
 from qcodes.instrument_drivers.Keithley import (
     Keithley2600MeasurementStatus,
@@ -175,3 +178,102 @@ def test_setting_measure_current_range_disables_autorange(smus) -> None:
         some_valid_measurerange_i = smu.root_instrument._iranges[smu.model][2]
         smu.measurerange_i(some_valid_measurerange_i)
         assert smu.measure_autorange_i_enabled() is False
+
+
+def test_fast_sweep_loads_lua_function_once(driver) -> None:
+    smu = driver.smua
+    readings = np.linspace(0, 1e-6, 5, dtype="<f4")
+    raw_data = b"#0" + readings.tobytes() + b"\n"
+    nplc = smu.nplc()
+
+    with patch.object(driver, "write_raw") as mock_write, patch.object(
+        driver.visa_handle, "read_raw", return_value=raw_data
+    ):
+        first = smu._fast_sweep(0, 1, 5, "IV")
+        second = smu._fast_sweep(0, 2, 5, "IV")
+        smu._fast_sweep(0, 2, 5, "VI")
+
+    np.testing.assert_array_equal(first, readings)
+    np.testing.assert_array_equal(second, readings)
+    assert first.dtype == np.float64
+
+    cmds = [call.args[0] for call in mock_write.call_args_list]
+    assert len(cmds) == 7
+    script_name = cmds[0].split()[1]
+    assert cmds[0].startswith(f"loadscript {script_name}\r\n")
+    assert cmds[0].endswith("endscript")
+    assert cmds[1] == f"{script_name}.run()"
+    assert cmds[2] == f"{script_name}_fn(0, 0.25, 5, {float(nplc)!r})"
+    assert cmds[3] == f"{script_name}_fn(0, 0.5, 5, {float(nplc)!r})"
+    # another mode is another function
+    assert cmds[4].startswith("loadscript ")
+    assert cmds[4].split()[1] != script_name
+
+
+def test_clear_lua_functions(driver) -> None:
+    with patch.object(driver, "write_raw") as mock_write:
+        name = driver.lua_function(("x",), ["print(x)"])
+        assert driver.lua_function(("x",), ["print(x)"]) == name
+        assert mock_write.call_count == 2
+
+        driver.clear_lua_functions()
+        script_name = name.removesuffix("_fn")
+        assert mock_write.call_args.args[0] == f'script.delete("{script_name}")'
+
+        assert driver.lua_function(("x",), ["print(x)"]) == name
+        assert mock_write.call_count == 5
+
+
+def test_fast_sweep_reloads_lost_lua_function(driver) -> None:
+    smu = driver.smua
+    readings = np.linspace(0, 1e-6, 5, dtype="<f4")
+    raw_data = b"#0" + readings.tobytes() + b"\n"
+    ask_raw = driver.ask_raw
+
+    def ask_after_power_cycle(cmd: str) -> str:
+        if cmd.startswith("print(type(qcodes_"):
+            return "nil"
+        return ask_raw(cmd)
+
+    with patch.object(driver, "write_raw") as mock_write, patch.object(
+        driver.visa_handle, "read_raw", return_value=raw_data
+    ):
+        smu._fast_sweep(0, 1, 5, "IV")
+
+    # the function is lost in a power cycle, such that calling it times out
+    with patch.object(driver, "write_raw") as mock_write, patch.object(
+        driver.visa_handle,
+        "read_raw",
+        side_effect=[VisaIOError(StatusCode.error_timeout), raw_data],
+    ), patch.object(driver, "ask_raw", side_effect=ask_after_power_cycle):
+        data = smu._fast_sweep(0, 1, 5, "IV")
+
+    np.testing.assert_array_equal(data, readings)
+    cmds = [call.args[0] for call in mock_write.call_args_list]
+    assert len(cmds) == 4
+    function_call = cmds[0]
+    script_name = function_call.split("(")[0].removesuffix("_fn")
+    assert cmds[1].startswith(f"loadscript {script_name}\r\n")
+    assert cmds[2] == f"{script_name}.run()"
+    assert cmds[3] == function_call
+
+
+def test_fast_sweep_timeout_with_loaded_lua_function(driver) -> None:
+    smu = driver.smua
+    ask_raw = driver.ask_raw
+
+    def ask_function_defined(cmd: str) -> str:
+        if cmd.startswith("print(type(qcodes_"):
+            return "function"
+        return ask_raw(cmd)
+
+    with patch.object(driver, "write_raw") as mock_write, patch.object(
+        driver.visa_handle,
+        "read_raw",
+        side_effect=VisaIOError(StatusCode.error_timeout),
+    ), patch.object(driver, "ask_raw", side_effect=ask_function_defined):
+        with pytest.raises(VisaIOError):
+            smu._fast_sweep(0, 1, 5, "IV")
+
+    # the function is defined, so it is not loaded again
+    assert mock_write.call_count == 3
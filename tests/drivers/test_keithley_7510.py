@@ -1,4 +1,8 @@
+import re
+from unittest.mock import patch
+
 import hypothesis.strategies as st
+import numpy as np
 import pytest
 from hypothesis import HealthCheck, given, settings
 
@@ -55,3 +59,65 @@ def test_set_range_and_nplc(dmm_7510_driver, upper_limit, nplc) -> None:
     assert dmm_7510_driver.sense.range() == upper_limit
     dmm_7510_driver.sense.nplc(nplc)
     assert dmm_7510_driver.sense.nplc() == nplc
+
+
+def test_buffer_data_in_chunks(dmm_7510_driver) -> None:
+    buffer = dmm_7510_driver.buffer("defbuffer1")
+    buffer.readout_chunk_size = 4
+    buffer.data_start(1)
+    buffer.data_end(10)
+    buffer.elements(["measurement", "measurement_unit"])
+    queries = []
+    ask_raw = dmm_7510_driver.ask_raw
+
+    def mock_ask_raw(cmd: str) -> str:
+        match = re.fullmatch(
+            r":TRACe:DATA\? (\d+), (\d+), 'defbuffer1', READing,UNIT", cmd
+        )
+        if cmd == ":DIGitize:FUNCtion?":
+            return '"NONE"'
+        if match is None:
+            return ask_raw(cmd)
+        queries.append((int(match[1]), int(match[2])))
+        return ",".join(
+            f"{i}.5,Volt DC" for i in range(int(match[1]), int(match[2]) + 1)
+        )
+
+    with patch.object(dmm_7510_driver, "ask_raw", side_effect=mock_ask_raw):
+        data = buffer.data
+
+    assert queries == [(1, 4), (5, 8), (9, 10)]
+    assert data.measurement == tuple(i + 0.5 for i in range(1, 11))
+    assert data.measurement_unit == ("Volt DC",) * 10
+
+
+def test_buffered_readout(dmm_7510_driver) -> None:
+    buffer = dmm_7510_driver.buffer("defbuffer1")
+    readings = np.linspace(0, 1, 7)
+    n_stored = iter([3, 7])
+
+    def ask_raw(cmd: str) -> str:
+        if cmd == ":FORMat:DATA?":
+            return "REAL"
+        if cmd == ":FORMat:BORDer?":
+            return "SWAP"
+        assert cmd == ":TRACe:ACTual? 'defbuffer1'"
+        return str(next(n_stored))
+
+    with patch.object(dmm_7510_driver, "ask_raw", side_effect=ask_raw), patch.object(
+        dmm_7510_driver,
+        "ask_binary_raw",
+        side_effect=[readings[:3], readings[3:6], readings[6:]],
+    ) as mock_ask_binary, patch.object(dmm_7510_driver, "write_raw") as mock_write:
+        data = buffer.buffered_readout(7, chunk_size=3, poll_interval=0).read()
+
+    np.testing.assert_array_equal(data, readings)
+    assert [call.args[0] for call in mock_ask_binary.call_args_list] == [
+        ":TRACe:DATA? 1, 3, 'defbuffer1'",
+        ":TRACe:DATA? 4, 6, 'defbuffer1'",
+        ":TRACe:DATA? 7, 7, 'defbuffer1'",
+    ]
+    # a binary format set before the readout is kept
+    assert mock_write.call_args_list[-1].args[0] == (
+        ":FORMat:DATA REAL;:FORMat:BORDer SWAP"
+    )
@@ -0,0 +1,175 @@
+from unittest.mock import patch
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from qcodes.instrument_drivers.Keysight import KeysightN5222B
+
+SWEEP_DATA = np.array([0.5 + 0.25j, -0.125 + 1j, 2e-3 - 3e-4j, -1.5 - 0.75j])
+
+
+class PNAMock:
+    """
+    Stand in for the I/O of a PNA with a single trace. Settings written to
+    the instrument are returned by the corresponding queries, sweeps finish
+    as soon as they are started and the trace returns :data:`SWEEP_DATA`
+    in the selected format.
+    """
+
+    def __init__(self) -> None:
+        self.commands: list[str] = []
+        self.settings = {
+            "CALC:PAR:MNUM": "1",
+            "CALC:FORM": "MLOG",
+            "SENS:SWE:MODE": "CONT",
+            "SENS:SWE:TYPE": "LIN",
+            "SENS:SWE:POIN": str(len(SWEEP_DATA)),
+            "SENS:FREQ:STAR": "1000000",
+            "SENS:FREQ:STOP": "2000000",
+            "SENS:AVER": "0",
+            "SENS:AVER:COUN": "1",
+            "SENS:SWE:GRO:COUN": "1",
+        }
+
+    def write_raw(self, cmd: str) -> None:
+        self.commands.append(cmd)
+        header, _, value = cmd.partition(" ")
+        if header == "SENS:SWE:MODE" and value in ("SING", "GRO"):
+            value = "HOLD"
+        self.settings[header] = value
+
+    def ask_raw(self, cmd: str) -> str:
+        self.commands.append(cmd)
+        return self.settings[cmd.removesuffix("?")]
+
+    def ask_binary_raw(
+        self, cmd: str, dtype: npt.DTypeLike, is_big_endian: bool
+    ) -> np.ndarray:
+        self.commands.append(cmd)
+        assert cmd == "CALC:DATA? FDATA"
+        # FORM REAL,32 and FORM:BORD NORM are set on initialization
+        block = self._trace().astype(">f4").tobytes()
+        byte_order = ">" if is_big_endian else "<"
+        return np.frombuffer(block, dtype=np.dtype(dtype).newbyteorder(byte_order))
+
+    def _trace(self) -> np.ndarray:
+        sweep_format = self.settings["CALC:FORM"]
+        if sweep_format == "MLOG":
+            return 20 * np.log10(np.abs(SWEEP_DATA))
+        if sweep_format == "PHAS":
+            return np.angle(SWEEP_DATA, deg=True)
+        assert sweep_format == "POLAR"
+        interleaved = np.empty(2 * len(SWEEP_DATA))
+        interleaved[0::2] = SWEEP_DATA.real
+        interleaved[1::2] = SWEEP_DATA.imag
+        return interleaved
+
+
+@pytest.fixture(name="pna")
+def _make_pna():
+    driver = KeysightN5222B(
+        "pna", "GPIB::1::INSTR", pyvisa_sim_file="Keysight_N5222B.yaml"
+    )
+    try:
+        yield driver
+    finally:
+        driver.close()
+
+
+@pytest.fixture(name="vna")
+def _make_vna(pna):
+    vna = PNAMock()
+    with patch.object(pna, "write_raw", side_effect=vna.write_raw), patch.object(
+        pna, "ask_raw", side_effect=vna.ask_raw
+    ), patch.object(pna, "ask_binary_raw", side_effect=vna.ask_binary_raw):
+        yield vna
+
+
+def test_formatted_sweeps(pna, vna) -> None:
+    np.testing.assert_allclose(
+        pna.magnitude(), 20 * np.log10(np.abs(SWEEP_DATA)), rtol=1e-6
+    )
+    np.testing.assert_allclose(pna.phase(), np.angle(SWEEP_DATA, deg=True), rtol=1e-6)
+    np.testing.assert_allclose(pna.polar(), SWEEP_DATA, rtol=1e-6)
+
+
+def test_trace_commands_without_cached_trace_state(pna, vna) -> None:
+    pna.magnitude()
+    vna.commands.clear()
+
+    pna.magnitude()
+    assert vna.commands == [
+        "SENS:SWE:MODE?",
+        "SENS:AVER?",
+        "SENS:SWE:MODE SING",
+        "SENS:SWE:MODE?",
+        "CALC:PAR:MNUM 1",
+        "CALC:FORM MLOG",
+        "CALC:DATA? FDATA",
+        "SENS:SWE:MODE CONT",
+        "SENS:SWE:TYPE?",
+    ]
+
+    vna.commands.clear()
+    pna.phase()
+    assert vna.commands == [
+        "SENS:SWE:MODE?",
+        "SENS:AVER?",
+        "SENS:SWE:MODE SING",
+        "SENS:SWE:MODE?",
+        "CALC:PAR:MNUM 1",
+        "CALC:FORM PHAS",
+        "CALC:DATA? FDATA",
+        "SENS:SWE:MODE CONT",
+        "SENS:SWE:TYPE?",
+    ]
+
+
+def test_trace_commands_with_cached_trace_state(pna, vna) -> None:
+    pna.magnitude()
+    pna.cache_trace_state(True)
+    vna.commands.clear()
+
+    # the active trace, the format and the averaging settings are known
+    pna.magnitude()
+    assert vna.commands == [
+        "SENS:SWE:MODE SING",
+        "SENS:SWE:MODE?",
+        "CALC:DATA? FDATA",
+        "SENS:SWE:MODE CONT",
+        "SENS:SWE:TYPE?",
+    ]
+
+    vna.commands.clear()
+    pna.phase()
+    assert vna.commands == [
+        "SENS:SWE:MODE SING",
+        "SENS:SWE:MODE?",
+        "CALC:FORM PHAS",
+        "CALC:DATA? FDATA",
+        "SENS:SWE:MODE CONT",
+        "SENS:SWE:TYPE?",
+    ]
+
+
+def test_cached_trace_state_is_queried_again(pna, vna) -> None:
+    pna.cache_trace_state(True)
+    pna.magnitude()
+    pna.magnitude()
+
+    pna.invalidate_cache()
+    vna.commands.clear()
+    pna.magnitude()
+    assert vna.commands == [
+        "SENS:SWE:MODE?",
+        "SENS:AVER?",
+        "SENS:SWE:MODE SING",
+        "SENS:SWE:MODE?",
+        "CALC:PAR:MNUM 1",
+        "CALC:FORM MLOG",
+        "CALC:DATA? FDATA",
+        "SENS:SWE:MODE CONT",
+        "SENS:SWE:TYPE?",
+        "SENS:SWE:POIN?",
+    ]
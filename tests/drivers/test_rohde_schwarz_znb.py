@@ -0,0 +1,242 @@
+from unittest.mock import patch
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from qcodes.instrument_drivers.rohde_schwarz.ZNB import ZNB
+
+SWEEP_DATA = np.array([0.5 + 0.25j, -0.125 + 1j, 2e-3 - 3e-4j, -1.5 - 0.75j])
+
+
+class ZNBMock:
+    """
+    Stand in for the I/O of a ZNB with one channel measuring the trace
+    ``Trc1``. Settings written to the instrument are returned by the
+    corresponding queries and traces return :data:`SWEEP_DATA` in the
+    selected format.
+    """
+
+    def __init__(self) -> None:
+        self.commands: list[str] = []
+        self.binary_queries: list[str] = []
+        self.settings = {
+            "*IDN": "Rohde-Schwarz,ZNB20-2Port,1311601062100104,3.45",
+            "SENS1:FREQ:START": "1000000",
+            "SENS1:FREQ:STOP": "2000000",
+            "SENS1:SWE:POIN": str(len(SWEEP_DATA)),
+            "SENS1:BAND": "1000",
+            "SENS1:SWE:TIME": "0.01",
+            "SENS1:AVER:COUN": "1",
+            "CONF:CHAN1:MEAS": "0",
+            "CALC1:FORM": "MLOG",
+            "FORM:DATA": "ASC,0",
+            "OUTP1": "1",
+        }
+
+    def write_raw(self, cmd: str) -> None:
+        self.commands.append(cmd)
+        header, _, value = cmd.partition(" ")
+        if value:
+            self.settings[header] = value.strip()
+
+    def ask_raw(self, cmd: str) -> str:
+        self.commands.append(cmd)
+        if cmd.startswith("CALC1:DATA?"):
+            return ",".join(repr(float(value)) for value in self._trace(cmd)) + "\n"
+        if cmd == "CALC1:PAR:MEAS? 'Trc1'":
+            return "'S21'\n"
+        return self.settings[cmd.removesuffix("?")] + "\n"
+
+    def ask_binary_raw(
+        self, cmd: str, dtype: npt.DTypeLike, is_big_endian: bool
+    ) -> np.ndarray:
+        self.commands.append(cmd)
+        self.binary_queries.append(cmd)
+        # the instrument sends the data least significant byte first
+        instrument_dtype = {"REAL,32": "<f4", "REAL,64": "<f8"}[
+            self.settings["FORM:DATA"]
+        ]
+        block = self._trace(cmd).astype(instrument_dtype).tobytes()
+        byte_order = ">" if is_big_endian else "<"
+        return np.frombuffer(block, dtype=np.dtype(dtype).newbyteorder(byte_order))
+
+    def _trace(self, cmd: str) -> np.ndarray:
+        if cmd.endswith("FDAT") and self.settings["CALC1:FORM"] == "MLOG":
+            return 20 * np.log10(np.abs(SWEEP_DATA))
+        interleaved = np.empty(2 * len(SWEEP_DATA))
+        interleaved[0::2] = SWEEP_DATA.real
+        interleaved[1::2] = SWEEP_DATA.imag
+        return interleaved
+
+
+@pytest.fixture(name="znb")
+def _make_znb():
+    # the driver does not set a read termination, which pyvisa-sim needs
+    # to simulate the queries sent on initialization
+    driver = ZNB(
+        "znb",
+        "GPIB::1::INSTR",
+        init_s_params=False,
+        terminator="\n",
+        pyvisa_sim_file="RSZNB.yaml",
+    )
+    try:
+        yield driver
+    finally:
+        driver.close()
+
+
+@pytest.fixture(name="vna")
+def _make_vna(znb):
+    vna = ZNBMock()
+    with patch.object(znb, "write_raw", side_effect=vna.write_raw), patch.object(
+        znb, "ask_raw", side_effect=vna.ask_raw
+    ), patch.object(znb, "ask_binary_raw", side_effect=vna.ask_binary_raw):
+        znb.add_channel("S21")
+        vna.commands.clear()
+        yield vna
+
+
+@pytest.mark.parametrize(
+    ("data_transfer_format", "rtol"),
+    [("ascii", 1e-15), ("real32", 1e-6), ("real64", 1e-15)],
+)
+def test_trace_data_transfer_formats(znb, vna, data_transfer_format, rtol) -> None:
+    znb.data_transfer_format(data_transfer_format)
+    channel = znb.channels[0]
+
+    magnitude, phase = channel.trace_mag_phase()
+    np.testing.assert_allclose(magnitude, np.abs(SWEEP_DATA), rtol=rtol)
+    np.testing.assert_allclose(phase, np.angle(SWEEP_DATA), rtol=rtol)
+
+    channel.format("dB")
+    np.testing.assert_allclose(
+        channel.trace(), 20 * np.log10(np.abs(SWEEP_DATA)), rtol=rtol
+    )
+
+    channel.format("Complex")
+    np.testing.assert_allclose(channel.trace(), SWEEP_DATA, rtol=rtol)
+
+    if data_transfer_format == "ascii":
+        assert vna.binary_queries == []
+    else:
+        assert vna.binary_queries == [
+            "CALC1:DATA? SDAT",
+            "CALC1:DATA? FDAT",
+            "CALC1:DATA? FDAT",
+        ]
+
+
+TRACE_COMMANDS = [
+    "OUTP1?",
+    "CALC1:PAR:MEAS? 'Trc1'",
+    "SENS1:AVER:STAT ON",
+    "SENS1:AVER:CLE",
+    "CONF:CHAN1:MEAS 1",
+    "INIT:CONT:ALL OFF",
+    "SENS1:AVER:COUN?",
+    "INIT1:IMM; *WAI",
+    "CALC1:PAR:SEL 'Trc1'",
+    "CALC1:DATA? FDAT",
+    "CALC1:PAR:SEL 'Trc1'",
+    "CALC1:FORM?",
+    "INIT:CONT:ALL ON",
+    "CONF:CHAN1:MEAS 0",
+]
+
+
+def test_trace_commands_without_cached_trace_state(znb, vna) -> None:
+    channel = znb.channels[0]
+
+    channel.trace()
+    # the first trace also gets the state needed for the timeout and the
+    # data transfer format, and the status restored after the trace
+    assert vna.commands == [
+        *TRACE_COMMANDS[:4],
+        "CONF:CHAN1:MEAS?",
+        *TRACE_COMMANDS[4:6],
+        "SENS1:SWE:TIME?",
+        *TRACE_COMMANDS[6:9],
+        "FORM:DATA?",
+        *TRACE_COMMANDS[9:],
+    ]
+
+    vna.commands.clear()
+    channel.trace()
+    assert vna.commands == TRACE_COMMANDS
+
+    vna.commands.clear()
+    channel.trace_mag_phase()
+    assert vna.commands == [
+        "CALC1:PAR:SEL 'Trc1'",
+        "CALC1:FORM COMP\n",
+        *TRACE_COMMANDS[:9],
+        "CALC1:DATA? SDAT",
+        *TRACE_COMMANDS[10:],
+        "CALC1:PAR:SEL 'Trc1'",
+        "CALC1:FORM MLOG\n",
+    ]
+
+
+def test_trace_commands_with_cached_trace_state(znb, vna) -> None:
+    channel = znb.channels[0]
+    channel.trace()
+    znb.cache_trace_state(True)
+
+    vna.commands.clear()
+    channel.trace()
+    # the channel is enabled and continuous measurement turned off once
+    assert vna.commands == [
+        "SENS1:AVER:CLE",
+        "CONF:CHAN1:MEAS 1",
+        "INIT:CONT:ALL OFF",
+        "INIT1:IMM; *WAI",
+        "CALC1:DATA? FDAT",
+    ]
+
+    vna.commands.clear()
+    channel.trace()
+    assert vna.commands == ["SENS1:AVER:CLE", "INIT1:IMM; *WAI", "CALC1:DATA? FDAT"]
+
+    vna.commands.clear()
+    magnitude, _ = channel.trace_mag_phase()
+    np.testing.assert_allclose(magnitude, np.abs(SWEEP_DATA))
+    assert vna.commands == [
+        "CALC1:FORM COMP\n",
+        "SENS1:AVER:CLE",
+        "INIT1:IMM; *WAI",
+        "CALC1:DATA? SDAT",
+        "CALC1:FORM MLOG\n",
+    ]
+
+
+@pytest.mark.parametrize("invalidate", ["reset", "invalidate_cache"])
+def test_cached_trace_state_is_queried_again(znb, vna, invalidate) -> None:
+    channel = znb.channels[0]
+    channel.trace()
+    znb.cache_trace_state(True)
+    channel.trace()
+
+    getattr(znb, invalidate)()
+    vna.commands.clear()
+    channel.trace()
+    assert vna.commands == [
+        *TRACE_COMMANDS[:6],
+        "SENS1:SWE:TIME?",
+        *TRACE_COMMANDS[6:9],
+        "FORM:DATA?",
+        "CALC1:DATA? FDAT",
+        "CALC1:FORM?",
+    ]
+
+
+def test_cached_trace_is_selected_again_after_clear_channels(znb, vna) -> None:
+    znb.cache_trace_state(True)
+    znb.channels[0].trace()
+
+    znb.clear_channels()
+    znb.add_channel("S21")
+    vna.commands.clear()
+    znb.channels[0].trace()
+    assert "CALC1:PAR:SEL 'Trc1'" in vna.commands
@@ -0,0 +1,143 @@
+import ctypes as ct
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from qcodes.instrument_drivers.signal_hound import SignalHoundUSBSA124B
+from qcodes.instrument_drivers.signal_hound.SignalHound_USB_SA124B import Constants
+
+SWEEP_LEN = 11
+START_FREQ = 4.99e9
+STEPSIZE = 1e3
+
+
+class MockSaApi:
+    """
+    Stand in for ``sa_api.dll`` that returns sweeps counting up from 0, such
+    that the n'th sweep is filled with the value n.
+    """
+
+    def __init__(self) -> None:
+        self.dll = MagicMock()
+        self.sweeps_taken = 0
+        self.sweep_pointers: list[int] = []
+        for name in (
+            "saConfigCenterSpan",
+            "saConfigAcquisition",
+            "saConfigLevel",
+            "saSetTimebase",
+            "saConfigSweepCoupling",
+            "saInitiate",
+            "saCloseDevice",
+            "saAbort",
+            "saPreset",
+            "saGetSerialNumber",
+            "saGetFirmwareString",
+        ):
+            getattr(self.dll, name).return_value = 0
+        self.dll.saOpenDevice.side_effect = self._open_device
+        self.dll.saGetDeviceType.side_effect = self._get_device_type
+        self.dll.saQuerySweepInfo.side_effect = self._query_sweep_info
+        self.dll.saGetSweep_32f.side_effect = self._get_sweep
+
+    @staticmethod
+    def _open_device(handle) -> int:
+        handle.contents.value = 1
+        return 0
+
+    @staticmethod
+    def _get_device_type(handle, device_type) -> int:
+        device_type.contents.value = Constants.saDeviceTypeSA124B
+        return 0
+
+    @staticmethod
+    def _query_sweep_info(handle, sweep_len, start_freq, stepsize) -> int:
+        sweep_len.contents.value = SWEEP_LEN
+        start_freq.contents.value = START_FREQ
+        stepsize.contents.value = STEPSIZE
+        return 0
+
+    def _get_sweep(self, handle, minarr, maxarr) -> int:
+        self.sweep_pointers.append(ct.cast(minarr, ct.c_void_p).value)
+        datamin = np.ctypeslib.as_array(minarr, shape=(SWEEP_LEN,))
+        datamax = np.ctypeslib.as_array(maxarr, shape=(SWEEP_LEN,))
+        datamin[:] = self.sweeps_taken
+        datamax[:] = self.sweeps_taken
+        self.sweeps_taken += 1
+        return 0
+
+
+@pytest.fixture(name="sa_api")
+def _make_sa_api():
+    yield MockSaApi()
+
+
+@pytest.fixture(name="signal_hound")
+def _make_signal_hound(sa_api):
+    with patch("ctypes.CDLL", return_value=sa_api.dll):
+        inst = SignalHoundUSBSA124B("signal_hound", dll_path="sa_api.dll")
+    inst.sleep_time(0)
+    try:
+        yield inst
+    finally:
+        inst.close()
+
+
+def test_idn(signal_hound) -> None:
+    assert signal_hound.IDN()["model"] == "sa124B"
+
+
+def test_freq_sweep_averages_sweeps(signal_hound, sa_api) -> None:
+    signal_hound.avg(4)
+
+    data = signal_hound.freq_sweep()
+
+    np.testing.assert_array_equal(data, np.full(SWEEP_LEN, 1.5))
+    np.testing.assert_allclose(
+        signal_hound.frequency_axis(),
+        START_FREQ + STEPSIZE * np.arange(SWEEP_LEN),
+    )
+    # the sweeps are read into the same preallocated buffer
+    assert len(set(sa_api.sweep_pointers)) == 1
+
+
+def test_stream_sweeps(signal_hound, sa_api) -> None:
+    sweeps = [sweep.copy() for sweep in signal_hound.stream_sweeps(5, buffer_size=2)]
+
+    assert sa_api.sweeps_taken == 5
+    for i, sweep in enumerate(sweeps):
+        np.testing.assert_array_equal(sweep, np.full(SWEEP_LEN, i, dtype=np.float32))
+    # the sweeps are read into a ring of two preallocated arrays
+    assert len(set(sa_api.sweep_pointers)) == 2
+
+
+def test_stream_sweeps_until_closed(signal_hound, sa_api) -> None:
+    stream = signal_hound.stream_sweeps()
+    for _ in range(3):
+        next(stream)
+    stream.close()
+
+    assert sa_api.sweeps_taken == 3
+
+
+def test_stream_sweeps_stops_on_parameter_change(signal_hound) -> None:
+    stream = signal_hound.stream_sweeps(10)
+    next(stream)
+    signal_hound.span(1e6)
+
+    with pytest.raises(RuntimeError, match="changed while streaming"):
+        next(stream)
+
+
+def test_stream_sweeps_validates_and_syncs_on_call(signal_hound, sa_api) -> None:
+    with pytest.raises(ValueError, match="buffer_size must be at least 1"):
+        signal_hound.stream_sweeps(buffer_size=0)
+
+    signal_hound.span(1e6)
+    sa_api.dll.saConfigCenterSpan.reset_mock()
+    stream = signal_hound.stream_sweeps(3)
+    # the device is configured before the first sweep is requested
+    sa_api.dll.saConfigCenterSpan.assert_called_once()
+    assert sa_api.sweeps_taken == 0
+    assert len(list(stream)) == 3
@@ -0,0 +1,78 @@
+import re
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from qcodes.instrument_drivers.stanford_research import SR830
+
+
+@pytest.fixture(name="sr830")
+def _make_sr830():
+    # the driver does not set a read termination, which pyvisa-sim needs
+    # to simulate the queries sent on initialization
+    driver = SR830(
+        "sr830", "GPIB::1::INSTR", terminator="\n", pyvisa_sim_file="SR830.yaml"
+    )
+    try:
+        yield driver
+    finally:
+        driver.close()
+
+
+class SR830BufferMock:
+    """
+    Stand in for the data buffer of channel 1 of an SR830, which stores
+    the points 0, 1, 2, ... The number of stored points reported by
+    ``SPTS ?`` is taken from ``n_stored`` and TRCL transfers the requested
+    points in the binary format of the instrument.
+    """
+
+    def __init__(self, n_stored: list[int]) -> None:
+        self.n_stored = iter(n_stored)
+        self.transfers: list[tuple[int, int]] = []
+
+    def ask_raw(self, cmd: str) -> str:
+        assert cmd == "SPTS ?"
+        return str(next(self.n_stored))
+
+    def write_raw(self, cmd: str) -> None:
+        match = re.fullmatch(r"TRCL \? 1, (\d+), (\d+)", cmd)
+        assert match is not None, cmd
+        self.transfers.append((int(match[1]), int(match[2])))
+
+    def read_raw(self) -> bytes:
+        start, n_points = self.transfers[-1]
+        # each point is a mantissa followed by an exponent offset by 124
+        points = np.empty((n_points, 2), dtype="<i2")
+        points[:, 0] = np.arange(start, start + n_points)
+        points[:, 1] = 124
+        return points.tobytes()
+
+
+def test_buffered_readout_reads_partial_buffers(sr830) -> None:
+    buffer = SR830BufferMock(n_stored=[3, 10])
+    chunks = []
+
+    with patch.object(sr830, "ask_raw", side_effect=buffer.ask_raw), patch.object(
+        sr830, "write_raw", side_effect=buffer.write_raw
+    ), patch.object(sr830.visa_handle, "read_raw", side_effect=buffer.read_raw):
+        readout = sr830.buffered_readout(
+            1,
+            10,
+            chunk_size=4,
+            on_chunk=lambda chunk, start: chunks.append((start, chunk.tolist())),
+            poll_interval=0,
+        )
+        data = readout.read()
+
+    np.testing.assert_array_equal(data, np.arange(10))
+    # the points stored so far are read before the buffer is full, and
+    # each transfer starts at the first point that has not been read
+    assert buffer.transfers == [(0, 3), (3, 4), (7, 3)]
+    assert chunks == [(0, [0, 1, 2]), (3, [3, 4, 5, 6]), (7, [7, 8, 9])]
+
+
+def test_buffered_readout_invalid_channel(sr830) -> None:
+    with pytest.raises(ValueError, match="only has channels 1 and 2"):
+        sr830.buffered_readout(3, 10)
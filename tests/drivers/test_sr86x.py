@@ -0,0 +1,123 @@
+import re
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from qcodes.instrument_drivers.stanford_research import SR860
+
+CAPTURE_CONFIGS = {"X": "0", "X,Y": "1", "R,T": "2", "X,Y,R,T": "3"}
+
+
+@pytest.fixture(name="sr860")
+def _make_sr860():
+    driver = SR860("sr860", "GPIB::1::INSTR", pyvisa_sim_file="SR860.yaml")
+    try:
+        yield driver
+    finally:
+        driver.close()
+
+
+class SR86xCaptureMock:
+    """
+    Stand in for the capture buffer of an SR86x. The buffer holds the
+    values 1, 2, 3, ... as 4 byte floats, such that the value of variable
+    ``j`` of sample ``i`` is ``i * n_variables + j + 1``. Each query of the
+    number of captured bytes reports ``bytes_per_poll`` more bytes, up to
+    ``n_bytes``.
+    """
+
+    def __init__(self, capture_config: str, n_bytes: int, bytes_per_poll: int) -> None:
+        self.settings = {"CAPTURECFG": CAPTURE_CONFIGS[capture_config]}
+        self.n_bytes = n_bytes
+        self.bytes_per_poll = bytes_per_poll
+        self.captured_bytes = 0
+        self.values = np.zeros(n_bytes // 4 + 64 * 256, dtype="<f4")
+        self.values[: n_bytes // 4] = np.arange(1, n_bytes // 4 + 1)
+        self.writes: list[str] = []
+        self.capturegets: list[tuple[int, int]] = []
+
+    def write_raw(self, cmd: str) -> None:
+        self.writes.append(cmd)
+        header, _, value = cmd.partition(" ")
+        self.settings[header] = value
+
+    def ask_raw(self, cmd: str) -> str:
+        if cmd == "CAPTUREBYTES?":
+            self.captured_bytes = min(
+                self.captured_bytes + self.bytes_per_poll, self.n_bytes
+            )
+            return str(self.captured_bytes)
+        return self.settings[cmd.removesuffix("?")]
+
+    def query_binary_values(self, cmd: str, **kwargs) -> list[float]:
+        match = re.fullmatch(r"CAPTUREGET\? (\d+), (\d+)", cmd)
+        assert match is not None, cmd
+        offset_in_kb, size_in_kb = int(match[1]), int(match[2])
+        self.capturegets.append((offset_in_kb, size_in_kb))
+        return self.values[offset_in_kb * 256 : (offset_in_kb + size_in_kb) * 256]
+
+
+def _patch_io(sr860, mock):
+    return (
+        patch.object(sr860, "write_raw", side_effect=mock.write_raw),
+        patch.object(sr860, "ask_raw", side_effect=mock.ask_raw),
+        patch.object(
+            sr860.visa_handle,
+            "query_binary_values",
+            side_effect=mock.query_binary_values,
+        ),
+    )
+
+
+@pytest.mark.parametrize("n_variables", [1, 2, 3])
+@pytest.mark.parametrize(
+    ("start", "stop"),
+    # 1 kB holds 256 values, so the ranges start and end on either side
+    # of kB boundaries for each number of variables
+    [(0, 1), (84, 86), (85, 171), (127, 129), (255, 257), (300, 700)],
+)
+def test_get_capture_samples(sr860, n_variables, start, stop) -> None:
+    mock = SR86xCaptureMock("X", n_bytes=16 * 1024, bytes_per_poll=16 * 1024)
+    write_raw, ask_raw, query_binary_values = _patch_io(sr860, mock)
+
+    with write_raw, ask_raw, query_binary_values:
+        samples = sr860.buffer._get_capture_samples(start, stop, n_variables)
+
+    values = np.arange(1, 4096 + 1)
+    np.testing.assert_array_equal(
+        samples,
+        values[start * n_variables : stop * n_variables].reshape(-1, n_variables),
+    )
+    # only the kB blocks holding the samples are transferred
+    first_kb = start * n_variables // 256
+    end_kb = -(-stop * n_variables // 256)
+    assert mock.capturegets == [(first_kb, end_kb - first_kb)]
+
+
+@pytest.mark.parametrize("capture_config", ["X", "X,Y", "X,Y,R,T"])
+def test_capture_samples_reads_while_capturing(sr860, capture_config) -> None:
+    variables = capture_config.split(",")
+    n_variables = len(variables)
+    sample_count = 1000
+    mock = SR86xCaptureMock(
+        capture_config,
+        n_bytes=sample_count * n_variables * 4,
+        bytes_per_poll=1500,
+    )
+    sr860.buffer.max_size_per_reading_in_kb = 2
+    write_raw, ask_raw, query_binary_values = _patch_io(sr860, mock)
+
+    with write_raw, ask_raw, query_binary_values:
+        data = sr860.buffer.capture_samples(sample_count)
+
+    assert list(data) == variables
+    for j, variable in enumerate(variables):
+        expected = np.arange(sample_count) * n_variables + j + 1
+        np.testing.assert_array_equal(data[variable], expected)
+        np.testing.assert_array_equal(getattr(sr860.buffer, variable)(), expected)
+    # the samples are read in several transfers while the capture runs, none
+    # larger than the maximal size of a single transfer
+    assert len(mock.capturegets) > 1
+    assert all(size <= 2 for _, size in mock.capturegets)
+    assert mock.writes[-2:] == ["CAPTURESTART ONE, IMM", "CAPTURESTOP"]
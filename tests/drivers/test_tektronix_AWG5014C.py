@@ -1,7 +1,14 @@
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
 from qcodes.instrument_drivers.tektronix.AWG5014 import Tektronix_AWG5014
+from qcodes.instrument_drivers.tektronix.AWGFileParser import (
+    _parser1,
+    _parser2,
+    _unpacker,
+)
 
 
 @pytest.fixture(scope='function')
@@ -60,3 +67,139 @@ def test_make_awg_file(awg) -> None:
                                 preservechannelsettings=False)
 
     assert len(awgfile) > 0
+
+
+def test_pack_waveform_values(awg) -> None:
+
+    N = 1000
+
+    waveform = np.random.uniform(-1, 1, N)
+    waveform[:3] = [-1, 0, 1]
+    m1 = np.random.randint(0, 2, N)
+    m2 = np.random.randint(0, 2, N)
+
+    package = awg._pack_waveform(waveform, m1, m2)
+
+    expected = np.trunc(16384 * m1 + 32768 * m2
+                        + waveform * 8191 + 8191.5).astype(np.uint16)
+    assert package.dtype == np.uint16
+    np.testing.assert_array_equal(package, expected)
+
+    with pytest.raises(TypeError, match="Marker 1"):
+        awg._pack_waveform(waveform, m1 + 1, m2)
+
+
+def test_make_awg_file_round_trip(awg, tmp_path) -> None:
+
+    N = 100
+
+    waveforms = [[np.random.uniform(-1, 1, N), np.random.uniform(-1, 1, N)]]
+    m1s = [[np.random.randint(0, 2, N), np.random.randint(0, 2, N)]]
+    m2s = [[np.random.randint(0, 2, N), np.random.randint(0, 2, N)]]
+
+    awgfile = awg.make_awg_file(waveforms,
+                                m1s,
+                                m2s,
+                                [1, 2],
+                                [0, 1],
+                                [0, 0],
+                                [0, 0],
+                                channels=[1],
+                                preservechannelsettings=False)
+
+    filepath = tmp_path / "test.awg"
+    filepath.write_bytes(awgfile)
+    _, waveformlist, _ = _parser1(str(filepath))
+    wfmdict = _parser2(waveformlist)
+
+    assert len(wfmdict) == 2
+    for (name, unpacked), wfm, m1, m2 in zip(
+        sorted(wfmdict.items()), waveforms[0], m1s[0], m2s[0]
+    ):
+        packed = awg._pack_waveform(wfm, m1, m2)
+        np.testing.assert_array_equal(_unpacker(packed)[0], unpacked["wfm"])
+        np.testing.assert_array_equal(unpacked["m1"], m1)
+        np.testing.assert_array_equal(unpacked["m2"], m2)
+        np.testing.assert_allclose(unpacked["wfm"], wfm, atol=3 / 2**13)
+
+
+def test_unpacker() -> None:
+
+    binaryarray = np.array([0, 2**13, 2**14 - 1, 2**14, 2**15, 2**16 - 1],
+                           dtype=np.uint16)
+
+    wf, m1, m2 = _unpacker(binaryarray)
+
+    np.testing.assert_array_equal(
+        wf, [-1, 0, (2**13 - 1) / 2**13, -1, -1, (2**13 - 1) / 2**13])
+    np.testing.assert_array_equal(m1, [0, 0, 0, 1, 0, 1])
+    np.testing.assert_array_equal(m2, [0, 0, 0, 0, 1, 1])
+
+
+def test_upload_sequence_sends_changed_waveforms(awg) -> None:
+
+    N = 50
+    nelems = 3
+
+    waveforms = [[np.random.uniform(-1, 1, N) for _ in range(nelems)]
+                 for _ in range(2)]
+    m1s = [[np.random.randint(0, 2, N) for _ in range(nelems)]
+           for _ in range(2)]
+    m2s = [[np.random.randint(0, 2, N) for _ in range(nelems)]
+           for _ in range(2)]
+    seq_args = ([1, 2, 0], [0, 0, 1], [0, 0, 1], [0, -1, 0])
+
+    with patch.object(awg, 'write_raw') as write, \
+            patch.object(awg.visa_handle, 'write_raw') as write_binary:
+        names = awg.upload_sequence(waveforms, m1s, m2s, *seq_args)
+
+        assert write_binary.call_count == 2 * nelems
+        assert len({name for namelist in names for name in namelist}) == 6
+        written = [c.args[0] for c in write.call_args_list]
+        assert f'SEQuence:ELEMent2:WAVeform2 "{names[1][1]}"' in written
+        assert 'SEQuence:ELEMent3:LOOP:INFinite 1' in written
+        assert 'SEQuence:ELEMent3:GOTO:INDex 1' in written
+        assert 'SEQuence:ELEMent2:JTARget:TYPE NEXT' in written
+        assert written[-1] == 'AWGControl:RMODe SEQ'
+
+        # change a single segment
+        waveforms[0][1] = np.random.uniform(-1, 1, N)
+        write_binary.reset_mock()
+        write.reset_mock()
+        new_names = awg.upload_sequence(waveforms, m1s, m2s, *seq_args)
+
+        assert write_binary.call_count == 1
+        assert new_names[0][1] != names[0][1]
+        assert new_names[0][::2] == names[0][::2]
+        assert new_names[1] == names[1]
+
+        # the stale waveform can be deleted
+        write.reset_mock()
+        awg.delete_unused_waveforms(new_names)
+        written = [c.args[0] for c in write.call_args_list]
+        assert written == [f'WLISt:WAVeform:DEL "{names[0][1]}"']
+        assert len(awg.waveform_cache) == 6
+
+        # after clearing the waveform list everything is sent again
+        awg.delete_all_waveforms_from_list()
+        write_binary.reset_mock()
+        awg.upload_sequence(waveforms, m1s, m2s, *seq_args)
+
+        assert write_binary.call_count == 2 * nelems
+
+
+def test_upload_waveforms_matches_awg_file(awg) -> None:
+
+    N = 25
+
+    wfm = np.random.uniform(-1, 1, N)
+    m1 = np.random.randint(0, 2, N)
+    m2 = np.random.randint(0, 2, N)
+
+    with patch.object(awg, 'write_raw'), \
+            patch.object(awg.visa_handle, 'write_raw') as write_binary:
+        awg.upload_waveforms([[wfm]], [[m1]], [[m2]])
+
+    message = write_binary.call_args.args[0]
+    # the data is the same as in an .awg file
+    assert message.endswith(awg._pack_waveform(wfm, m1, m2).tobytes())
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+import struct
 import zipfile
 from io import BytesIO, StringIO
+from unittest.mock import patch
 
 import hypothesis.strategies as hst
 import numpy as np
@@ -231,6 +233,36 @@ def test_seqxfile_from_fs(forged_sequence) -> None:
             etree.XML(str_seq_sml, parser=parser)
 
 
+@pytest.mark.parametrize("markers_included", [True, False])
+def test_makeWFMXFileBinaryData(random_wfm_m1_m2_package, markers_included) -> None:
+    data = random_wfm_m1_m2_package()
+    data_copy = data.copy()
+    amplitude = 0.25
+    if not markers_included:
+        data = data[0]
+
+    binary_data = AWG70000A._makeWFMXFileBinaryData(data, amplitude)
+
+    # reference packing one value at a time
+    wfm = data_copy[0] * 2 / amplitude
+    expected = struct.pack(f"<{len(wfm)}f", *wfm)
+    if markers_included:
+        markers = (data_copy[1] + 2 * data_copy[2]).astype(int)
+        expected += struct.pack(f"{len(markers)}B", *markers)
+
+    assert binary_data == expected
+    # the input must not be modified
+    if markers_included:
+        np.testing.assert_array_equal(data, data_copy)
+
+
+def test_makeWFMXFileBinaryData_invalid_markers() -> None:
+    data = np.array([np.zeros(10), np.full(10, 300), np.zeros(10)])
+
+    with pytest.raises(ValueError, match="between 0 and 255"):
+        AWG70000A._makeWFMXFileBinaryData(data, 1)
+
+
 # TODO: Add some failing tests for inproper input
 
 
@@ -256,3 +288,75 @@ def test_makeSEQXFile(awg2, random_wfm_m1_m2_package) -> None:
     awg2.makeSEQXFile(
         trig_waits, nreps, event_jumps, event_jump_to, go_to, wfms, amplitudes, seqname
     )
+
+
+def test_upload_sequence_sends_changed_waveforms(
+    awg2, random_wfm_m1_m2_package
+) -> None:
+    seqlen = 4
+    chans = 2
+    wfms = [[random_wfm_m1_m2_package() for _ in range(seqlen)] for _ in range(chans)]
+    seq_args = ([0, 1, 0, 0], [1, 0, 2, 1], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 1])
+    amplitudes = [0.5, 0.5]
+
+    waveform_list: list[str] = []
+    sent_files: list[str] = []
+
+    def ask_raw(cmd: str) -> str:
+        if cmd == "WLISt:LIST?":
+            return ",".join(f'"{name}"' for name in waveform_list)
+        if cmd == "SLISt:SIZE?":
+            return "0"
+        raise ValueError(cmd)
+
+    def send_wfmx_file(wfmx: bytes, filename: str) -> None:
+        sent_files.append(filename)
+
+    def load_wfmx_file(filename: str) -> None:
+        waveform_list.append(filename.removesuffix(".wfmx"))
+
+    with patch.object(awg2, "write_raw") as write, patch.object(
+        awg2, "ask_raw", side_effect=ask_raw
+    ), patch.object(awg2, "sendWFMXFile", side_effect=send_wfmx_file), patch.object(
+        awg2, "loadWFMXFile", side_effect=load_wfmx_file
+    ):
+        names = awg2.upload_sequence(*seq_args, wfms, amplitudes, "test seq")
+
+        assert len(sent_files) == chans * seqlen
+        assert waveform_list == [name for namelist in names for name in namelist]
+        written = [c.args[0] for c in write.call_args_list]
+        # the files are deleted from the disk once loaded
+        assert written[: len(sent_files)] == [
+            f'MMEMory:DELete "{filename}"' for filename in sent_files
+        ]
+        written = written[len(sent_files) :]
+        assert written[0] == 'SLISt:SEQuence:NEW "test_seq",4,2'
+        assert (
+            f'SLISt:SEQuence:STEP3:TASSet2:WAVeform "test_seq","{names[1][2]}"'
+            in written
+        )
+        assert 'SLISt:SEQuence:STEP2:RCOunt "test_seq",INFinite' in written
+        assert 'SLISt:SEQuence:STEP3:RCOunt "test_seq",2' in written
+        assert 'SLISt:SEQuence:STEP2:WINPut "test_seq",ATRigger' in written
+        assert 'SLISt:SEQuence:STEP4:GOTO "test_seq",1' in written
+
+        # change a single segment
+        wfms[1][2] = random_wfm_m1_m2_package()
+        sent_files.clear()
+        new_names = awg2.upload_sequence(*seq_args, wfms, amplitudes, "test seq")
+
+        assert sent_files == [f"{new_names[1][2]}.wfmx"]
+        new_names[1][2] = names[1][2]
+        assert new_names == names
+
+        # waveforms removed from the waveform list are sent again
+        waveform_list.remove(names[0][0])
+        sent_files.clear()
+        awg2.upload_waveforms(wfms, amplitudes)
+
+        assert sent_files == [f"{names[0][0]}.wfmx"]
+
+
+def test_link_sequence_mismatched_lengths(awg2) -> None:
+    with pytest.raises(ValueError, match="same length"):
+        awg2.link_sequence([0], [1, 1], [0], [0], [0], [["a"]], "seq")
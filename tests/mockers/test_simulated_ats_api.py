@@ -1,4 +1,5 @@
 import logging
+import time
 
 import numpy as np
 import pytest
@@ -45,7 +46,6 @@ def alazar_ctrl():
     yield TestAcquisitionController()
 
 
-@pytest.mark.win32
 def test_simulated_alazar(simulated_alazar, alazar_ctrl, caplog) -> None:
     alazar = simulated_alazar
     buffers_per_acquisition = 10
@@ -70,3 +70,99 @@ def test_simulated_alazar(simulated_alazar, alazar_ctrl, caplog) -> None:
 
     for d in data:
         assert np.allclose(d, np.ones(d.shape))
+
+
+class CountingGenerator:
+    """Fills each buffer with the number of buffers filled before it."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, data):
+        data[:] = self.count
+        self.count += 1
+
+
+@pytest.fixture(scope="function")
+def counting_alazar():
+    driver = ATS9360(
+        "Alazar",
+        api=SimulatedATS9360API(
+            dll_path="simulated", buffer_generator=CountingGenerator()
+        ),
+    )
+    with driver.syncing():
+        driver.sample_rate(1_000_000_000)
+    try:
+        yield driver
+    finally:
+        driver.close()
+
+
+def acquire_counting(alazar, acquisition_controller, processing_workers):
+    return alazar.acquire(
+        mode="NPT",
+        samples_per_record=1024,
+        records_per_buffer=1,
+        buffers_per_acquisition=12,
+        channel_selection="A",
+        allocated_buffers=3,
+        acquisition_controller=acquisition_controller,
+        processing_workers=processing_workers,
+    )
+
+
+def test_buffer_pipeline_calls_handle_buffer_in_order(counting_alazar) -> None:
+    class SlowController(AcquisitionInterface):
+        def __init__(self):
+            self.buffers = []
+
+        def handle_buffer(self, buffer, buffer_number=None):
+            # the buffer must not be filled again while it is handled
+            time.sleep(0.005)
+            self.buffers.append((buffer_number, np.copy(buffer)))
+
+        def post_acquire(self):
+            return self.buffers
+
+    data = acquire_counting(counting_alazar, SlowController(), 4)
+
+    assert [number for number, _ in data] == list(range(12))
+    for number, buffer in data:
+        assert np.all(buffer == number)
+    stats = counting_alazar.buffer_pipeline_stats
+    assert stats.buffers_processed == 12
+    assert stats.max_pending <= 3
+    assert stats.processing_time > 0
+
+
+def test_buffer_pipeline_processes_in_parallel(counting_alazar) -> None:
+    class ParallelController(AcquisitionInterface):
+        def __init__(self):
+            self.results = []
+
+        def process_buffer(self, buffer, buffer_number):
+            # finish the buffers out of order
+            time.sleep(0.01 * (buffer_number % 3 == 0))
+            return buffer.mean()
+
+        def handle_processed_buffer(self, result, buffer_number):
+            self.results.append((buffer_number, result))
+
+        def post_acquire(self):
+            return self.results
+
+    results = acquire_counting(counting_alazar, ParallelController(), 3)
+
+    assert results == [(number, float(number)) for number in range(12)]
+    assert counting_alazar.buffer_pipeline_stats.buffers_processed == 12
+
+
+def test_buffer_pipeline_raises_processing_errors(counting_alazar) -> None:
+    class FailingController(AcquisitionInterface):
+        def handle_buffer(self, buffer, buffer_number=None):
+            if buffer_number == 5:
+                raise ValueError("processing failed")
+
+    with pytest.raises(ValueError, match="processing failed"):
+        acquire_counting(counting_alazar, FailingController(), 2)
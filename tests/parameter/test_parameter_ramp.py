@@ -6,8 +6,10 @@ import pytest
 from hypothesis import given, settings
 from pytest import LogCaptureFixture
 
-from qcodes.parameters import Parameter
-from qcodes.validators import Numbers
+from qcodes.parameters import Parameter, RampAbortedError, RampProgress
+from qcodes.parameters.permissive_range import permissive_range
+from qcodes.parameters.ramp import ramp_values
+from qcodes.validators import Multiples, Numbers
 
 from .conftest import MemoryParameter
 
@@ -179,3 +181,72 @@ def test_stepping_from_invalid_starting_point() -> None:
         a.set(10)
     # afterwards the value should still be the same
     assert a.get() == -10
+
+
+@given(
+    start=hst.floats(min_value=-100, max_value=100),
+    stop=hst.floats(min_value=-100, max_value=100),
+    step=hst.floats(min_value=0.01, max_value=10),
+)
+def test_ramp_values_match_permissive_range(start, stop, step) -> None:
+    expected = permissive_range(start, stop, step)[1:] + [stop]
+    assert ramp_values(start, stop, step) == expected
+
+
+def test_ramp_values_of_ints_are_ints() -> None:
+    values = ramp_values(0, 7, 2)
+    assert values == [2, 4, 6, 7]
+    assert all(type(value) is int for value in values)
+
+
+def test_stepping_validates_every_step_for_non_bounds_validators() -> None:
+    a = Parameter(
+        "test", set_cmd=None, vals=Multiples(divisor=2), step=3, initial_value=0
+    )
+    with pytest.raises(ValueError):
+        # 3 is not a multiple of 2 even though 6 is
+        a.set(6)
+    assert a.get() == 0
+
+
+def test_ramp_progress_and_abort() -> None:
+    progress: list[RampProgress | None] = []
+
+    def set_function(value):
+        progress.append(p.ramp_progress)
+        if value == 3:
+            p.abort_ramp()
+
+    p = Parameter("p", set_cmd=set_function, step=1)
+    p.cache.set(0)
+    assert p.ramp_progress is None
+
+    with pytest.raises(RampAbortedError, match="aborted at 3"):
+        p.set(5)
+    assert p.get() == 3
+    assert progress == [RampProgress(5, i, 5, i + 1) for i in range(3)]
+    assert p.ramp_progress is None
+
+    # aborting outside of a ramp does not affect the next set
+    p.abort_ramp()
+    p.set(4)
+    assert p.get() == 4
+
+
+def test_hardware_ramp() -> None:
+    p = MemoryParameter(name="p", scale=2, initial_value=0)
+    p.step = 0.1
+    hardware_values = []
+    p.hardware_ramp = hardware_values.append
+
+    p.set(5)
+    assert hardware_values == [10]
+    assert p.set_values == [0]
+    assert p.get_latest() == 5
+    assert p.raw_value == 10
+
+    # without a step the parameter is set directly
+    p.step = None
+    p.set(1)
+    assert hardware_values == [10]
+    assert p.set_values == [0, 2]
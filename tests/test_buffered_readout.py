@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from qcodes.instrument import BufferedReadout
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class FillingBuffer:
+    """
+    An instrument buffer that gains ``points_per_poll`` points each time its
+    fill level is queried.
+    """
+
+    def __init__(self, data: np.ndarray, points_per_poll: int):
+        self.data = data
+        self.points_per_poll = points_per_poll
+        self.n_filled = 0
+        self.fetches: list[tuple[int, int]] = []
+
+    def n_available(self) -> int:
+        self.n_filled = min(self.n_filled + self.points_per_poll, len(self.data))
+        return self.n_filled
+
+    def fetch(self, start: int, stop: int) -> np.ndarray:
+        assert stop <= self.n_filled
+        self.fetches.append((start, stop))
+        return self.data[start:stop]
+
+
+def test_read_in_chunks_while_filling() -> None:
+    buffer = FillingBuffer(np.arange(100.0), points_per_poll=25)
+    chunks = []
+    readout = BufferedReadout(
+        100,
+        n_available=buffer.n_available,
+        fetch=buffer.fetch,
+        chunk_size=10,
+        on_chunk=lambda chunk, start: chunks.append((start, chunk.copy())),
+        poll_interval=0,
+    )
+
+    data = readout.read()
+
+    assert readout.done
+    np.testing.assert_array_equal(data, np.arange(100.0))
+    assert all(stop - start <= 10 for start, stop in buffer.fetches)
+    # points are fetched as soon as they are in the buffer
+    assert buffer.fetches[:3] == [(0, 10), (10, 20), (20, 25)]
+    assert [start for start, _ in chunks] == [start for start, _ in buffer.fetches]
+    np.testing.assert_array_equal(
+        np.concatenate([chunk for _, chunk in chunks]), np.arange(100.0)
+    )
+
+
+def test_read_only_requested_points() -> None:
+    buffer = FillingBuffer(np.arange(100.0), points_per_poll=100)
+    readout = BufferedReadout(
+        30, n_available=buffer.n_available, fetch=buffer.fetch, chunk_size=50
+    )
+
+    np.testing.assert_array_equal(readout.read(), np.arange(30.0))
+    assert buffer.fetches == [(0, 30)]
+
+
+def test_read_points_with_shape() -> None:
+    values = np.arange(20.0).reshape(10, 2)
+    buffer = FillingBuffer(values, points_per_poll=3)
+    readout = BufferedReadout(
+        10,
+        n_available=buffer.n_available,
+        fetch=buffer.fetch,
+        chunk_size=4,
+        point_shape=(2,),
+        poll_interval=0,
+    )
+
+    np.testing.assert_array_equal(readout.read(), values)
+
+
+def test_read_available_does_not_wait() -> None:
+    buffer = FillingBuffer(np.arange(100.0), points_per_poll=25)
+    readout = BufferedReadout(
+        100, n_available=buffer.n_available, fetch=buffer.fetch, chunk_size=100
+    )
+
+    assert readout.read_available() == 25
+    assert readout.n_read == 25
+    assert not readout.done
+
+
+def test_timeout_and_resume() -> None:
+    buffer = FillingBuffer(np.arange(100.0), points_per_poll=0)
+    buffer.n_filled = 40
+    readout = BufferedReadout(
+        100,
+        n_available=buffer.n_available,
+        fetch=buffer.fetch,
+        chunk_size=100,
+        poll_interval=0,
+        timeout=0.01,
+    )
+
+    with pytest.raises(TimeoutError, match="Read 40 of 100 points"):
+        readout.read()
+    assert readout.n_read == 40
+
+    buffer.points_per_poll = 30
+    np.testing.assert_array_equal(readout.read(), np.arange(100.0))
+    assert buffer.fetches == [(0, 40), (40, 70), (70, 100)]
+
+
+def test_resume_after_failed_fetch() -> None:
+    buffer = FillingBuffer(np.arange(100.0), points_per_poll=100)
+    failures = [OSError("VI_ERROR_TMO")]
+
+    def fetch(start: int, stop: int) -> np.ndarray:
+        if start == 50 and failures:
+            raise failures.pop()
+        return buffer.fetch(start, stop)
+
+    readout = BufferedReadout(
+        100, n_available=buffer.n_available, fetch=fetch, chunk_size=25
+    )
+
+    with pytest.raises(OSError, match="VI_ERROR_TMO"):
+        readout.read()
+    assert readout.n_read == 50
+
+    np.testing.assert_array_equal(readout.read(), np.arange(100.0))
+    assert buffer.fetches == [(0, 25), (25, 50), (50, 75), (75, 100)]
+
+
+def test_transfer_context_is_entered_once_per_read() -> None:
+    buffer = FillingBuffer(np.arange(100.0), points_per_poll=25)
+    events = []
+
+    @contextmanager
+    def transfer_context() -> Iterator[None]:
+        events.append("enter")
+        yield
+        events.append("exit")
+
+    def fetch(start: int, stop: int) -> np.ndarray:
+        events.append("fetch")
+        return buffer.fetch(start, stop)
+
+    readout = BufferedReadout(
+        100,
+        n_available=buffer.n_available,
+        fetch=fetch,
+        chunk_size=10,
+        transfer_context=transfer_context,
+        poll_interval=0,
+    )
+
+    assert readout.read_available() == 25
+    assert events == ["enter", "fetch", "fetch", "fetch", "exit"]
+
+    events.clear()
+    readout.read()
+    assert events == ["enter", *["fetch"] * 9, "exit"]
+
+
+def test_wrong_number_of_points_fetched() -> None:
+    readout = BufferedReadout(
+        10, n_available=lambda: 10, fetch=lambda start, stop: [1.0], chunk_size=10
+    )
+
+    with pytest.raises(RuntimeError, match="Expected 10 points from index 0"):
+        readout.read()
+    assert readout.n_read == 0
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="negative number of points"):
+        BufferedReadout(-1, n_available=lambda: 0, fetch=np.arange, chunk_size=1)
+    with pytest.raises(ValueError, match="Chunk size must be at least 1"):
+        BufferedReadout(1, n_available=lambda: 0, fetch=np.arange, chunk_size=0)
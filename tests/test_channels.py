@@ -1,5 +1,7 @@
 import logging
+import time
 from collections.abc import Generator, Sequence
+from typing import ClassVar
 
 import hypothesis.strategies as hst
 import numpy as np
@@ -13,6 +15,7 @@ from qcodes.instrument_drivers.mock_instruments import (
     DummyChannel,
     DummyChannelInstrument,
 )
+from qcodes.validators import Numbers
 
 
 @pytest.fixture(scope='function', name='dci')
@@ -59,6 +62,91 @@ class EmptyChannel(InstrumentChannel):
     pass
 
 
+class BulkChannel(InstrumentChannel):
+    bulk_gets: ClassVar[list[tuple[str, ...]]] = []
+    bulk_sets: ClassVar[list[tuple[tuple[str, ...], list[float]]]] = []
+    raw_sets: ClassVar[list[tuple[str, float, float]]] = []
+
+    def __init__(self, parent: Instrument, name: str) -> None:
+        super().__init__(parent, name)
+        self.add_parameter(
+            "value",
+            get_cmd=None,
+            set_cmd=self._set_raw_value,
+            initial_value=0,
+            scale=2,
+            vals=Numbers(-10, 10),
+        )
+
+    def _set_raw_value(self, raw_value: float) -> None:
+        self.raw_sets.append((self.short_name, raw_value, time.perf_counter()))
+
+    @classmethod
+    def _bulk_get(cls, channels, param_name):
+        cls.bulk_gets.append(tuple(chan.short_name for chan in channels))
+        return [float(i) for i, _ in enumerate(channels)]
+
+    @classmethod
+    def _bulk_set(cls, channels, param_name, raw_values):
+        cls.bulk_sets.append(
+            (tuple(chan.short_name for chan in channels), list(raw_values))
+        )
+        return True
+
+
+def test_channels_bulk_get_and_set(empty_instrument: Instrument) -> None:
+    channels = ChannelList(empty_instrument, "Bulk", BulkChannel)
+    for chan_name in ("A", "B", "C"):
+        channels.append(BulkChannel(empty_instrument, chan_name))
+    BulkChannel.bulk_gets.clear()
+    BulkChannel.bulk_sets.clear()
+
+    assert channels.value() == (0.0, 1.0, 2.0)
+    assert BulkChannel.bulk_gets == [("A", "B", "C")]
+    # the cache of each channel is updated
+    assert channels[2].value.get_latest() == 2.0
+
+    # the hook receives the validated raw values
+    channels.to_channel_tuple()[1:].value(5)
+    assert BulkChannel.bulk_sets == [(("B", "C"), [10, 10])]
+    assert [chan.value.get_latest() for chan in channels] == [0.0, 5, 5]
+    assert channels[1].value.cache.raw_value == 10
+
+    with pytest.raises(ValueError):
+        channels.value(20)
+    assert len(BulkChannel.bulk_sets) == 1
+    assert [chan.value.get_latest() for chan in channels] == [0.0, 5, 5]
+
+
+def test_channels_bulk_set_respects_ramps(empty_instrument: Instrument) -> None:
+    channels = ChannelList(empty_instrument, "Bulk", BulkChannel)
+    for chan_name in ("A", "B"):
+        channel = BulkChannel(empty_instrument, chan_name)
+        channel.value.step = 1
+        channel.value.inter_delay = 0.01
+        channels.append(channel)
+    BulkChannel.bulk_sets.clear()
+    BulkChannel.raw_sets.clear()
+
+    channels.value(3)
+
+    # each channel is ramped in steps instead of being set at once
+    assert BulkChannel.bulk_sets == []
+    assert [(name, raw_value) for name, raw_value, _ in BulkChannel.raw_sets] == [
+        ("A", 2),
+        ("A", 4),
+        ("A", 6),
+        ("B", 2),
+        ("B", 4),
+        ("B", 6),
+    ]
+    raw_sets = BulkChannel.raw_sets
+    for (name, _, t_set), (next_name, _, t_next_set) in zip(raw_sets, raw_sets[1:]):
+        if name == next_name:
+            assert t_next_set - t_set >= 0.01
+    assert [chan.value.get_latest() for chan in channels] == [3, 3]
+
+
 def test_instrument_channel_label() -> None:
     dci = DummyChannelInstrument(name="dci_with_labels", label="Instrument Label")
     channel = DummyChannel(dci, "A_with_label", "A_wl", label="A with f@ncy label")
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from qcodes.instrument.ieee_block import (
+    parse_block_header,
+    parse_ieee_block,
+    struct_format,
+)
+
+
+def _make_block(values: np.ndarray) -> bytes:
+    data = values.tobytes()
+    length = str(len(data)).encode()
+    return b"#" + str(len(length)).encode() + length + data
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int16, np.uint8])
+@pytest.mark.parametrize("is_big_endian", [True, False])
+def test_parse_definite_block(dtype, is_big_endian) -> None:
+    byteorder = ">" if is_big_endian else "<"
+    values = np.arange(123).astype(np.dtype(dtype).newbyteorder(byteorder))
+    block = _make_block(values) + b"\n"
+
+    parsed = parse_ieee_block(block, dtype=dtype, is_big_endian=is_big_endian)
+
+    np.testing.assert_array_equal(parsed, np.arange(123))
+
+
+def test_parse_indefinite_block() -> None:
+    values = np.array([1.5, -2.5], dtype="<f8")
+    parsed = parse_ieee_block(b"#0" + values.tobytes(), dtype=np.float64)
+    np.testing.assert_array_equal(parsed, values)
+
+
+def test_parse_block_skips_leading_bytes() -> None:
+    values = np.array([1, 2, 3], dtype="<i4")
+    block = b"CURV " + _make_block(values)
+    np.testing.assert_array_equal(parse_ieee_block(block, dtype=np.int32), values)
+
+
+def test_parse_block_header() -> None:
+    assert parse_block_header(b"#3100abc") == (5, 100)
+    assert parse_block_header(b"#0abc") == (2, None)
+
+
+@pytest.mark.parametrize(
+    "block", [b"1,2,3", b"#", b"#a12", b"#312", b"#14abc", b"#13abc"]
+)
+def test_parse_invalid_block_raises(block) -> None:
+    with pytest.raises(ValueError):
+        parse_ieee_block(block, dtype=np.int16)
+
+
+def test_struct_format() -> None:
+    assert struct_format(np.float32) == "f"
+    assert struct_format("f8") == "d"
+    assert struct_format(np.int16) == "h"
+    assert struct_format(np.uint32) == "I"
+    with pytest.raises(ValueError, match="Cannot transfer values"):
+        struct_format(np.complex64)
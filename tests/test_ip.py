@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from qcodes.instrument import IPInstrument
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+
+class _SocketServer:
+    """
+    A minimal instrument that answers each received line with the result
+    of ``respond`` on a local socket.
+    """
+
+    def __init__(self, respond: Callable[[bytes], bytes]):
+        self._respond = respond
+        self._server = socket.create_server(("127.0.0.1", 0))
+        self.port = self._server.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        conn, _ = self._server.accept()
+        with conn:
+            buffer = b""
+            while True:
+                data = conn.recv(4096)
+                if not data:
+                    return
+                buffer += data
+                while b"\n" in buffer:
+                    line, buffer = buffer.split(b"\n", 1)
+                    response = self._respond(line)
+                    # send in small chunks to exercise repeated reads
+                    for i in range(0, len(response), 1000):
+                        conn.sendall(response[i : i + 1000])
+
+    def close(self) -> None:
+        self._server.close()
+        self._thread.join(timeout=5)
+
+
+def _respond(cmd: bytes) -> bytes:
+    if cmd == b"TRACE?":
+        data = np.arange(10_000, dtype=">f4").tobytes()
+        length = str(len(data)).encode()
+        return b"#" + str(len(length)).encode() + length + data + b"\n"
+    if cmd == b"TRACE:INDEF?":
+        return b"#0" + np.array([1, 2, 3], dtype="<i2").tobytes() + b"\n"
+    if cmd == b"CSV?":
+        return b",".join(b"%d" % i for i in range(50_000)) + b"\n"
+    if cmd == b"TWO?":
+        return b"first\nsecond\n"
+    if not cmd.endswith(b"?"):
+        # commands get no response
+        return b""
+    return cmd + b"\n"
+
+
+@pytest.fixture(name="ip_instrument", params=[None, "\n"])
+def _make_ip_instrument(request) -> Generator[IPInstrument, None, None]:
+    server = _SocketServer(_respond)
+    instr = IPInstrument(
+        "ip_instrument",
+        address="127.0.0.1",
+        port=server.port,
+        write_confirmation=False,
+        read_terminator=request.param,
+    )
+    try:
+        yield instr
+    finally:
+        instr.close()
+        server.close()
+
+
+def test_ask_binary_definite_block(ip_instrument) -> None:
+    data = ip_instrument.ask_binary("TRACE?", dtype=np.float32, is_big_endian=True)
+    np.testing.assert_array_equal(data, np.arange(10_000))
+    # the terminator after the block has been consumed
+    assert ip_instrument.ask("*IDN?").rstrip() == "*IDN?"
+
+
+def test_ask_binary_indefinite_block(ip_instrument) -> None:
+    data = ip_instrument.ask_binary("TRACE:INDEF?", dtype=np.int16)
+    np.testing.assert_array_equal(data, [1, 2, 3])
+    assert ip_instrument.ask("*IDN?").rstrip() == "*IDN?"
+
+
+@pytest.mark.asyncio
+async def test_ask_async(ip_instrument) -> None:
+    responses = await asyncio.gather(
+        ip_instrument.ask_async("FIRST?"), ip_instrument.ask_async("SECOND?")
+    )
+    assert [response.rstrip() for response in responses] == ["FIRST?", "SECOND?"]
+    await ip_instrument.write_async("*RST")
+    assert ip_instrument.ask("*IDN?").rstrip() == "*IDN?"
+
+
+@pytest.fixture(name="framed_ip_instrument")
+def _make_framed_ip_instrument() -> Generator[IPInstrument, None, None]:
+    server = _SocketServer(_respond)
+    instr = IPInstrument(
+        "framed_ip_instrument",
+        address="127.0.0.1",
+        port=server.port,
+        write_confirmation=False,
+        read_terminator="\n",
+        tcp_nodelay=True,
+        keep_alive=True,
+    )
+    try:
+        yield instr
+    finally:
+        instr.close()
+        server.close()
+
+
+def test_large_response_is_read_in_one_call(framed_ip_instrument) -> None:
+    response = framed_ip_instrument.ask("CSV?")
+    assert response == ",".join(str(i) for i in range(50_000))
+
+
+def test_responses_received_together_are_split(framed_ip_instrument) -> None:
+    assert framed_ip_instrument.ask("TWO?") == "first"
+    # the second response was already received with the first one
+    assert framed_ip_instrument._recv() == "second"
+    assert framed_ip_instrument.ask("*IDN?") == "*IDN?"
+
+
+def test_socket_options(framed_ip_instrument) -> None:
+    sock = framed_ip_instrument._socket
+    assert sock is not None
+    assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+    assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+
+    framed_ip_instrument.set_socket_options(tcp_nodelay=False)
+    assert not sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+    assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+
+    snapshot = framed_ip_instrument.snapshot()
+    assert snapshot["read_terminator"] == "\n"
+    assert snapshot["tcp_nodelay"] is False
+    assert snapshot["keep_alive"] is True
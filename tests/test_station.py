@@ -154,6 +154,45 @@ def test_close_all_registered_instruments() -> None:
         assert name not in Instrument._all_instruments
 
 
+def test_io_stats_report() -> None:
+    bob = DummyInstrument("bob", gates=["one"])
+    chan_instr = DummyChannelInstrument("chan_instr")
+    station = Station(bob, chan_instr)
+    station.enable_io_stats()
+
+    for _ in range(3):
+        bob.one(1)
+        bob.one()
+    chan_instr.A.dummy_start(2)
+
+    assert bob.io_stats()["get bob_one"]["count"] == 3
+    assert bob.io_stats()["set bob_one"]["count"] == 3
+    assert chan_instr.io_stats()["set chan_instr_ChanA_dummy_start"]["count"] == 1
+
+    report = station.io_stats_report().splitlines()
+    assert report[0].split() == [
+        "instrument",
+        "operation",
+        "count",
+        "total",
+        "mean",
+        "p50",
+        "p90",
+        "p99",
+        "max",
+    ]
+    assert len(report) == 4
+    assert report[1].split()[0] in ("bob", "chan_instr")
+    assert len(station.io_stats_report(limit=1).splitlines()) == 2
+
+    bob.disable_io_stats()
+    assert bob.io_stats() == {}
+    assert all(
+        line.split()[0] == "chan_instr"
+        for line in station.io_stats_report().splitlines()[1:]
+    )
+
+
 def test_snapshot() -> None:
     station = Station()
 
@@ -868,6 +907,120 @@ def test_load_all_instruments_without_config_raises() -> None:
         station.load_all_instruments()  # type: ignore[call-overload]
 
 
+@pytest.fixture(name="dependent_station")
+def _make_dependent_station():
+    sims_path = get_qcodes_path("instrument", "sims")
+    test_config = f"""
+instruments:
+  lakeshore:
+    type: qcodes.instrument_drivers.Lakeshore.Model_336.Model_336
+    address: GPIB::2::INSTR
+    init:
+      visalib: '{sims_path}lakeshore_model336.yaml@sim'
+  lakeshore_372:
+    type: qcodes.instrument_drivers.Lakeshore.Model_372.Model_372
+    address: GPIB::3::INSTR
+    depends_on: [lakeshore]
+    init:
+      visalib: '{sims_path}lakeshore_model372.yaml@sim'
+  mock_dac:
+    type: qcodes.instrument_drivers.mock_instruments.DummyInstrument
+    init:
+      gates: ["ch1", "ch2"]
+  gates:
+    type: qcodes.instrument.delegate.DelegateInstrument
+    init:
+      parameters:
+        gate: mock_dac.ch1
+    """
+    with config_file_context(test_config) as filename:
+        yield Station(config_file=filename)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_load_all_instruments_respects_dependencies(
+    dependent_station: Station, parallel: bool
+) -> None:
+    loaded_instruments = dependent_station.load_all_instruments(parallel=parallel)
+
+    assert set(loaded_instruments) == {
+        "lakeshore",
+        "lakeshore_372",
+        "mock_dac",
+        "gates",
+    }
+    assert loaded_instruments.index("lakeshore") < loaded_instruments.index(
+        "lakeshore_372"
+    )
+    assert loaded_instruments.index("mock_dac") < loaded_instruments.index("gates")
+    for instrument in loaded_instruments:
+        assert instrument in dependent_station.components
+        assert dependent_station.instrument_load_times[instrument] >= 0
+
+    gates = dependent_station.components["gates"]
+    dependent_station.components["mock_dac"].ch1(0.5)
+    assert gates.gate() == 0.5
+
+
+def test_load_all_instruments_in_parallel_raises_on_error() -> None:
+    st = station_from_config_str(
+        """
+instruments:
+  broken:
+    type: qcodes.instrument_drivers.mock_instruments.DummyInstrument
+    init:
+      not_an_argument: 1
+  mock_dac:
+    type: qcodes.instrument_drivers.mock_instruments.DummyInstrument
+    depends_on: [broken]
+        """
+    )
+
+    with pytest.raises(TypeError, match="not_an_argument"):
+        st.load_all_instruments(parallel=True)
+    assert "broken" not in st.components
+    # instruments depending on the failed instrument are not loaded
+    assert "mock_dac" not in st.components
+    assert not Instrument.exist("mock_dac")
+
+
+def test_load_all_instruments_raises_on_cyclic_dependencies() -> None:
+    st = station_from_config_str(
+        """
+instruments:
+  mock_dac:
+    type: qcodes.instrument_drivers.mock_instruments.DummyInstrument
+    depends_on: [mock_dac2]
+  mock_dac2:
+    type: qcodes.instrument_drivers.mock_instruments.DummyInstrument
+    depends_on: [mock_dac]
+        """
+    )
+    with pytest.raises(RuntimeError, match="cyclic dependencies"):
+        st.load_all_instruments()
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_load_all_instruments_ignores_names_in_init_strings(parallel: bool) -> None:
+    st = station_from_config_str(
+        """
+instruments:
+  mock_dac:
+    type: qcodes.instrument_drivers.mock_instruments.DummyInstrument
+    init:
+      label: mock_dac2.dac1
+  mock_dac2:
+    type: qcodes.instrument_drivers.mock_instruments.DummyInstrument
+    init:
+      label: mock_dac.dac1
+        """
+    )
+    assert set(st.load_all_instruments(parallel=parallel)) == {
+        "mock_dac",
+        "mock_dac2",
+    }
+
+
 def test_station_config_created_with_multiple_config_files() -> None:
     test_config1 = """
         instruments:
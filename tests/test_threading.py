@@ -1,6 +1,7 @@
 """
 Test suite for utils.threading.*
 """
+import asyncio
 import threading
 import time
 from collections import defaultdict
@@ -8,7 +9,13 @@ from typing import Any
 
 import pytest
 
-from qcodes.dataset.threading import ThreadPoolParamsCaller, call_params_threaded
+from qcodes.dataset.threading import (
+    AsyncParamsCaller,
+    InstrumentIOExecutor,
+    ThreadPoolParamsCaller,
+    call_params_threaded,
+    get_instrument_io_executor,
+)
 from qcodes.instrument_drivers.mock_instruments import DummyInstrument
 from qcodes.parameters import Parameter, ParamRawDataType
 
@@ -103,3 +110,143 @@ def test_thread_pool_params_caller(dummy_1, dummy_2) -> None:
         assert {
             frozenset(value) for value in params_per_thread_id.values()
         } == expected_params_per_thread
+
+
+def test_call_params_threaded_reuses_threads(dummy_1, dummy_2) -> None:
+    params = (dummy_1.voltage_1, dummy_2.voltage_1)
+
+    thread_ids_1 = {thread_id for _, thread_id in call_params_threaded(params)}
+    thread_ids_2 = {thread_id for _, thread_id in call_params_threaded(params)}
+
+    assert len(thread_ids_1) == 2
+    assert thread_ids_1 == thread_ids_2
+    assert threading.get_ident() not in thread_ids_1
+    histograms = get_instrument_io_executor().latency_histograms()
+    assert histograms["dummy_1"].count >= 2
+    assert histograms["dummy_1"].min >= 0.1
+
+
+def test_instrument_io_executor_orders_calls_per_instrument(dummy_1, dummy_2) -> None:
+    executor = InstrumentIOExecutor()
+    calls = []
+
+    def slow_call(name: str, value: int) -> int:
+        time.sleep(0.01)
+        calls.append((name, value))
+        return value
+
+    try:
+        futures = [
+            executor.submit(name, slow_call, name, value)
+            for value in range(5)
+            for name in ("dummy_1", "dummy_2")
+        ]
+        assert [future.result() for future in futures] == [
+            value for value in range(5) for _ in range(2)
+        ]
+        for name in ("dummy_1", "dummy_2"):
+            assert [value for call_name, value in calls if call_name == name] == list(
+                range(5)
+            )
+        assert set(executor.latency_histograms()) == {"dummy_1", "dummy_2"}
+        assert executor.latency_histograms()["dummy_1"].count == 5
+    finally:
+        executor.shutdown()
+
+    with pytest.raises(RuntimeError, match="after shutdown"):
+        executor.submit("dummy_3", slow_call, "dummy_3", 0)
+
+
+def test_instrument_io_executor_get_set(dummy_1) -> None:
+    executor = InstrumentIOExecutor()
+    try:
+        executor.submit_set(dummy_1.ch1, 3.0).result()
+        assert executor.submit_get(dummy_1.ch1).result() == 3.0
+        thread_id = executor.submit_get(dummy_1.voltage_1).result()
+        assert thread_id != threading.get_ident()
+
+        # a call on a worker that calls the same instrument
+        # must not deadlock waiting for itself.
+        nested = executor.submit(
+            "dummy_1", lambda: executor.submit_get(dummy_1.ch1).result(timeout=1)
+        )
+        assert nested.result(timeout=2) == 3.0
+
+        def raise_error() -> None:
+            raise ValueError("Failed in worker")
+
+        with pytest.raises(ValueError, match="Failed in worker"):
+            executor.submit("dummy_1", raise_error).result()
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_get_set_async(dummy_1, dummy_2) -> None:
+    await dummy_1.ch1.set_async(2.0)
+    assert await dummy_1.ch1.get_async() == 2.0
+
+    t_start = time.perf_counter()
+    thread_ids = await asyncio.gather(
+        dummy_1.voltage_1.get_async(), dummy_2.voltage_1.get_async()
+    )
+    # the parameters of different instruments are gotten concurrently
+    assert time.perf_counter() - t_start < 0.19
+    assert len(set(thread_ids)) == 2
+    assert threading.get_ident() not in thread_ids
+
+
+def test_async_params_caller(dummy_1, dummy_2) -> None:
+    params = (
+        dummy_1.voltage_1,
+        dummy_1.voltage_2,
+        dummy_2.voltage_1,
+        dummy_2.voltage_2,
+    )
+
+    with AsyncParamsCaller(*params, lambda: None) as async_caller:
+        output = async_caller()
+
+    assert [param for param, _ in output] == list(params)
+    thread_ids = {param: thread_id for param, thread_id in output}
+    assert thread_ids[dummy_1.voltage_1] == thread_ids[dummy_1.voltage_2]
+    assert thread_ids[dummy_2.voltage_1] == thread_ids[dummy_2.voltage_2]
+    assert thread_ids[dummy_1.voltage_1] != thread_ids[dummy_2.voltage_1]
+
+    with pytest.raises(RuntimeError, match="must be entered"):
+        async_caller()
+
+
+@pytest.mark.asyncio
+async def test_closing_instrument_releases_io_worker() -> None:
+    executor = get_instrument_io_executor()
+    instrument = DummyInstrument(name="dummy_released", gates=["ch1"])
+    try:
+        await instrument.ch1.get_async()
+        (worker_thread,) = (
+            thread
+            for thread in threading.enumerate()
+            if thread.name.endswith(":dummy_released")
+        )
+        assert "dummy_released" in executor.latency_histograms()
+    finally:
+        instrument.close()
+
+    assert not worker_thread.is_alive()
+    assert "dummy_released" not in executor.latency_histograms()
+
+
+@pytest.mark.asyncio
+async def test_closing_stale_instrument_keeps_io_worker_of_same_name() -> None:
+    stale = DummyInstrument(name="dummy_reused", gates=["ch1"])
+    stale.close()
+    instrument = DummyInstrument(name="dummy_reused", gates=["ch1"])
+    try:
+        await instrument.ch1.get_async()
+        # closing the old instance again, as happens when it is garbage
+        # collected, does not stop the worker of the new instrument
+        stale.close()
+        assert "dummy_reused" in get_instrument_io_executor().latency_histograms()
+        await asyncio.wait_for(instrument.ch1.get_async(), timeout=1)
+    finally:
+        instrument.close()
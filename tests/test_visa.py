@@ -1,15 +1,20 @@
 import gc
 import logging
 import re
+import threading
 from pathlib import Path
 
+import numpy as np
 import pytest
 import pyvisa
 import pyvisa.constants
 from pytest import FixtureRequest
 
-from qcodes.instrument import Instrument, VisaInstrument
+from qcodes.instrument import ChannelList, Instrument, InstrumentChannel, VisaInstrument
+from qcodes.instrument.visa import _RESOURCE_MANAGER_POOL
 from qcodes.instrument_drivers.american_magnetics import AMIModel430
+from qcodes.logger import IOTrace, ResponseSummary
+from qcodes.parameters import Group, GroupParameter
 from qcodes.validators import Numbers
 
 
@@ -171,6 +176,96 @@ def test_ask_write_local(mock_visa) -> None:
         assert arg in str(eee.value)
 
 
+def test_io_trace(mock_visa, caplog) -> None:
+    assert mock_visa.io_trace is None
+    io_trace = mock_visa.enable_io_trace(maxlen=3)
+    assert mock_visa.io_trace is io_trace
+
+    mock_visa.state.set(2)
+    assert mock_visa.state.get() == 2
+    entries = io_trace.entries()
+    assert [(e.operation, e.command, e.response) for e in entries] == [
+        ("write", "STAT:2.000", None),
+        ("ask", "STAT?", 2),
+    ]
+    assert all(e.duration >= 0 and e.error is None for e in entries)
+
+    mock_visa.state.set(15)
+    with caplog.at_level(logging.WARNING):
+        with pytest.raises(ValueError) as e:
+            mock_visa.state.get()
+    for arg in args3:
+        assert arg in str(e.value)
+    # the ring buffer only keeps the last 3 operations
+    assert len(io_trace) == 3
+    last = io_trace.entries()[-1]
+    assert last.command == "STAT?"
+    assert isinstance(last.error, ValueError)
+    assert "I/O trace up to error in ask of 'STAT?'" in caplog.text
+    assert "write 'STAT:15.000'" in caplog.text
+    assert "!! ValueError" in caplog.text
+
+    mock_visa.disable_io_trace()
+    assert mock_visa.io_trace is None
+    mock_visa.state.set(3)
+    assert len(io_trace) == 3
+
+
+def test_io_trace_summarizes_large_responses() -> None:
+    io_trace = IOTrace()
+    io_trace.record("ask_binary", "TRACE?", np.zeros(100_000), 0.0, 1.0)
+    io_trace.record("ask", "DATA?", "1," * 1000, 1.0, 2.0)
+    io_trace.record("ask", "IDN?", "QCoDeS,mock,1,0", 2.0, 3.0)
+
+    array_entry, long_entry, short_entry = io_trace.entries()
+    assert array_entry.response == ResponseSummary(
+        "ndarray shape=(100000,) dtype=float64"
+    )
+    assert isinstance(long_entry.response, ResponseSummary)
+    assert long_entry.response.description.startswith("str of length 2000: '1,1,")
+    assert short_entry.response == "QCoDeS,mock,1,0"
+    assert "ask_binary 'TRACE?' -> <ndarray shape=(100000,)" in io_trace.format()
+
+
+def test_io_stats(mock_visa) -> None:
+    assert mock_visa.io_stats() == {}
+    untimed_set = mock_visa.state.set
+    io_stats = mock_visa.enable_io_stats()
+    assert mock_visa.state.set is not untimed_set
+
+    mock_visa.state.set(2)
+    mock_visa.state.set(3)
+    assert mock_visa.state.get() == 3
+    mock_visa.write("STAT :4")
+    mock_visa.state.set(15)
+    with pytest.raises(ValueError):
+        mock_visa.state.get()
+
+    stats = mock_visa.io_stats()
+    assert set(stats) == {
+        "write STAT:2.000",
+        "write STAT:3.000",
+        "write STAT:15.000",
+        "write STAT",
+        "ask STAT?",
+        "set Joe_state",
+        "get Joe_state",
+    }
+    assert stats["set Joe_state"]["count"] == 3
+    # failed operations are counted too
+    assert stats["ask STAT?"]["count"] == 2
+    assert stats["get Joe_state"]["count"] == 2
+    assert stats["get Joe_state"]["total"] >= stats["ask STAT?"]["total"]
+    assert "Joe" in io_stats.report()
+
+    mock_visa.disable_io_stats()
+    # parameters are not timed while statistics are disabled
+    assert mock_visa.state.set is untimed_set
+    mock_visa.state.set(3)
+    assert mock_visa.io_stats() == {}
+    assert io_stats.histograms()["set Joe_state"].count == 3
+
+
 def test_visa_backend(mocker, request: FixtureRequest) -> None:
 
     rm_mock = mocker.patch("qcodes.instrument.visa.pyvisa.ResourceManager")
@@ -292,3 +387,283 @@ def test_load_pyvisa_sim_file_invalid_module_raises(request: FixtureRequest) ->
             address="GPIB::1::INSTR",
             pyvisa_sim_file="qcodes.instrument.not_a_module:AimTTi_PL601P.yaml",
         )
+
+
+def test_resource_manager_is_shared(mocker) -> None:
+    drivers = [
+        VisaInstrument(
+            f"shared_rm_{i}",
+            address="GPIB::8::INSTR",
+            pyvisa_sim_file="dummy.yaml",
+            device_clear=False,
+        )
+        for i in range(2)
+    ]
+    visalib = drivers[0].visalib
+    try:
+        assert drivers[0].resource_manager is drivers[1].resource_manager
+        assert _RESOURCE_MANAGER_POOL.ref_count(visalib) == 2
+
+        # reopening the resource keeps a single reference
+        drivers[0].set_address("GPIB::8::INSTR")
+        assert _RESOURCE_MANAGER_POOL.ref_count(visalib) == 2
+
+        reset = mocker.spy(drivers[0].resource_manager.visalib, "_init")
+        drivers[0].close()
+        assert _RESOURCE_MANAGER_POOL.ref_count(visalib) == 1
+        reset.assert_not_called()
+    finally:
+        drivers[1].close()
+    assert _RESOURCE_MANAGER_POOL.ref_count(visalib) == 0
+    # the simulated instrument state is reset when the last user is closed
+    reset.assert_called_once()
+
+
+def test_ask_binary_from_pyvisa_sim(request: FixtureRequest) -> None:
+    driver = VisaInstrument(
+        "binary_dummy",
+        address="GPIB::8::INSTR",
+        pyvisa_sim_file="dummy.yaml",
+        terminator="\n",
+        device_clear=False,
+    )
+    request.addfinalizer(driver.close)
+
+    data = driver.ask_binary("TRACE?", dtype=np.int16)
+    assert data.dtype == np.dtype("<i2")
+    np.testing.assert_array_equal(data, [1, 2, 3])
+
+    big_endian_data = driver.ask_binary("TRACE?", dtype=np.int16, is_big_endian=True)
+    np.testing.assert_array_equal(big_endian_data, [256, 512, 768])
+
+
+def test_ask_binary_error_context(mock_visa) -> None:
+    with pytest.raises(ValueError) as e:
+        mock_visa.ask_binary("TRACE?", dtype=np.complex64)
+    assert "asking 'TRACE?' to <MockVisa: Joe>" in str(e.value)
+
+
+class MockBatchVisaHandle(MockVisaHandle):
+    """
+    Mock handle for an instrument that accepts program messages with
+    multiple commands and queries separated by ``;``.
+    """
+
+    timeout = 5000
+    read_termination = None
+    write_termination = None
+
+    def __init__(self):
+        super().__init__()
+        self.values = {"*IDN": "QCoDeS,batch,1,0.1", "A": "1", "B": "2", "GRP": "3,4"}
+        self.messages: list[str] = []
+
+    def _execute(self, message: str) -> list[str]:
+        self.messages.append(message)
+        responses = []
+        for unit in message.split(";"):
+            unit = unit.lstrip(":")
+            if unit.endswith("?"):
+                responses.append(self.values[unit[:-1]])
+            else:
+                header, value = unit.split(" ")
+                self.values[header] = value
+        return responses
+
+    def write(self, cmd):
+        self._execute(cmd)
+        return len(cmd)
+
+    def query(self, cmd):
+        return ";".join(self._execute(cmd))
+
+
+class MockBatchVisa(VisaInstrument):
+    supports_batched_queries = True
+    batch_max_message_length = 16
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.add_parameter("a", get_cmd="A?", set_cmd="A {}", get_parser=int)
+        self.add_parameter("b", get_cmd="B?", set_cmd="B {}", get_parser=int)
+        self.add_parameter("c", parameter_class=GroupParameter, get_parser=int)
+        self.add_parameter("d", parameter_class=GroupParameter, get_parser=int)
+        self.group = Group([self.c, self.d], get_cmd="GRP?", set_cmd="GRP {c},{d}")
+
+    def _open_resource(self, address: str, visalib):
+        return MockBatchVisaHandle(), visalib, pyvisa.ResourceManager("@sim")
+
+
+@pytest.fixture(name="mock_batch_visa")
+def _make_mock_batch_visa():
+    mv = MockBatchVisa("batch_visa", "none_address")
+    try:
+        yield mv
+    finally:
+        mv.close()
+
+
+def test_batch_queues_writes_until_query(mock_batch_visa) -> None:
+    handle = mock_batch_visa.visa_handle
+    with mock_batch_visa.batch():
+        mock_batch_visa.a(5)
+        mock_batch_visa.b(6)
+        assert handle.messages == []
+        assert mock_batch_visa.a() == 5
+    assert handle.messages == ["A 5;:B 6;:A?"]
+
+
+def test_batch_channel_parameters(mock_batch_visa) -> None:
+    class BatchChannel(InstrumentChannel):
+        def __init__(self, parent, name):
+            super().__init__(parent, name)
+            self.add_parameter(
+                "value", get_cmd=f"{name}?", set_cmd=f"{name} {{}}", get_parser=int
+            )
+
+    channels = ChannelList(mock_batch_visa, "channels", BatchChannel)
+    for name in ("A", "B"):
+        channels.append(BatchChannel(mock_batch_visa, name))
+
+    handle = mock_batch_visa.visa_handle
+    handle.messages.clear()
+    assert channels.value() == (1, 2)
+    channels.value(7)
+    assert handle.messages == ["A?;:B?", "A 7;:B 7"]
+
+
+def test_batch_splits_long_messages(mock_batch_visa) -> None:
+    handle = mock_batch_visa.visa_handle
+    with mock_batch_visa.batch():
+        for value in range(4):
+            mock_batch_visa.a(value)
+    assert handle.messages == ["A 0;:A 1;:A 2", "A 3"]
+    assert mock_batch_visa.a() == 3
+
+
+def test_batch_prefetch(mock_batch_visa) -> None:
+    handle = mock_batch_visa.visa_handle
+    params = [mock_batch_visa.a, mock_batch_visa.b, mock_batch_visa.c]
+    with mock_batch_visa.batch() as batch:
+        batch.prefetch(params)
+        assert handle.messages == ["A?;:B?;:GRP?"]
+        assert [param() for param in params] == [1, 2, 3]
+        assert mock_batch_visa.d.cache() == 4
+        # prefetched responses are only used once
+        assert mock_batch_visa.a() == 1
+    assert handle.messages == ["A?;:B?;:GRP?", "A?"]
+
+
+def test_batch_prefetch_is_discarded_after_write(mock_batch_visa) -> None:
+    handle = mock_batch_visa.visa_handle
+    with mock_batch_visa.batch() as batch:
+        batch.prefetch([mock_batch_visa.a])
+        mock_batch_visa.a(7)
+        assert mock_batch_visa.a() == 7
+    assert handle.messages == ["A?", "A 7;:A?"]
+
+
+def test_snapshot_uses_batched_queries(mock_batch_visa) -> None:
+    handle = mock_batch_visa.visa_handle
+    snapshot = mock_batch_visa.snapshot(update=True)
+    # the IDN parameter is not gotten with a fixed command so it is not batched
+    # and the group is queried once for both of its parameters
+    assert handle.messages == ["A?;:B?;:GRP?", "*IDN?"]
+    values = {name: snap["value"] for name, snap in snapshot["parameters"].items()}
+    assert values["a"] == 1
+    assert values["b"] == 2
+    assert values["c"] == 3
+    assert values["d"] == 4
+
+
+def test_batch_prefetch_sends_group_query_once(mock_batch_visa) -> None:
+    handle = mock_batch_visa.visa_handle
+    with mock_batch_visa.batch() as batch:
+        batch.prefetch([mock_batch_visa.c, mock_batch_visa.d])
+        assert handle.messages == ["GRP?"]
+        assert mock_batch_visa.c() == 3
+        assert mock_batch_visa.d() == 4
+        batch.discard_prefetched()
+        handle.values["GRP"] = "5,6"
+        # no responses are left over to answer later queries
+        assert mock_batch_visa.c() == 5
+    assert handle.messages == ["GRP?", "GRP?"]
+
+
+def test_batch_group_parameters_share_query(mock_batch_visa) -> None:
+    handle = mock_batch_visa.visa_handle
+    with mock_batch_visa.batch():
+        assert mock_batch_visa.c() == 3
+        assert mock_batch_visa.d() == 4
+        mock_batch_visa.c(5)
+        assert mock_batch_visa.d() == 4
+    assert handle.messages == ["GRP?", "GRP 5,4;:GRP?"]
+
+
+class GroupChannel(InstrumentChannel):
+    """A channel with a group of parameters."""
+
+    def __init__(self, parent, name, **kwargs):
+        super().__init__(parent, name, **kwargs)
+        self.add_parameter("c", parameter_class=GroupParameter, get_parser=int)
+        self.add_parameter("d", parameter_class=GroupParameter, get_parser=int)
+        self.group = Group([self.c, self.d], get_cmd="GRP?", set_cmd="GRP {c},{d}")
+
+
+def test_batch_group_parameters_on_channel_share_query(mock_batch_visa) -> None:
+    channel = GroupChannel(mock_batch_visa, "channel")
+    mock_batch_visa.add_submodule("channel", channel)
+    handle = mock_batch_visa.visa_handle
+    with mock_batch_visa.batch():
+        assert channel.c() == 3
+        assert channel.d() == 4
+    assert handle.messages == ["GRP?"]
+
+
+def test_batch_is_local_to_thread(mock_batch_visa) -> None:
+    handle = mock_batch_visa.visa_handle
+    with mock_batch_visa.batch():
+        mock_batch_visa.a(5)
+        thread = threading.Thread(target=mock_batch_visa.b, args=(6,))
+        thread.start()
+        thread.join()
+        # the write from the other thread is not queued in this batch
+        assert handle.messages == ["B 6"]
+    assert handle.messages == ["B 6", "A 5"]
+
+
+class SelectingChannel(InstrumentChannel):
+    """A channel that selects itself before every command."""
+
+    def __init__(self, parent, name, **kwargs):
+        super().__init__(parent, name, **kwargs)
+        self.add_parameter("a", get_cmd="A?", get_parser=int)
+
+    def ask(self, cmd: str) -> str:
+        self.write(f"SEL {self.short_name}")
+        return super().ask(cmd)
+
+
+def test_batch_prefetch_skips_modules_overriding_ask(mock_batch_visa) -> None:
+    handle = mock_batch_visa.visa_handle
+    channel = SelectingChannel(mock_batch_visa, "ch1")
+    mock_batch_visa.add_submodule("ch1", channel)
+    with mock_batch_visa.batch() as batch:
+        batch.prefetch([channel.a, mock_batch_visa.b])
+        assert handle.messages == ["B?"]
+        assert channel.a() == 1
+    assert handle.messages == ["B?", "SEL ch1;:A?"]
+
+
+def test_batch_messages_are_traced(mock_batch_visa) -> None:
+    io_trace = mock_batch_visa.enable_io_trace()
+    with mock_batch_visa.batch() as batch:
+        batch.prefetch([mock_batch_visa.a, mock_batch_visa.b])
+        mock_batch_visa.a()
+        mock_batch_visa.a(5)
+    assert [(e.operation, e.command, e.response) for e in io_trace.entries()] == [
+        ("batch ask", "A?;:B?", "1;2"),
+        ("ask", "A?", "1"),
+        ("write", "A 5", None),
+        ("batch write", "A 5", None),
+    ]
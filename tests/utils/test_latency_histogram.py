@@ -0,0 +1,55 @@
+import math
+
+import numpy as np
+import pytest
+
+from qcodes.utils import LatencyHistogram
+
+
+def test_latency_histogram_statistics() -> None:
+    histogram = LatencyHistogram()
+    assert histogram.count == 0
+    assert math.isnan(histogram.mean)
+    assert math.isnan(histogram.percentile(50))
+
+    values = np.geomspace(1e-5, 1e-1, 1001)
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.count == len(values)
+    assert histogram.total == pytest.approx(values.sum())
+    assert histogram.mean == pytest.approx(values.mean())
+    assert histogram.min == values.min()
+    assert histogram.max == values.max()
+    # the percentiles are accurate to the width of a bin
+    # which is 10**(1/20) ~ 12 % with the default settings
+    for percentile in (10, 50, 90, 99):
+        expected = np.percentile(values, percentile)
+        assert expected <= histogram.percentile(percentile) <= expected * 10 ** (
+            1 / 20
+        ) * 1.01
+    assert histogram.percentile(100) == values.max()
+
+    summary = histogram.summary()
+    assert summary["count"] == len(values)
+    assert summary["p50"] == histogram.percentile(50)
+
+    histogram.reset()
+    assert histogram.count == 0
+
+
+def test_latency_histogram_out_of_range() -> None:
+    histogram = LatencyHistogram(min_value=1e-3, max_value=1)
+    histogram.record(0)
+    histogram.record(1e-6)
+    histogram.record(100)
+    assert histogram.count == 3
+    assert histogram.max == 100
+    assert histogram.percentile(50) <= 1e-3 * 10 ** (1 / 20)
+
+
+def test_latency_histogram_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="min_value < max_value"):
+        LatencyHistogram(min_value=1, max_value=0.1)
+    with pytest.raises(ValueError, match="between 0 and 100"):
+        LatencyHistogram().percentile(101)
@@ -5,6 +5,7 @@ import pytest
 from hypothesis import given
 from hypothesis.extra.numpy import complex_number_dtypes
 
+from qcodes.parameters import Parameter
 from qcodes.utils.types import (
     concrete_complex_types,
     numpy_concrete_ints,
@@ -191,6 +192,48 @@ def test_shape_defered() -> None:
         m.validate(v2)
 
 
+def test_shape_from_parameter_uses_cache() -> None:
+    n_gets = 0
+
+    def get_npts() -> int:
+        nonlocal n_gets
+        n_gets += 1
+        return npts.cache.raw_value
+
+    npts = Parameter("npts", get_cmd=get_npts, set_cmd=None, initial_cache_value=2)
+    m = Arrays(shape=(npts,))
+
+    for _ in range(5):
+        m.validate(np.array([1, 2]))
+    assert n_gets == 0
+
+    npts.set(3)
+    with pytest.raises(ValueError, match="does not have expected shape"):
+        m.validate(np.array([1, 2]))
+    m.validate(np.array([1, 2, 3]))
+    assert n_gets == 0
+
+    npts.cache.invalidate()
+    assert m.shape == (3,)
+    assert n_gets == 1
+
+
+def test_shape_from_non_settable_parameter_is_gotten() -> None:
+    n_gets = 0
+
+    def get_npts() -> int:
+        nonlocal n_gets
+        n_gets += 1
+        return 2
+
+    npts = Parameter("npts", get_cmd=get_npts, set_cmd=False)
+    m = Arrays(shape=(npts,))
+
+    m.validate(np.array([1, 2]))
+    m.validate(np.array([1, 2]))
+    assert n_gets == 2
+
+
 def test_valid_values_with_shape() -> None:
     val = Arrays(min_value=-5, max_value=50, shape=(2, 2))
     for vval in val.valid_values: